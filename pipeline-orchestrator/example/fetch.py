@@ -15,7 +15,8 @@ def run(conn, **kwargs) -> None:
 
     Args:
         conn:    Database connection from get_connection()
-        **kwargs: Any extra arguments passed via the CLI or _run_tool()
+        **kwargs: Any extra arguments passed via the CLI or _run_tool(),
+                  plus pool — the orchestrator's ConnectionPool
     """
     print("  Fetching data from source...")
 
@@ -30,14 +31,13 @@ def run(conn, **kwargs) -> None:
     # response = httpx.get("https://api.example.com/items")
     # items = response.json()["items"]
 
-    # Example: insert into DB
-    # with conn.cursor() as cur:
+    # Example: insert into DB in batches (one round-trip per 1,000 rows)
+    # from orchestrator import BatchWriter
+    # with BatchWriter(
+    #     conn, "INSERT INTO raw_items (id, data) VALUES %s ON CONFLICT DO NOTHING"
+    # ) as writer:
     #     for item in items:
-    #         cur.execute(
-    #             "INSERT INTO raw_items (id, data) VALUES (%s, %s) ON CONFLICT DO NOTHING",
-    #             (item["id"], json.dumps(item))
-    #         )
-    # conn.commit()
-    # print(f"  Stored {len(items)} items")
+    #         writer.add((item["id"], json.dumps(item)))
+    # print(f"  Stored {writer.written} items")
 
     print("  fetch: replace this with your ingestion logic")
@@ -4,26 +4,57 @@ Example tool: parse
 Reads raw data from the database, transforms it into structured records,
 and writes the results back. Runs after fetch.
 
+This is a partitioned tool: instead of run(), it splits the raw rows into
+id ranges with partitions() and parses one range per run_partition() call.
+The orchestrator runs the ranges side by side and, after a failure, only
+re-runs the ones that didn't finish.
+
 This module is registered in TOOL_MAP as "parse" and belongs
 to the "process" and "full" stage groups.
 """
 
+CHUNK_SIZE = 100_000   # Raw rows per partition
+
 
-def run(conn, **kwargs) -> None:
+def partitions(conn, **kwargs) -> list:
     """
-    Parse and transform raw data into structured records.
+    Split the raw rows into id ranges, one partition each.
 
     Args:
         conn:    Database connection from get_connection()
-        **kwargs: Any extra arguments passed via the CLI or _run_tool()
+        **kwargs: Any extra arguments passed via the CLI or _run_tool(),
+                  plus pool — the orchestrator's ConnectionPool
+
+    Returns:
+        The first id of every range — small, JSON-serialisable values
     """
-    print("  Parsing raw data...")
+    max_id = 0
 
-    # Example: read unparsed rows from DB
+    # Example: find how far the raw ids go
     # with conn.cursor() as cur:
-    #     cur.execute("SELECT id, data FROM raw_items WHERE parsed_at IS NULL")
+    #     cur.execute("SELECT COALESCE(MAX(id), 0) FROM raw_items WHERE parsed_at IS NULL")
+    #     max_id = cur.fetchone()[0]
+
+    return list(range(0, max_id + 1, CHUNK_SIZE))
+
+
+def run_partition(conn, start: int, **kwargs) -> None:
+    """
+    Parse and transform one range of raw data into structured records.
+
+    Args:
+        conn:    A connection of this partition's own
+        start:   First id of the range, from partitions()
+        **kwargs: Any extra arguments passed via the CLI or _run_tool(),
+                  plus pool — the orchestrator's ConnectionPool
+    """
+    # Example: read unparsed rows in this range from DB
+    # with conn.cursor() as cur:
+    #     cur.execute(
+    #         "SELECT id, data FROM raw_items WHERE id >= %s AND id < %s AND parsed_at IS NULL",
+    #         (start, start + CHUNK_SIZE),
+    #     )
     #     rows = cur.fetchall()
-    # print(f"  Found {len(rows)} unparsed items")
 
     # Example: parse each row
     # parsed = []
@@ -36,19 +67,18 @@ def run(conn, **kwargs) -> None:
     #         "tags":  [t.lower() for t in raw.get("tags", [])],
     #     })
 
-    # Example: write structured records
-    # with conn.cursor() as cur:
-    #     for item in parsed:
-    #         cur.execute("""
-    #             INSERT INTO items (id, name, price, tags)
-    #             VALUES (%s, %s, %s, %s)
-    #             ON CONFLICT (id) DO UPDATE SET
-    #                 name = EXCLUDED.name,
-    #                 price = EXCLUDED.price,
-    #                 tags = EXCLUDED.tags,
-    #                 parsed_at = NOW()
-    #         """, (item["id"], item["name"], item["price"], item["tags"]))
-    # conn.commit()
-    # print(f"  Parsed and stored {len(parsed)} items")
-
-    print("  parse: replace this with your transformation logic")
+    # Example: write structured records as bulk upserts
+    # from orchestrator import BatchWriter
+    # writer = BatchWriter(conn, """
+    #     INSERT INTO items (id, name, price, tags)
+    #     VALUES %s
+    #     ON CONFLICT (id) DO UPDATE SET
+    #         name = EXCLUDED.name,
+    #         price = EXCLUDED.price,
+    #         tags = EXCLUDED.tags,
+    #         parsed_at = NOW()
+    # """, batch_size=5000)
+    # writer.add_many((item["id"], item["name"], item["price"], item["tags"]) for item in parsed)
+    # the rest is flushed when run_partition() returns
+
+    print(f"  parse: ids {start:,}–{start + CHUNK_SIZE - 1:,}: replace this with your transformation logic")
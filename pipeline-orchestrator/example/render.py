@@ -14,6 +14,11 @@ from pathlib import Path
 
 OUTPUT_DIR = Path("output")
 
+# Declare what this tool reads and writes so the orchestrator can skip it
+# when none of it has changed (see "Incremental runs" in orchestrator.py)
+# INPUTS = {"tables": ["items"]}
+# OUTPUTS = {"files": ["output/items.json", "output/report.html"]}
+
 
 def run(conn, **kwargs) -> None:
     """
@@ -21,7 +26,8 @@ def run(conn, **kwargs) -> None:
 
     Args:
         conn:    Database connection from get_connection()
-        **kwargs: Any extra arguments passed via the CLI or _run_tool()
+        **kwargs: Any extra arguments passed via the CLI or _run_tool(),
+                  plus pool — the orchestrator's ConnectionPool
     """
     print("  Rendering output...")
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
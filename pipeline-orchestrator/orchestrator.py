@@ -10,25 +10,63 @@ Usage:
     python orchestrator.py ingest           # Run a single stage
     python orchestrator.py fetch parse      # Run specific tools in order
     python orchestrator.py analyze render   # Run a stage group
+    python orchestrator.py --parallel 4     # Run independent tools side by side
+    python orchestrator.py -j 4 --executor process   # ...each in its own process
+    python orchestrator.py --force          # Re-run tools whose inputs haven't changed
+    python orchestrator.py parse --workers 8   # Run 8 partitions of a partitioned tool at once
     python orchestrator.py --list           # Show available stages and tools
 
 Setup:
     1. Copy this file into your project root
     2. Register your tools in TOOL_MAP below (module path → tool name)
-    3. Define your stage groups in STAGES below
-    4. Each tool module must expose: def run(conn, **kwargs) -> None
-    5. Update get_connection() to return your database connection
+    3. Declare which tools need which in DEPENDENCIES below
+    4. Define your stage groups in STAGES below
+    5. Optionally mark CPU-heavy tools for worker processes in TOOL_EXECUTORS
+    6. Each tool module must expose: def run(conn, **kwargs) -> None
+       (or, to split a large job: partitions(conn, **kwargs) and run_partition(conn, part, **kwargs))
+    7. Update get_connection() to return your database connection
+
+Tools can write rows in bulk with BatchWriter:
+    from orchestrator import BatchWriter
+
+    def run(conn, **kwargs):
+        with BatchWriter(conn, "INSERT INTO items (id, name) VALUES (%s, %s)") as writer:
+            for item in items:
+                writer.add((item["id"], item["name"]))
 """
 
 import argparse
+import atexit
+import glob
+import hashlib
 import importlib
+import json
+import multiprocessing
+import os
+import re
 import sys
+import threading
 import time
+import traceback
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
 
 # Ensure project root is on the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# Tools `import orchestrator` for BatchWriter; when this file is the running
+# script, hand them this module rather than a second copy of it
+sys.modules.setdefault("orchestrator", sys.modules[__name__])
+
 
 # ---------------------------------------------------------------------------
 # Database connection
@@ -39,6 +77,10 @@ def get_connection():
     Return a database connection.
     Replace this with your actual connection logic.
 
+    This is the connection factory for every backend. Connections are
+    opened through a ConnectionPool and reused between tools: one pool in
+    the main process, and one in each worker process for process tools.
+
     Examples:
         PostgreSQL:  import psycopg2; return psycopg2.connect(os.environ["DATABASE_URL"])
         SQLite:      import sqlite3; return sqlite3.connect("data.db")
@@ -50,6 +92,160 @@ def get_connection():
     )
 
 
+# ---------------------------------------------------------------------------
+# Connection pool and bulk writes
+# ---------------------------------------------------------------------------
+
+POOL_SIZE = 4                # Idle connections kept open per process for reuse
+BATCH_SIZE = 1000            # Rows per BatchWriter flush
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of connections from a factory (get_connection by
+    default). Connections are opened on demand and, when handed back, kept
+    open for reuse — up to `size` of them; any beyond that are closed.
+    Checking out never blocks, so a tool can take extra connections for
+    its own threads without deadlocking.
+
+    The orchestrator passes its pool to every tool as the `pool` keyword:
+
+        def run(conn, pool=None, **kwargs):
+            with pool.connection() as other:
+                ...
+
+    Args:
+        factory:  Callable returning a new connection (default: get_connection)
+        size:     Idle connections kept open (default POOL_SIZE)
+    """
+
+    def __init__(self, factory: Optional[Callable] = None, size: int = POOL_SIZE):
+        self.factory = factory or get_connection
+        self.size = size
+        self._idle = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(self) -> Iterator:
+        """Check out a connection; it goes back to the pool when the block exits."""
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            conn = self.factory()
+        try:
+            yield conn
+        except BaseException:
+            # Don't hand the next tool a half-finished transaction
+            if hasattr(conn, "rollback"):
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            raise
+        finally:
+            with self._lock:
+                keep = len(self._idle) < self.size
+                if keep:
+                    self._idle.append(conn)
+            if not keep and hasattr(conn, "close"):
+                conn.close()
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            if hasattr(conn, "close"):
+                conn.close()
+
+
+# Writers created by the tool running on this thread — flushed when it returns
+_tool_writers = threading.local()
+
+_EXECUTE_VALUES_SQL = re.compile(r"\bVALUES\s+%s(?!\s*,)", re.IGNORECASE)
+
+
+class BatchWriter:
+    """
+    Buffers rows and writes them in bulk — one round-trip per batch instead
+    of one cur.execute() per row.
+
+    On psycopg2, statements written with a single `VALUES %s` placeholder
+    are sent with psycopg2.extras.execute_values (multi-row VALUES lists,
+    the fastest upsert path). Everything else goes through
+    cursor.executemany() with the driver's own placeholders. Each flush
+    commits, so a long ingest doesn't build one huge transaction.
+
+    Rows still buffered when a tool's run() returns are flushed by the
+    orchestrator. If run() raises, they are dropped. Use it as a context
+    manager to flush at the end of the block instead.
+
+    Usage:
+        with BatchWriter(conn, "INSERT INTO items (id, name) VALUES %s "
+                               "ON CONFLICT (id) DO UPDATE SET name = EXCLUDED.name") as writer:
+            for item in parsed:
+                writer.add((item["id"], item["name"]))
+
+    Args:
+        conn:        Connection to write to
+        sql:         INSERT/UPSERT statement (see above for placeholders)
+        batch_size:  Rows per flush (default BATCH_SIZE)
+        commit:      Commit after each flush (default True)
+    """
+
+    def __init__(self, conn, sql: str, batch_size: int = BATCH_SIZE, commit: bool = True):
+        self.conn = conn
+        self.sql = sql
+        self.batch_size = max(1, batch_size)
+        self.commit = commit
+        self.rows = []
+        self.written = 0
+        self._execute_values = None
+        if type(conn).__module__.startswith("psycopg2") and _EXECUTE_VALUES_SQL.search(sql):
+            from psycopg2.extras import execute_values
+            self._execute_values = execute_values
+        writers = getattr(_tool_writers, "writers", None)
+        if writers is not None:
+            writers.append(self)
+
+    def __enter__(self) -> "BatchWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            self.rows = []
+
+    def add(self, row) -> None:
+        """Buffer one row (a tuple, or a dict for named placeholders)."""
+        self.rows.append(row)
+        if len(self.rows) >= self.batch_size:
+            self.flush()
+
+    def add_many(self, rows: Iterable) -> None:
+        """Buffer several rows, flushing whenever a batch fills up."""
+        for row in rows:
+            self.add(row)
+
+    def flush(self) -> None:
+        """Write the buffered rows now."""
+        if not self.rows:
+            return
+        cursor = self.conn.cursor()
+        try:
+            if self._execute_values is not None:
+                self._execute_values(cursor, self.sql, self.rows, page_size=len(self.rows))
+            else:
+                cursor.executemany(self.sql, self.rows)
+        finally:
+            cursor.close()
+        if self.commit:
+            self.conn.commit()
+        self.written += len(self.rows)
+        self.rows = []
+
+
 # ---------------------------------------------------------------------------
 # Tool registry
 # ---------------------------------------------------------------------------
@@ -73,10 +269,27 @@ TOOL_MAP = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Tool dependencies
+# ---------------------------------------------------------------------------
+# Maps a tool to the tools that must finish before it starts. Together they
+# form a DAG: tools with no path between them are independent and can run at
+# the same time with --parallel N. Dependencies only order the tools being
+# run — `python orchestrator.py render` doesn't pull in parse.
+
+DEPENDENCIES = {
+    "parse":     ["fetch"],
+    "render":    ["parse"],
+    # Add your dependencies here:
+    # "my_tool": ["fetch", "parse"],
+}
+
+
 # ---------------------------------------------------------------------------
 # Stage groups
 # ---------------------------------------------------------------------------
-# Stages are named groups of tools that run in sequence.
+# Stages are named groups of tools. They run in the order listed, except
+# that a tool always runs after the tools it depends on.
 # "full" is the default and runs everything.
 
 STAGES = {
@@ -87,12 +300,279 @@ STAGES = {
 }
 
 
+# ---------------------------------------------------------------------------
+# Execution backends
+# ---------------------------------------------------------------------------
+# With --parallel, each tool runs on a thread or in a worker process.
+# Without it, thread tools run in the main thread and process tools still
+# go to a worker process, one at a time. Threads suit tools that wait on
+# the network or the database. CPU-heavy Python (parsing, transforming)
+# is limited to one core by the GIL in a thread; in a process it gets a
+# core of its own. Process tools must be importable by module path and
+# take picklable kwargs.
+
+EXECUTOR = "thread"          # Default backend: "thread" or "process" (--executor overrides)
+
+TOOL_EXECUTORS = {
+    # Per-tool overrides:
+    # "parse": "process",
+}
+
+
+# ---------------------------------------------------------------------------
+# Incremental runs
+# ---------------------------------------------------------------------------
+# A tool module may declare what it reads and writes:
+#
+#   INPUTS = {
+#       "files":  ["data/input.csv", "data/raw/*.json"],   # paths or globs
+#       "tables": ["raw_items"],                           # or {"raw_items": "SELECT ..."}
+#       "params": ["since"],                               # kwargs that change the result
+#   }
+#   OUTPUTS = {"files": ["output/report.html"], "tables": ["items"]}
+#
+# After it succeeds, fingerprints of these and a hash of the module's source
+# are saved in STATE_FILE. The next run skips the tool if its code, inputs
+# and outputs all still match and none of its dependencies has run since
+# (in this run or a later one). Tools without INPUTS always run; --force
+# runs everything.
+#
+# Files are fingerprinted by size and modification time. Tables use
+# TABLE_FINGERPRINT_SQL, or the query given for that table — make it cover
+# updates too if rows change in place, e.g. "SELECT COUNT(*), MAX(updated_at) FROM items".
+
+STATE_FILE = Path(__file__).parent / ".pipeline-state.json"
+TABLE_FINGERPRINT_SQL = "SELECT COUNT(*) FROM {table}"
+
+
+def _fingerprint(spec: dict, conn, kwargs: dict) -> dict:
+    """Fingerprint of every file, table and param an INPUTS/OUTPUTS spec names."""
+    result = {}
+    for pattern in spec.get("files", []):
+        paths = sorted(glob.glob(pattern, recursive=True)) or [pattern]
+        for path in paths:
+            try:
+                stat = os.stat(path)
+                result[f"file:{path}"] = f"{stat.st_size}:{stat.st_mtime_ns}"
+            except OSError:
+                result[f"file:{path}"] = "missing"
+
+    tables = spec.get("tables", [])
+    if not isinstance(tables, dict):
+        tables = {table: TABLE_FINGERPRINT_SQL.format(table=table) for table in tables}
+    for table, sql in tables.items():
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(sql)
+                rows = cursor.fetchall()
+            finally:
+                cursor.close()
+            result[f"table:{table}"] = hashlib.sha256(repr(rows).encode()).hexdigest()[:16]
+        except Exception as e:
+            if hasattr(conn, "rollback"):
+                conn.rollback()   # Postgres refuses further queries after an error
+            result[f"table:{table}"] = f"error: {type(e).__name__}"
+
+    for param in spec.get("params", []):
+        result[f"param:{param}"] = repr(kwargs.get(param))
+    return result
+
+
+def _code_hash(module) -> str:
+    source = Path(module.__file__).read_bytes() if getattr(module, "__file__", None) else b""
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+class _RunState:
+    """Per-tool fingerprints from the last successful runs, kept in STATE_FILE."""
+
+    def __init__(self, path: Path = STATE_FILE, force: bool = False):
+        self.path = path
+        self.force = force
+        self._lock = threading.Lock()
+        try:
+            self.tools = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.tools = {}
+
+    def plan(self, name: str, conn, kwargs: dict, dependency_ran: bool) -> Optional[dict]:
+        """
+        Decide whether a tool must run. Returns None to skip it, else what
+        to record once it succeeds (pass that to finish()).
+        """
+        module = importlib.import_module(TOOL_MAP[name])
+        inputs = getattr(module, "INPUTS", None)
+        if inputs is None:
+            return {}
+        record = {
+            "code": _code_hash(module),
+            "inputs": _fingerprint(inputs, conn, kwargs),
+            "outputs_spec": getattr(module, "OUTPUTS", {}),
+        }
+        with self._lock:
+            previous = self.tools.get(name)
+
+        if self.force:
+            reason = "--force"
+        elif previous is None or "code" not in previous:
+            reason = "no previous run"
+        elif dependency_ran or any(
+            self.tools.get(dep, {}).get("finished_at", "") > previous["finished_at"]
+            for dep in DEPENDENCIES.get(name, [])
+        ):
+            reason = "a dependency ran"
+        elif previous["code"] != record["code"]:
+            reason = "code changed"
+        elif previous["inputs"] != record["inputs"]:
+            changed = sorted(
+                key for key in record["inputs"].keys() | previous["inputs"].keys()
+                if record["inputs"].get(key) != previous["inputs"].get(key)
+            )
+            reason = f"changed: {', '.join(changed)}"
+        elif previous["outputs"] != _fingerprint(record["outputs_spec"], conn, kwargs):
+            reason = "outputs changed since the last run"
+        else:
+            print(f"\n  {name}: up to date, skipped")
+            return None
+        print(f"\n  {name}: running ({reason})")
+        return record
+
+    def finish(self, name: str, conn, record: dict, kwargs: dict) -> None:
+        """Store a successful run's fingerprints (just its time, for tools without INPUTS)."""
+        entry = {"finished_at": datetime.now().isoformat()}
+        if record:
+            entry.update(
+                code=record["code"],
+                inputs=record["inputs"],
+                outputs=_fingerprint(record["outputs_spec"], conn, kwargs),
+            )
+        with self._lock:
+            self.tools[name] = entry
+            temp = self.path.with_name(self.path.name + ".tmp")
+            temp.write_text(json.dumps(self.tools, indent=2), encoding="utf-8")
+            os.replace(temp, self.path)
+
+
+# ---------------------------------------------------------------------------
+# Partitioned tools
+# ---------------------------------------------------------------------------
+# Instead of run(), a tool working through a large dataset may expose:
+#
+#   def partitions(conn, **kwargs) -> list            # e.g. first ids of 100k-row ranges
+#   def run_partition(conn, part, **kwargs) -> None   # process one of them
+#
+# Partitions run side by side on PARTITION_WORKERS threads, or worker
+# processes if the tool's executor is "process"; each gets a connection of
+# its own. A failed partition doesn't stop the others. Finished partitions
+# are logged in PARTITION_DIR as they complete, so after a failure or a
+# crash the next run only does the failed and missing ones (--force starts
+# over). Partitions must be JSON-serialisable, and picklable for processes.
+
+PARTITION_WORKERS = None     # Partitions at once (--workers overrides); None: one per CPU
+PARTITION_DIR = Path(__file__).parent / ".pipeline-partitions"
+
+
+def _is_partitioned(module) -> bool:
+    return hasattr(module, "partitions") and hasattr(module, "run_partition")
+
+
+def _partition_key(part) -> str:
+    return json.dumps(part, sort_keys=True, default=str)
+
+
+class _PartitionLog:
+    """Append-only record of a tool's finished partitions, one JSON line each."""
+
+    def __init__(self, name: str, resume: bool = True, directory: Path = PARTITION_DIR):
+        self.path = directory / f"{name}.jsonl"
+        self.done = set()
+        self._lock = threading.Lock()
+        self._file = None
+        if not resume:
+            self.clear()
+            return
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue   # Cut short by a crash
+            if entry.get("status") == "done":
+                self.done.add(entry["partition"])
+            else:
+                self.done.discard(entry["partition"])
+
+    def record(self, key: str, status: str, error: str = "") -> None:
+        entry = {"partition": key, "status": status, "at": datetime.now().isoformat()}
+        if error:
+            entry["error"] = error
+        with self._lock:
+            if self._file is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                # Line-buffered, so a crash still leaves every finished partition on disk
+                self._file = self.path.open("a", encoding="utf-8", buffering=1)
+            self._file.write(json.dumps(entry) + "\n")
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def clear(self) -> None:
+        """Forget every partition — the tool finished, or is starting over."""
+        self.close()
+        self.done.clear()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
 # ---------------------------------------------------------------------------
 # Core runner
 # ---------------------------------------------------------------------------
 
-def _run_tool(name: str, conn, **kwargs) -> None:
-    """Import a tool module by name and call its run() function."""
+class ToolError(Exception):
+    """
+    A tool failed in a worker process. Carries the worker's formatted
+    traceback, since the original exception may not survive pickling.
+    """
+
+    def __init__(self, tool: str, message: str, details: str):
+        super().__init__(tool, message, details)
+        self.tool = tool
+        self.message = message
+        self.details = details
+
+    def __str__(self) -> str:
+        return self.message
+
+
+def _run_tool(
+    name: str,
+    conn,
+    executor: Optional[str] = None,
+    workers: Optional[int] = None,
+    resume: bool = True,
+    **kwargs,
+) -> None:
+    """
+    Import a tool module by name and call its run() function — or, for a
+    partitioned tool, fan its partitions out with _run_partitioned().
+
+    Args:
+        name:      Tool name from TOOL_MAP
+        conn:      Connection for run() / partitions()
+        executor:  Backend for partitions (default: the tool's, per TOOL_EXECUTORS)
+        workers:   Partitions at once (default: PARTITION_WORKERS)
+        resume:    Skip partitions an earlier, failed run already finished
+        **kwargs:  Passed on to the tool
+    """
     if name not in TOOL_MAP:
         print(f"\nUnknown tool: {name}")
         print(f"Available tools: {', '.join(sorted(TOOL_MAP.keys()))}")
@@ -105,17 +585,187 @@ def _run_tool(name: str, conn, **kwargs) -> None:
 
     module = importlib.import_module(module_path)
 
-    if not hasattr(module, "run"):
+    if not hasattr(module, "run") and not _is_partitioned(module):
         print(f"Error: {module_path} has no run() function.")
         print("Each tool module must expose: def run(conn, **kwargs) -> None")
+        print("(or partitions(conn, **kwargs) and run_partition(conn, part, **kwargs))")
         sys.exit(1)
 
     start = time.time()
-    module.run(conn, **kwargs)
+    if _is_partitioned(module):
+        _run_partitioned(name, module, conn, executor or _tool_executor(name, EXECUTOR), workers, resume, **kwargs)
+    else:
+        _call_tool(module.run, conn, **kwargs)
     elapsed = time.time() - start
     print(f"  Done ({elapsed:.1f}s)")
 
 
+def _call_tool(function: Callable, *args, **kwargs) -> None:
+    """Call run() or run_partition(), then flush the BatchWriters it left buffered."""
+    _tool_writers.writers = []
+    try:
+        function(*args, **kwargs)
+        for writer in _tool_writers.writers:
+            writer.flush()
+    finally:
+        _tool_writers.writers = None
+
+
+def _run_partitioned(
+    name: str,
+    module,
+    conn,
+    executor: str,
+    workers: Optional[int],
+    resume: bool,
+    **kwargs,
+) -> None:
+    """
+    Run every partition of a partitioned tool that isn't logged as done,
+    `workers` at a time. Raises ToolError naming the failed partitions once
+    the rest have finished; the log is cleared when all have succeeded.
+    """
+    pool = kwargs.pop("pool", None)
+    parts = list(module.partitions(conn, pool=pool, **kwargs))
+    log = _PartitionLog(name, resume)
+    todo = {}   # key → partition
+    for part in parts:
+        key = _partition_key(part)
+        if key not in log.done:
+            todo[key] = part
+    if len(todo) < len(parts):
+        print(f"  Resuming: {len(parts) - len(todo):,} of {len(parts):,} partitions already done")
+    if not todo:
+        log.clear()
+        return
+
+    workers = min(workers or PARTITION_WORKERS or os.cpu_count() or 1, len(todo))
+    backend = "worker processes" if executor == "process" else "threads"
+    print(f"  {len(todo):,} partitions, {workers} at a time ({backend})")
+    owned_pool = pool is None and executor != "process"
+    if owned_pool:
+        pool = ConnectionPool(size=workers)
+    # Partition threads prefix their lines through a _ToolOutput (already in place with --parallel)
+    output = None
+    if executor != "process" and not isinstance(sys.stdout, _ToolOutput):
+        output = sys.stdout = _ToolOutput(sys.stdout)
+    if executor == "process":
+        runner = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        futures = {runner.submit(_run_partition_in_process, name, part, kwargs): key for key, part in todo.items()}
+    else:
+        runner = ThreadPoolExecutor(max_workers=workers)
+        futures = {runner.submit(_run_partition, name, part, pool, kwargs): key for key, part in todo.items()}
+
+    failed = []
+    step = max(1, len(todo) // 20)
+    try:
+        for count, future in enumerate(as_completed(futures), 1):
+            key = futures[future]
+            try:
+                future.result()
+            except ToolError as e:
+                failed.append(key)
+                log.record(key, "failed", e.message)
+                print(f"  Partition {key} failed:\n{e.details}")
+            except Exception as e:
+                failed.append(key)
+                log.record(key, "failed", f"{type(e).__name__}: {e}")
+                details = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+                print(f"  Partition {key} failed:\n{details}")
+            else:
+                log.record(key, "done")
+            if count % step == 0 or count == len(todo):
+                print(f"  {count:,}/{len(todo):,} partitions finished ({len(failed):,} failed)")
+    finally:
+        runner.shutdown(cancel_futures=True)
+        if output is not None:
+            output.finish()
+            sys.stdout = output._stream
+        log.close()
+        if owned_pool:
+            pool.close()
+
+    if failed:
+        raise ToolError(
+            name,
+            f"{len(failed):,} of {len(parts):,} partitions failed — run it again to retry just those",
+            f"Failed partitions: {', '.join(failed[:20])}{' …' if len(failed) > 20 else ''}",
+        )
+    log.clear()
+
+
+def _run_partition(name: str, part, pool: ConnectionPool, kwargs: dict) -> None:
+    """
+    Run one partition on a connection of its own from the pool. Its output
+    is prefixed with the tool and partition, e.g. "[parse:300000] ...".
+    """
+    module = importlib.import_module(TOOL_MAP[name])
+    output = sys.stdout if isinstance(sys.stdout, _ToolOutput) else None
+    if output is not None:
+        output.start(f"{name}:{_partition_key(part)}")
+    try:
+        with pool.connection() as conn:
+            _call_tool(module.run_partition, conn, part, pool=pool, **kwargs)
+    finally:
+        if output is not None:
+            output.finish()
+
+
+def _run_partition_in_process(name: str, part, kwargs: dict) -> None:
+    """Worker-process entry point: run one partition on the worker's own connection."""
+    output = _ToolOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        _run_partition(name, part, _process_pool(), kwargs)
+    except Exception as e:
+        raise ToolError(name, f"{type(e).__name__}: {e}", traceback.format_exc()) from None
+    finally:
+        sys.stdout = output._stream
+        sys.stdout.flush()
+
+
+def _run_tool_pooled(name: str, pool: ConnectionPool, **kwargs) -> None:
+    """Run a tool on a connection of its own from the pool — connections aren't shared across threads."""
+    with pool.connection() as conn:
+        _run_tool(name, conn, pool=pool, **kwargs)
+
+
+_worker_pool: Optional[ConnectionPool] = None
+
+
+def _process_pool() -> ConnectionPool:
+    """This worker process's ConnectionPool, reused by every tool it runs."""
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = ConnectionPool()
+        atexit.register(_worker_pool.close)
+    return _worker_pool
+
+
+def _run_tool_in_process(name: str, kwargs: dict) -> None:
+    """Worker-process entry point: run a tool on the worker's own connection."""
+    output = _ToolOutput(sys.stdout)
+    sys.stdout = output
+    output.start(name)
+    try:
+        _run_tool_pooled(name, _process_pool(), **kwargs)
+    except (Exception, SystemExit) as e:   # SystemExit: no run() in the module
+        raise ToolError(name, f"{type(e).__name__}: {e}", traceback.format_exc()) from None
+    finally:
+        output.finish()
+        sys.stdout = output._stream
+        sys.stdout.flush()
+
+
+def _tool_executor(name: str, default: str) -> str:
+    """Backend a tool runs on with --parallel: "thread" or "process"."""
+    executor = TOOL_EXECUTORS.get(name, default)
+    if executor not in ("thread", "process"):
+        print(f"\nUnknown executor for {name}: {executor!r} (use \"thread\" or \"process\")")
+        sys.exit(1)
+    return executor
+
+
 def _list_tools() -> None:
     """Print available stages and tools."""
     print("\nStage groups:")
@@ -123,6 +773,14 @@ def _list_tools() -> None:
         print(f"  {stage:<15} → {', '.join(tools)}")
     print(f"\nIndividual tools:")
     print(f"  {', '.join(sorted(TOOL_MAP.keys()))}")
+    if DEPENDENCIES:
+        print("\nDependencies:")
+        for tool, needs in DEPENDENCIES.items():
+            print(f"  {tool:<15} ← {', '.join(needs)}")
+    processes = [tool for tool in TOOL_MAP if _tool_executor(tool, EXECUTOR) == "process"]
+    if processes:
+        print("\nWorker processes:")
+        print(f"  {', '.join(processes)}")
 
 
 def _resolve_targets(targets: list[str]) -> list[str]:
@@ -144,6 +802,204 @@ def _resolve_targets(targets: list[str]) -> list[str]:
     return unique
 
 
+def _check_tools(tools: list[str]) -> None:
+    """Exit with a message if any tool or dependency isn't in TOOL_MAP."""
+    for name in tools + [dep for needs in DEPENDENCIES.values() for dep in needs]:
+        if name not in TOOL_MAP:
+            print(f"\nUnknown tool: {name}")
+            print(f"Available tools: {', '.join(sorted(TOOL_MAP.keys()))}")
+            sys.exit(1)
+
+
+def _build_graph(tools: list[str]) -> dict[str, list[str]]:
+    """Dependencies of each tool, limited to the tools being run."""
+    selected = set(tools)
+    return {name: [dep for dep in DEPENDENCIES.get(name, []) if dep in selected] for name in tools}
+
+
+def _execution_order(tools: list[str], graph: dict[str, list[str]]) -> list[str]:
+    """
+    Topological order of the tools that stays as close as possible to the
+    order they were given in. Exits with a message if the graph has a cycle.
+    """
+    waiting = {name: set(graph[name]) for name in tools}
+    order = []
+    while waiting:
+        ready = [name for name in tools if name in waiting and not waiting[name]]
+        if not ready:
+            print(f"\nDependency cycle between: {', '.join(sorted(waiting))}")
+            print("Check DEPENDENCIES in orchestrator.py.")
+            sys.exit(1)
+        name = ready[0]
+        order.append(name)
+        del waiting[name]
+        for needs in waiting.values():
+            needs.discard(name)
+    return order
+
+
+# ---------------------------------------------------------------------------
+# Parallel scheduler
+# ---------------------------------------------------------------------------
+
+class _ToolOutput:
+    """
+    Stands in for sys.stdout while tools or partitions run in threads: each
+    line one prints is prefixed with its name ("[parse]", "[parse:300000]"),
+    and every thread's output is written a whole line at a time, so
+    interleaved output stays readable.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start(self, name: str) -> None:
+        self._local.name, self._local.buffer = name, ""
+
+    def finish(self) -> None:
+        if getattr(self._local, "buffer", ""):
+            self.write("\n")
+        self._local.name = None
+
+    def write(self, text: str) -> int:
+        # Whole lines only, so no thread's output lands mid-way through another's
+        name = getattr(self._local, "name", None)
+        prefix = "" if name is None else f"[{name}] "
+        *lines, self._local.buffer = (getattr(self._local, "buffer", "") + text).split("\n")
+        if lines:
+            with self._lock:
+                self._stream.write("".join(f"{prefix}{line}\n" for line in lines))
+        return len(text)
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+
+def _run_parallel(
+    order: list[str],
+    graph: dict[str, list[str]],
+    parallel: int,
+    executor: str = EXECUTOR,
+    pool: Optional[ConnectionPool] = None,
+    state: Optional[_RunState] = None,
+    workers: Optional[int] = None,
+    resume: bool = True,
+    **kwargs,
+) -> bool:
+    """
+    Run tools as soon as everything they depend on has finished, at most
+    `parallel` at a time — on a thread pool, or a pool of worker processes
+    for tools whose executor (TOOL_EXECUTORS, else `executor`) is "process".
+    Each tool gets a connection of its own from `pool` (from a pool in the
+    worker process, for process tools). With `state`, tools that are up to
+    date are skipped and count as finished straight away.
+
+    A partitioned tool is coordinated from a thread whatever its executor;
+    its partitions then run on `workers` threads or processes of their own.
+
+    A tool's exception is reported with its traceback, from a worker process
+    too. After a failure no new tools are started; running ones finish.
+    Returns True if every tool succeeded.
+    """
+    waiting = {name: set(graph[name]) for name in order}
+    running = {}   # future → tool name
+    failed = []
+    ran = set()
+    records = {}   # tool name → what state.finish() stores
+    output = _ToolOutput(sys.stdout)
+    backends = {name: _tool_executor(name, executor) for name in order}
+    coordinators = {
+        name: "thread" if _is_partitioned(importlib.import_module(TOOL_MAP[name])) else backend
+        for name, backend in backends.items()
+    }
+    pool = pool or ConnectionPool(size=parallel)
+
+    def run(name: str) -> None:
+        output.start(name)
+        try:
+            _run_tool_pooled(name, pool, executor=backends[name], workers=workers, resume=resume, **kwargs)
+        finally:
+            output.finish()
+
+    threads = ThreadPoolExecutor(max_workers=parallel)
+    processes = None
+    if "process" in coordinators.values():
+        # spawn: workers import tools fresh instead of inheriting threads and connections
+        processes = ProcessPoolExecutor(
+            max_workers=min(parallel, list(coordinators.values()).count("process")),
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def submit(name: str):
+        if coordinators[name] == "process":
+            return processes.submit(_run_tool_in_process, name, kwargs)
+        return threads.submit(run, name)
+
+    def mark_done(name: str) -> None:
+        for needs in waiting.values():
+            needs.discard(name)
+
+    def start_ready() -> None:
+        # A skipped tool can make others ready, so scan until nothing changes
+        scan = True
+        while scan and not failed:
+            scan = False
+            for name in order:
+                if len(running) >= parallel:
+                    return
+                if name not in waiting or waiting[name]:
+                    continue
+                del waiting[name]
+                if state is not None:
+                    with pool.connection() as conn:
+                        record = state.plan(name, conn, kwargs, any(dep in ran for dep in graph[name]))
+                    if record is None:
+                        mark_done(name)
+                        scan = True
+                        continue
+                    records[name] = record
+                running[submit(name)] = name
+
+    sys.stdout = output
+    try:
+        while True:
+            start_ready()
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                name = running.pop(future)
+                try:
+                    future.result()
+                except ToolError as e:
+                    failed.append(name)
+                    print(f"\n  {name} failed: {e}\n{e.details}")
+                except (Exception, SystemExit) as e:   # SystemExit: no run() in the module
+                    failed.append(name)
+                    details = "".join(traceback.format_exception(type(e), e, e.__traceback__))
+                    print(f"\n  {name} failed:\n{details}")
+                else:
+                    ran.add(name)
+                    if name in records:
+                        with pool.connection() as conn:
+                            state.finish(name, conn, records.pop(name), kwargs)
+                    mark_done(name)
+    finally:
+        output.finish()
+        sys.stdout = output._stream
+        threads.shutdown()
+        if processes is not None:
+            processes.shutdown()
+
+    if failed:
+        print(f"\nFailed: {', '.join(failed)}")
+        if waiting:
+            print(f"Not run: {', '.join(name for name in order if name in waiting)}")
+    return not failed
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -165,6 +1021,31 @@ def main() -> None:
         action="store_true",
         help="List available stages and tools",
     )
+    parser.add_argument(
+        "-j", "--parallel",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Run up to N independent tools at once (default: 1, one after another)",
+    )
+    parser.add_argument(
+        "--executor",
+        choices=["thread", "process"],
+        default=EXECUTOR,
+        help=f"Backend for tools not listed in TOOL_EXECUTORS (default: {EXECUTOR})",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every tool, even those whose inputs haven't changed",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PARTITION_WORKERS,
+        metavar="N",
+        help="Run up to N partitions of a partitioned tool at once (default: one per CPU)",
+    )
     args = parser.parse_args()
 
     if args.list:
@@ -172,22 +1053,64 @@ def main() -> None:
         return
 
     tools = _resolve_targets(args.targets)
+    _check_tools(tools)
+    graph = _build_graph(tools)
+    tools = _execution_order(tools, graph)
     print(f"\nPipeline: {' → '.join(tools)}")
-
-    conn = get_connection()
     total_start = time.time()
 
+    pool = ConnectionPool(size=max(POOL_SIZE, args.parallel))
+    state = _RunState(force=args.force)
+    processes = None
     try:
-        for tool_name in tools:
-            _run_tool(tool_name, conn)
+        if args.parallel > 1:
+            print(f"Running up to {args.parallel} tools at once")
+            if not _run_parallel(
+                tools, graph, args.parallel, args.executor, pool, state,
+                workers=args.workers, resume=not args.force,
+            ):
+                sys.exit(1)
+        else:
+            # One connection, shared by the tools in turn
+            ran = set()
+            with pool.connection() as conn:
+                for tool_name in tools:
+                    dependency_ran = any(dep in ran for dep in graph[tool_name])
+                    record = state.plan(tool_name, conn, {}, dependency_ran)
+                    if record is None:
+                        continue
+                    backend = _tool_executor(tool_name, args.executor)
+                    module = importlib.import_module(TOOL_MAP[tool_name])
+                    try:
+                        if backend == "process" and not _is_partitioned(module):
+                            # Same worker-process backend as with --parallel, one tool at a time
+                            if processes is None:
+                                processes = ProcessPoolExecutor(
+                                    max_workers=1, mp_context=multiprocessing.get_context("spawn")
+                                )
+                            processes.submit(_run_tool_in_process, tool_name, {}).result()
+                        else:
+                            _run_tool(
+                                tool_name, conn,
+                                executor=backend,
+                                workers=args.workers,
+                                resume=not args.force,
+                                pool=pool,
+                            )
+                    except ToolError as e:   # From a worker process, or failed partitions
+                        print(f"\n  {tool_name} failed: {e}\n{e.details}")
+                        sys.exit(1)
+                    ran.add(tool_name)
+                    state.finish(tool_name, conn, record, {})
 
     except KeyboardInterrupt:
         print("\n\nInterrupted.")
         sys.exit(1)
 
     finally:
-        if hasattr(conn, "close"):
-            conn.close()
+        if processes is not None:
+            processes.shutdown()
+        pool.close()
 
     total = time.time() - total_start
     print(f"\n{'─' * 50}")
@@ -9,7 +9,7 @@ Before running:
 
 import asyncio
 from pathlib import Path
-from scraper import scrape_sync, scrape_multiple, load_site_profile, html_exists, list_saved
+from scraper import scrape_sync, scrape_multiple, load_site_profile, pending_ids, list_saved
 
 
 URL_TEMPLATE = "https://example.com/items/{id}"
@@ -23,7 +23,7 @@ def example_single():
     result = scrape_sync("item-123", url_template=URL_TEMPLATE)
 
     if result.status == "success":
-        print(f"Success: {result.bytes:,} bytes saved to output/item-123.html")
+        print(f"Success: {result.bytes:,} bytes saved to output/")
     elif result.status == "removed":
         print(f"Item has been removed: {result.error_message}")
     else:
@@ -58,8 +58,8 @@ def example_with_profile():
 async def example_batch():
     item_ids = ["item-001", "item-002", "item-003", "item-004", "item-005"]
 
-    # Skip items we've already scraped
-    pending = [id for id in item_ids if not html_exists(id)]
+    # Skip items already scraped (or known to be removed) — one catalog query
+    pending = pending_ids(item_ids)
     print(f"Scraping {len(pending)} of {len(item_ids)} items ({len(item_ids) - len(pending)} already saved)")
 
     results = await scrape_multiple(
@@ -74,7 +74,7 @@ async def example_batch():
     errors  = [id for id, r in results.items() if r.status == "error"]
 
     print(f"\nResults: {len(success)} success, {len(removed)} removed, {len(errors)} error")
-    print(f"Total saved: {len(list_saved())} HTML files in output/")
+    print(f"Total saved: {len(list_saved())} pages in output/")
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,379 @@
+"""
+Field Extractor
+
+Turns saved HTML into structured records using the `fields` and
+`boilerplate.exclude_selectors` of a site profile — no browser needed.
+
+Selectors are compiled to XPath once per process and applied with lxml,
+and files are spread across worker processes, so re-extracting a large
+archive is bound by CPU cores rather than by parsing overhead.
+
+Usage:
+    python extractor.py                                  # every saved item → records.jsonl
+    python extractor.py --out records.parquet            # Parquet (needs pyarrow)
+    python extractor.py --ids item-1 item-2 --workers 8
+    python extractor.py --profile profiles/shop.json --output-dir output-shop
+
+    from extractor import FieldExtractor
+    record = FieldExtractor(profile).extract(html)
+
+Field spec (from site-profile.json):
+    "price": {
+        "selector": "[data-testid='price-current'], .price-now",  # first option that matches wins
+        "type": "text",              # text | attribute | html
+        "attribute": "content",      # only for type "attribute"
+        "multiple": false            # true → list of every match
+    }
+
+Requirements:
+    pip install lxml cssselect
+    pip install pyarrow   # only for Parquet output
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from html_store import open_store
+
+try:
+    import lxml.etree
+    import lxml.html
+    from cssselect import HTMLTranslator
+    from cssselect import SelectorError
+except ImportError:  # Reported when an extractor is actually built
+    lxml = None
+
+OUTPUT_DIR = Path("output")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Never dropped as boilerplate, even if an exclude selector matches them
+# (e.g. "[class*='cookie']" matching <body class="cookie-accepted">)
+_PROTECTED_TAGS = {"html", "head", "body"}
+
+
+# ---------------------------------------------------------------------------
+# Selector compilation
+# ---------------------------------------------------------------------------
+
+def split_selector_list(selector: str) -> list[str]:
+    """
+    Split "a, b, c" into its options at top-level commas only.
+
+    Commas inside quotes, brackets or parentheses (":is(a, b)",
+    "[title='a, b']") don't split.
+    """
+    options, depth, quote, current = [], 0, None, []
+    for char in selector:
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in "'\"":
+            quote = char
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            options.append("".join(current).strip())
+            current = []
+            continue
+        current.append(char)
+    options.append("".join(current).strip())
+    return [option for option in options if option]
+
+
+def _compile_css(selector: str, translator) -> Optional["lxml.etree.XPath"]:
+    """Compile one CSS selector to XPath, or None if cssselect can't express it."""
+    try:
+        return lxml.etree.XPath(translator.css_to_xpath(selector))
+    except (SelectorError, lxml.etree.XPathError):
+        return None
+
+
+def selector_has_text(html: str, selector: str) -> bool:
+    """
+    Whether any option of a CSS selector matches an element with text.
+
+    Lets the scraper's HTTP fast path tell server-rendered content from an
+    empty JavaScript shell without starting a browser.
+    """
+    if lxml is None:
+        raise ImportError("Selector checks need: pip install lxml cssselect")
+    try:
+        root = lxml.html.document_fromstring(html)
+    except (lxml.etree.ParserError, ValueError):
+        return False
+    translator = HTMLTranslator()
+    for option in split_selector_list(selector):
+        xpath = _compile_css(option, translator)
+        if xpath is None:
+            continue
+        for element in xpath(root):
+            if isinstance(element.tag, str) and element.text_content().strip():
+                return True
+    return False
+
+
+class FieldExtractor:
+    """
+    Extracts a profile's fields from HTML.
+
+    Built once per profile: every selector option is compiled to an lxml
+    XPath up front, so extract() only parses the page and evaluates them.
+
+    Field semantics (shared with the scraper's in-browser extraction):
+      - options in a comma-separated selector are tried in order; the first
+        that matches anything wins
+      - "text" is whitespace-normalized text content, "attribute" the named
+        attribute, "html" the element's inner HTML
+      - a single value (first match) unless the field sets "multiple": true
+      - None when nothing matches
+    """
+
+    def __init__(self, site_profile: dict):
+        if lxml is None:
+            raise ImportError("Field extraction needs: pip install lxml cssselect")
+
+        translator = HTMLTranslator()
+        self.fields: dict[str, dict] = {}
+        self._compiled: dict[str, list] = {}
+        self.skipped: list[str] = []   # "field: selector" options cssselect couldn't compile
+
+        for name, spec in (site_profile.get("fields") or {}).items():
+            self.fields[name] = spec
+            compiled = []
+            for option in split_selector_list(spec.get("selector", "")):
+                xpath = _compile_css(option, translator)
+                if xpath is None:
+                    self.skipped.append(f"{name}: {option}")
+                else:
+                    compiled.append(xpath)
+            self._compiled[name] = compiled
+
+        self._exclude = [
+            xpath
+            for selector in (site_profile.get("boilerplate") or {}).get("exclude_selectors", [])
+            for option in split_selector_list(selector)
+            if (xpath := _compile_css(option, translator)) is not None
+        ]
+
+    def extract(self, html: str) -> dict:
+        """Extract every field from one page. Unmatched fields are None."""
+        try:
+            root = lxml.html.document_fromstring(html)
+        except (lxml.etree.ParserError, ValueError):
+            return {name: None for name in self.fields}
+
+        self._strip_boilerplate(root)
+        return {name: self._extract_field(root, name) for name in self.fields}
+
+    def _strip_boilerplate(self, root) -> None:
+        doomed = [
+            element
+            for xpath in self._exclude
+            for element in xpath(root)
+            if isinstance(element.tag, str) and element.tag.lower() not in _PROTECTED_TAGS
+        ]
+        for element in doomed:
+            if element.getparent() is not None:
+                element.drop_tree()
+
+    def _extract_field(self, root, name: str):
+        spec = self.fields[name]
+        for xpath in self._compiled[name]:
+            matches = xpath(root)
+            if not matches:
+                continue
+            if spec.get("multiple"):
+                values = [self._value(element, spec) for element in matches]
+                return [value for value in values if value not in (None, "")]
+            return self._value(matches[0], spec)
+        return [] if spec.get("multiple") else None
+
+    @staticmethod
+    def _value(element, spec: dict) -> Optional[str]:
+        field_type = spec.get("type", "text")
+        if field_type == "attribute":
+            return element.get(spec.get("attribute", ""))
+        if field_type == "html":
+            inner = element.text or ""
+            inner += "".join(
+                lxml.html.tostring(child, encoding="unicode") for child in element
+            )
+            return inner.strip()
+        return _WHITESPACE_RE.sub(" ", element.text_content()).strip()
+
+
+# ---------------------------------------------------------------------------
+# Bulk extraction
+# ---------------------------------------------------------------------------
+
+# Per-process state for worker processes, set by _init_worker
+_worker_extractor: Optional[FieldExtractor] = None
+_worker_output_dir: Optional[Path] = None
+
+
+def _init_worker(site_profile: dict, output_dir: Path) -> None:
+    global _worker_extractor, _worker_output_dir
+    _worker_extractor = FieldExtractor(site_profile)
+    _worker_output_dir = output_dir
+
+
+def _extract_chunk(item_ids: list[str]) -> list[dict]:
+    """Extract records for a chunk of saved items (runs in a worker process)."""
+    store = open_store(_worker_output_dir)
+    records = []
+    for item_id in item_ids:
+        html = store.load(item_id)
+        if html is not None:
+            records.append({"item_id": item_id, **_worker_extractor.extract(html)})
+    return records
+
+
+def _chunks(items: list[str], size: int) -> Iterator[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def extract_saved(
+    site_profile: dict,
+    output_dir: Path = OUTPUT_DIR,
+    item_ids: Optional[Iterable[str]] = None,
+    workers: Optional[int] = None,
+    chunk_size: int = 200,
+) -> Iterator[dict]:
+    """
+    Extract records from saved HTML, yielding one dict per item.
+
+    Records come back in item order, chunk by chunk, while later chunks
+    are still being processed.
+
+    Args:
+        site_profile:  Profile whose fields to extract
+        output_dir:    Directory of saved HTML (see html_store.py)
+        item_ids:      Items to extract (default: every saved item)
+        workers:       Worker processes (default: all cores; 1 = in-process)
+        chunk_size:    Items per task sent to a worker
+    """
+    ids = list(item_ids) if item_ids is not None else open_store(output_dir).list_ids()
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1 or len(ids) <= chunk_size:
+        _init_worker(site_profile, output_dir)
+        for chunk in _chunks(ids, chunk_size):
+            yield from _extract_chunk(chunk)
+        return
+
+    # spawn: workers must open their own SQLite connections, not inherit ours
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(site_profile, output_dir),
+    ) as executor:
+        for records in executor.map(_extract_chunk, _chunks(ids, chunk_size)):
+            yield from records
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+def write_jsonl(records: Iterable[dict], path: Path) -> int:
+    """Write records as JSON Lines. Returns the number written."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with path.open("w", encoding="utf-8") as f:
+        for record in records:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            count += 1
+    return count
+
+
+def write_parquet(
+    records: Iterable[dict],
+    path: Path,
+    site_profile: dict,
+    batch_size: int = 5000,
+) -> int:
+    """Write records as Parquet in row groups of batch_size. Returns the number written."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet output needs: pip install pyarrow")
+
+    columns = [pa.field("item_id", pa.string())]
+    for name, spec in (site_profile.get("fields") or {}).items():
+        columns.append(pa.field(name, pa.list_(pa.string()) if spec.get("multiple") else pa.string()))
+    schema = pa.schema(columns)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    batch: list[dict] = []
+    with pq.ParquetWriter(path, schema) as writer:
+        for record in records:
+            batch.append(record)
+            if len(batch) >= batch_size:
+                writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+                count += len(batch)
+                batch = []
+        if batch:
+            writer.write_table(pa.Table.from_pylist(batch, schema=schema))
+            count += len(batch)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Extract structured records from saved HTML using a site profile",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--profile",
+        default="site-profile.json",
+        help="Site profile with fields to extract (default: site-profile.json)",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=str(OUTPUT_DIR),
+        help="Directory of saved HTML (default: output)",
+    )
+    parser.add_argument(
+        "--out",
+        default="records.jsonl",
+        help="Output file; .parquet writes Parquet, anything else JSON Lines",
+    )
+    parser.add_argument("--ids", nargs="*", help="Only extract these item IDs")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    args = parser.parse_args()
+
+    profile = json.loads(Path(args.profile).read_text(encoding="utf-8"))
+    extractor = FieldExtractor(profile)
+    for skipped in extractor.skipped:
+        print(f"  Skipping unsupported selector — {skipped}")
+
+    records = extract_saved(profile, Path(args.output_dir), item_ids=args.ids, workers=args.workers)
+    out = Path(args.out)
+    if out.suffix == ".parquet":
+        count = write_parquet(records, out, profile)
+    else:
+        count = write_jsonl(records, out)
+    print(f"Extracted {count:,} records → {out}")
+
+
+if __name__ == "__main__":
+    main()
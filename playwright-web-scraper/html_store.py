@@ -0,0 +1,761 @@
+"""
+HTML Store
+
+Storage backends for scraped HTML, plus a catalog of every scraped item.
+The scraper's helper functions (_save_html, load_saved_html, html_exists,
+list_saved, pending_ids) go through open_store(), so the on-disk layout
+can change without touching callers.
+
+Backends:
+  - FlatHtmlStore        output/{id}.html, one uncompressed file per item (legacy)
+  - CompressedHtmlStore  content-addressed, compressed, hash-sharded objects
+
+Both keep a SQLite catalog (catalog.sqlite) recording, per item: where its
+HTML is, its size and content hash, its status (success/removed), when it
+was scraped, how often its content has changed and the server's ETag /
+Last-Modified validators (for conditional re-scrapes). Existence checks and
+"what still needs scraping" questions are answered from the catalog instead
+of the filesystem. Saving HTML identical to what is already stored only
+updates the catalog.
+
+Compressed layout:
+    output/
+    ├── store.json                       — backend marker
+    ├── catalog.sqlite                   — item catalog
+    └── objects/
+        └── 3f/a2/3fa2…e1.html.zst       — one object per distinct page
+
+Identical pages are stored once. zstd is used when the `zstandard` package
+is installed, gzip otherwise; both can be read back regardless of which
+wrote them.
+
+Usage:
+    from html_store import open_store
+
+    store = open_store(Path("output"))
+    store.save("item-123", html)
+    html = store.load("item-123")
+
+    # Which of these IDs are missing, or were scraped more than 7 days ago?
+    todo = store.catalog.pending(all_ids, max_age_days=7)
+
+    # What to re-scrape next, most overdue first
+    todo = store.catalog.plan_recrawl(FreshnessPolicy(max_age_days=7), limit=5000)
+
+    # Convert a legacy flat directory
+    python html_store.py migrate output/ output-compressed/
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+try:
+    import zstandard
+except ImportError:  # Optional — gzip is used instead
+    zstandard = None
+
+_ENTRY_COLUMNS = (
+    "item_id, status, path, size, content_hash, scraped_at, checks, changes, changed_at"
+)
+
+STORE_MARKER = "store.json"
+CATALOG_FILE = "catalog.sqlite"
+DEFAULT_KIND = "compressed"
+
+
+# ---------------------------------------------------------------------------
+# Catalog
+# ---------------------------------------------------------------------------
+
+@dataclass
+class CatalogEntry:
+    """What the catalog knows about one item."""
+    item_id: str
+    status: str                   # "success" or "removed"
+    path: Optional[str]           # HTML file, relative to the store root
+    size: int                     # Uncompressed HTML bytes
+    content_hash: Optional[str]   # SHA-256 of the HTML
+    scraped_at: float             # Unix timestamp of the last scrape
+    checks: int = 1               # Successful scrapes recorded
+    changes: int = 0              # Scrapes whose HTML differed from the previous one
+    changed_at: Optional[float] = None
+
+    @property
+    def change_rate(self) -> Optional[float]:
+        """Share of re-scrapes that found new content, or None if never re-scraped."""
+        return self.changes / (self.checks - 1) if self.checks > 1 else None
+
+
+@dataclass
+class SavedHtml:
+    """Outcome of HtmlStore.save()."""
+    path: Path
+    content_hash: str
+    changed: bool   # False if identical HTML was already stored (nothing was written)
+
+
+@dataclass
+class FreshnessPolicy:
+    """
+    When stored items are due for a re-scrape.
+
+    Each item gets a target interval between min_age_days and max_age_days,
+    shortened in proportion to how often its content has changed before
+    (items never re-scraped use max_age_days). Removed items are re-checked
+    every removed_recheck_days (never if None). Items are due once their age
+    exceeds their interval and are ordered by how overdue they are.
+    """
+    max_age_days: float = 7.0
+    min_age_days: float = 1.0
+    removed_recheck_days: Optional[float] = 30.0
+
+    def interval_days(self, entry: CatalogEntry) -> Optional[float]:
+        """Target re-scrape interval for an item, or None if it should not be re-scraped."""
+        if entry.status == "removed":
+            return self.removed_recheck_days
+        rate = entry.change_rate
+        if rate is None:
+            return self.max_age_days
+        return max(self.min_age_days, self.max_age_days * (1 - rate))
+
+
+class Catalog:
+    """
+    SQLite catalog of scraped items, one row per item ID.
+
+    Writes are single transactions, so a crash never leaves a half-updated
+    row. Safe to share between threads; separate processes can open the
+    same file (WAL mode).
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.is_new = not path.exists()
+        self._lock = threading.RLock()
+        self._exclusive = False   # Inside exclusive(): writes join its transaction
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA busy_timeout=30000")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            "  item_id TEXT PRIMARY KEY,"
+            "  status TEXT NOT NULL,"
+            "  path TEXT,"
+            "  size INTEGER NOT NULL DEFAULT 0,"
+            "  content_hash TEXT,"
+            "  scraped_at REAL NOT NULL,"
+            "  checks INTEGER NOT NULL DEFAULT 1,"
+            "  changes INTEGER NOT NULL DEFAULT 0,"
+            "  changed_at REAL,"
+            "  etag TEXT,"
+            "  last_modified TEXT"
+            ")"
+        )
+        self._add_missing_columns()
+        self._db.execute("CREATE INDEX IF NOT EXISTS items_scraped_at ON items (scraped_at)")
+        self._db.execute("CREATE INDEX IF NOT EXISTS items_path ON items (path)")
+        self._db.commit()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """One write transaction, or part of the exclusive() one this thread holds."""
+        with self._lock:
+            if self._exclusive:
+                yield
+            else:
+                with self._db:
+                    yield
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """
+        Hold the catalog's write lock (BEGIN IMMEDIATE) for the whole block,
+        so catalog changes and the file operations that depend on them can't
+        interleave with another thread's or process's. Writes made inside
+        commit together at the end of the block.
+        """
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            self._exclusive = True
+            try:
+                yield
+            except BaseException:
+                self._db.rollback()
+                raise
+            else:
+                self._db.commit()
+            finally:
+                self._exclusive = False
+
+    def _add_missing_columns(self) -> None:
+        """Upgrade catalogs written before change tracking / validators existed."""
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(items)")}
+        for name, ddl in (
+            ("checks", "INTEGER NOT NULL DEFAULT 1"),
+            ("changes", "INTEGER NOT NULL DEFAULT 0"),
+            ("changed_at", "REAL"),
+            ("etag", "TEXT"),
+            ("last_modified", "TEXT"),
+        ):
+            if name not in columns:
+                self._db.execute(f"ALTER TABLE items ADD COLUMN {name} {ddl}")
+
+    def record_saved(
+        self,
+        item_id: str,
+        path: str,
+        size: int,
+        content_hash: Optional[str],
+        scraped_at: Optional[float] = None,
+        validators: Optional[dict] = None,
+    ) -> None:
+        """
+        Record that HTML for an item was stored (or re-confirmed unchanged).
+
+        Bumps the item's check count, and its change count when the content
+        hash differs from the previously recorded one. validators
+        ({"etag": ..., "last_modified": ...}) replace the stored ones.
+        """
+        scraped_at = scraped_at or time.time()
+        validators = validators or {}
+        with self._transaction():
+            # On conflict, column names on the right-hand side are the old values
+            self._db.execute(
+                "INSERT INTO items "
+                "(item_id, status, path, size, content_hash, scraped_at, changed_at,"
+                " etag, last_modified) "
+                "VALUES (?, 'success', ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (item_id) DO UPDATE SET "
+                "  status = 'success',"
+                "  path = excluded.path,"
+                "  size = excluded.size,"
+                "  checks = checks + 1,"
+                "  changes = changes + (content_hash IS NOT excluded.content_hash"
+                "                       AND content_hash IS NOT NULL),"
+                "  changed_at = CASE WHEN content_hash IS NOT excluded.content_hash"
+                "               THEN excluded.scraped_at ELSE changed_at END,"
+                "  content_hash = excluded.content_hash,"
+                "  scraped_at = excluded.scraped_at,"
+                "  etag = excluded.etag,"
+                "  last_modified = excluded.last_modified",
+                (
+                    item_id, path, size, content_hash, scraped_at, scraped_at,
+                    validators.get("etag"), validators.get("last_modified"),
+                ),
+            )
+
+    def record_unchanged(self, item_id: str, scraped_at: Optional[float] = None) -> None:
+        """Record a re-scrape the server answered with 304 Not Modified."""
+        with self._transaction():
+            self._db.execute(
+                "UPDATE items SET checks = checks + 1, scraped_at = ? WHERE item_id = ?",
+                (scraped_at or time.time(), item_id),
+            )
+
+    def validators(self, item_id: str) -> dict[str, str]:
+        """
+        ETag / Last-Modified stored for an item with saved HTML, as
+        {"etag": ..., "last_modified": ...} (only the ones the server sent).
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified FROM items "
+                "WHERE item_id = ? AND status = 'success' AND path IS NOT NULL",
+                (item_id,),
+            ).fetchone()
+        if row is None:
+            return {}
+        return {name: value for name, value in zip(("etag", "last_modified"), row) if value}
+
+    def record_removed(self, item_id: str, scraped_at: Optional[float] = None) -> None:
+        """Record that an item is gone. Previously saved HTML stays referenced."""
+        with self._transaction():
+            self._db.execute(
+                "INSERT INTO items (item_id, status, scraped_at) VALUES (?, 'removed', ?) "
+                "ON CONFLICT (item_id) DO UPDATE SET "
+                "  status = 'removed', scraped_at = excluded.scraped_at",
+                (item_id, scraped_at or time.time()),
+            )
+
+    def is_referenced(self, path: str) -> bool:
+        """True if any item's row still points at this stored file."""
+        with self._lock:
+            row = self._db.execute("SELECT 1 FROM items WHERE path = ? LIMIT 1", (path,)).fetchone()
+        return row is not None
+
+    def get(self, item_id: str) -> Optional[CatalogEntry]:
+        """The catalog entry for an item, or None."""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM items WHERE item_id = ?", (item_id,)
+            ).fetchone()
+        return CatalogEntry(*row) if row else None
+
+    def ids(self, status: Optional[str] = None, with_html: bool = False) -> list[str]:
+        """Item IDs, optionally filtered by status and/or having stored HTML."""
+        where, params = [], []
+        if status is not None:
+            where.append("status = ?")
+            params.append(status)
+        if with_html:
+            where.append("path IS NOT NULL")
+        sql = "SELECT item_id FROM items"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            rows = self._db.execute(sql + " ORDER BY item_id", params).fetchall()
+        return [row[0] for row in rows]
+
+    def pending(
+        self,
+        item_ids: Iterable[str],
+        max_age_days: Optional[float] = None,
+        include_removed: bool = False,
+    ) -> list[str]:
+        """
+        Which of item_ids still need scraping, in their original order.
+
+        An item is pending if it has never been scraped, or if it was scraped
+        more than max_age_days ago. Removed items are skipped unless
+        include_removed is set (then they are pending once older than
+        max_age_days, or always if max_age_days is None).
+
+        Runs as one SQL join — checking 200k IDs takes about a second,
+        with no per-item filesystem access.
+        """
+        if max_age_days is None:
+            success_cutoff, removed_cutoff = float("-inf"), float("inf")
+        else:
+            success_cutoff = removed_cutoff = time.time() - max_age_days * 86400
+
+        with self._lock:
+            self._db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (item_id TEXT PRIMARY KEY)")
+            self._db.execute("DELETE FROM wanted")
+            self._db.executemany(
+                "INSERT OR IGNORE INTO wanted (item_id) VALUES (?)",
+                ((item_id,) for item_id in item_ids),
+            )
+            rows = self._db.execute(
+                "SELECT w.item_id FROM wanted w "
+                "LEFT JOIN items i ON i.item_id = w.item_id "
+                "WHERE i.item_id IS NULL "
+                "   OR (i.status = 'success' AND i.scraped_at < ?) "
+                "   OR (? AND i.status = 'removed' AND i.scraped_at < ?) "
+                "ORDER BY w.rowid",
+                (success_cutoff, include_removed, removed_cutoff),
+            ).fetchall()
+            self._db.execute("DELETE FROM wanted")
+            self._db.commit()
+        return [row[0] for row in rows]
+
+    def plan_recrawl(
+        self,
+        policy: Optional[FreshnessPolicy] = None,
+        item_ids: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+    ) -> list[str]:
+        """
+        Item IDs due for a (re-)scrape under a freshness policy, highest priority first.
+
+        IDs from item_ids that are not in the catalog yet come first; then
+        catalog items ordered by age / target interval, most overdue first.
+        Without item_ids, the whole catalog is considered.
+        """
+        policy = policy or FreshnessPolicy()
+        now = time.time()
+
+        with self._lock:
+            if item_ids is None:
+                new_ids = []
+                rows = self._db.execute(f"SELECT {_ENTRY_COLUMNS} FROM items").fetchall()
+            else:
+                self._db.execute("CREATE TEMP TABLE IF NOT EXISTS wanted (item_id TEXT PRIMARY KEY)")
+                self._db.execute("DELETE FROM wanted")
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO wanted (item_id) VALUES (?)",
+                    ((item_id,) for item_id in item_ids),
+                )
+                new_ids = [row[0] for row in self._db.execute(
+                    "SELECT w.item_id FROM wanted w LEFT JOIN items i USING (item_id) "
+                    "WHERE i.item_id IS NULL ORDER BY w.rowid"
+                )]
+                rows = self._db.execute(
+                    f"SELECT {_ENTRY_COLUMNS} FROM items WHERE item_id IN (SELECT item_id FROM wanted)"
+                ).fetchall()
+                self._db.execute("DELETE FROM wanted")
+                self._db.commit()
+
+        due = []
+        for row in rows:
+            entry = CatalogEntry(*row)
+            interval = policy.interval_days(entry)
+            if interval is None:
+                continue
+            overdue = (now - entry.scraped_at) / 86400 / max(interval, 1e-9)
+            if overdue >= 1:
+                due.append((overdue, entry.item_id))
+        due.sort(reverse=True)
+
+        planned = new_ids + [item_id for _, item_id in due]
+        return planned[:limit] if limit is not None else planned
+
+    def counts(self) -> dict[str, int]:
+        """Number of items per status."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT status, COUNT(*) FROM items GROUP BY status"
+            ).fetchall()
+        return dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# ---------------------------------------------------------------------------
+# Backend interface
+# ---------------------------------------------------------------------------
+
+class HtmlStore:
+    """
+    Interface every storage backend implements.
+
+    Subclasses write and read the HTML; the catalog answers existence and
+    listing questions for all of them.
+    """
+
+    kind = ""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.catalog = Catalog(self.root / CATALOG_FILE)
+
+    def save(
+        self,
+        item_id: str,
+        html: str,
+        scraped_at: Optional[float] = None,
+        validators: Optional[dict] = None,
+    ) -> SavedHtml:
+        """
+        Store HTML for an item, replacing any previous version, and record it
+        in the catalog (scraped_at defaults to now) with the response's
+        validators ({"etag": ..., "last_modified": ...}).
+
+        If the item already has identical HTML stored, nothing is written —
+        only the catalog's scrape time, check count and validators are updated.
+        When the content changed, the previous version's file is deleted
+        once no item refers to it any more.
+
+        Objects can be shared between items, so the new row is recorded, the
+        object it points at re-checked and the old one deleted under the
+        catalog's write lock: another process can't delete an object between
+        this save finding it and referencing it.
+        """
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+
+        previous = self.catalog.get(item_id)
+        if previous and previous.content_hash == digest and previous.path:
+            path = self.root / previous.path
+            if path.exists():
+                self.catalog.record_saved(
+                    item_id, previous.path, len(data), digest, scraped_at, validators
+                )
+                return SavedHtml(path=path, content_hash=digest, changed=False)
+
+        path = self._write(item_id, data, digest)
+        with self.catalog.exclusive():
+            if not path.exists():
+                # Deleted as unreferenced by another save since _write found it
+                path = self._write(item_id, data, digest)
+            relative = path.relative_to(self.root).as_posix()
+            replaced = self.catalog.get(item_id)   # Re-read: another process may have saved it since
+            self.catalog.record_saved(item_id, relative, len(data), digest, scraped_at, validators)
+            if replaced and replaced.path and replaced.path != relative:
+                if not self.catalog.is_referenced(replaced.path):
+                    (self.root / replaced.path).unlink(missing_ok=True)
+        return SavedHtml(path=path, content_hash=digest, changed=True)
+
+    def _write(self, item_id: str, data: bytes, digest: str) -> Path:
+        """Write UTF-8 HTML bytes to the backend. Returns the file path."""
+        raise NotImplementedError
+
+    def load(self, item_id: str) -> Optional[str]:
+        """Return stored HTML for an item, or None."""
+        raise NotImplementedError
+
+    def exists(self, item_id: str) -> bool:
+        """True if HTML is stored for the item."""
+        entry = self.catalog.get(item_id)
+        return entry is not None and entry.path is not None
+
+    def list_ids(self) -> list[str]:
+        """All item IDs with stored HTML."""
+        return self.catalog.ids(with_html=True)
+
+    def hash_of(self, item_id: str) -> Optional[str]:
+        """Content hash of the stored HTML for an item, or None."""
+        entry = self.catalog.get(item_id)
+        return entry.content_hash if entry else None
+
+    def close(self) -> None:
+        """Release any open resources."""
+        self.catalog.close()
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write via a temp file + rename so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+# ---------------------------------------------------------------------------
+# Flat files (legacy layout)
+# ---------------------------------------------------------------------------
+
+class FlatHtmlStore(HtmlStore):
+    """
+    One uncompressed output/{item_id}.html file per item.
+
+    The first time an existing directory is opened, its .html files are
+    added to the catalog (without content hashes) so lookups stay indexed.
+    """
+
+    kind = "flat"
+
+    def __init__(self, root: Path):
+        super().__init__(root)
+        if self.catalog.is_new:
+            for f in self.root.glob("*.html"):
+                stat = f.stat()
+                self.catalog.record_saved(f.stem, f.name, stat.st_size, None, stat.st_mtime)
+
+    def _path(self, item_id: str) -> Path:
+        return self.root / f"{item_id}.html"
+
+    def _write(self, item_id: str, data: bytes, digest: str) -> Path:
+        path = self._path(item_id)
+        _atomic_write(path, data)
+        return path
+
+    def load(self, item_id: str) -> Optional[str]:
+        path = self._path(item_id)
+        return path.read_text(encoding="utf-8") if path.exists() else None
+
+
+# ---------------------------------------------------------------------------
+# Compressed, content-addressed objects
+# ---------------------------------------------------------------------------
+
+class CompressedHtmlStore(HtmlStore):
+    """
+    Content-addressed, compressed HTML objects.
+
+    Objects are named by the SHA-256 of the HTML and sharded two levels deep
+    (objects/ab/cd/) so no directory grows past a few thousand entries.
+    The catalog maps item IDs to objects, so lookups never list directories.
+    """
+
+    kind = "compressed"
+
+    def __init__(self, root: Path, compression: Optional[str] = None, level: Optional[int] = None):
+        """
+        Args:
+            root:         Store directory
+            compression:  "zstd" or "gzip" (default: zstd if installed)
+            level:        Compression level (default: 10 for zstd, 6 for gzip)
+        """
+        if compression is None:
+            compression = "zstd" if zstandard is not None else "gzip"
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstd compression needs: pip install zstandard")
+        if compression not in ("zstd", "gzip"):
+            raise ValueError(f"Unknown compression: {compression}")
+
+        super().__init__(root)
+        self.compression = compression
+        self.level = level if level is not None else (10 if compression == "zstd" else 6)
+
+    # -- objects -------------------------------------------------------------
+
+    def _object_path(self, digest: str, compression: Optional[str] = None) -> Path:
+        suffix = ".zst" if (compression or self.compression) == "zstd" else ".gz"
+        return self.root / "objects" / digest[:2] / digest[2:4] / f"{digest}.html{suffix}"
+
+    def _find_object(self, digest: str) -> Optional[Path]:
+        """Locate an object whichever compression wrote it."""
+        for compression in (self.compression, "gzip" if self.compression == "zstd" else "zstd"):
+            path = self._object_path(digest, compression)
+            if path.exists():
+                return path
+        return None
+
+    def _compress(self, data: bytes) -> bytes:
+        if self.compression == "zstd":
+            return zstandard.ZstdCompressor(level=self.level).compress(data)
+        return gzip.compress(data, compresslevel=self.level)
+
+    @staticmethod
+    def _decompress(path: Path) -> bytes:
+        data = path.read_bytes()
+        if path.suffix == ".zst":
+            if zstandard is None:
+                raise ImportError(f"{path} is zstd-compressed: pip install zstandard")
+            return zstandard.ZstdDecompressor().decompress(data)
+        return gzip.decompress(data)
+
+    # -- HtmlStore -----------------------------------------------------------
+
+    def _write(self, item_id: str, data: bytes, digest: str) -> Path:
+        # Identical content is stored once, whichever items it belongs to
+        path = self._find_object(digest)
+        if path is None:
+            path = self._object_path(digest)
+            _atomic_write(path, self._compress(data))
+        return path
+
+    def load(self, item_id: str) -> Optional[str]:
+        entry = self.catalog.get(item_id)
+        if entry is None or entry.path is None:
+            return None
+        path = self.root / entry.path
+        return self._decompress(path).decode("utf-8") if path.exists() else None
+
+
+# ---------------------------------------------------------------------------
+# Opening stores
+# ---------------------------------------------------------------------------
+
+_open_stores: dict[Path, HtmlStore] = {}
+_open_lock = threading.Lock()
+
+
+def open_store(output_dir: Path, kind: Optional[str] = None, **options) -> HtmlStore:
+    """
+    Return the store for a directory, opening it once per process.
+
+    The backend is chosen in this order:
+      1. `kind` if given ("flat" or "compressed")
+      2. The kind recorded in output_dir/store.json
+      3. "flat" if the directory already holds legacy *.html files
+      4. DEFAULT_KIND for new directories
+
+    The choice is recorded in store.json so later runs reopen it the same way.
+    Extra keyword arguments are passed to the backend (e.g. compression="gzip").
+    """
+    root = Path(output_dir).resolve()
+    with _open_lock:
+        store = _open_stores.get(root)
+        if store is not None and kind in (None, store.kind):
+            return store
+
+        marker = root / STORE_MARKER
+        recorded = json.loads(marker.read_text(encoding="utf-8")) if marker.exists() else {}
+        if kind is not None and recorded.get("kind", kind) != kind:
+            raise ValueError(
+                f"{root} is a {recorded['kind']} store — "
+                f"use `python html_store.py migrate` to convert it"
+            )
+        if kind is None:
+            kind = recorded.get("kind")
+        if kind is None:
+            has_legacy = root.exists() and next(root.glob("*.html"), None) is not None
+            kind = "flat" if has_legacy else DEFAULT_KIND
+        if kind == "compressed" and "compression" not in options and "compression" in recorded:
+            options["compression"] = recorded["compression"]
+
+        if kind == "flat":
+            store = FlatHtmlStore(root)
+        elif kind == "compressed":
+            store = CompressedHtmlStore(root, **options)
+        else:
+            raise ValueError(f"Unknown store kind: {kind}")
+
+        if not marker.exists():
+            root.mkdir(parents=True, exist_ok=True)
+            settings = {"kind": store.kind}
+            if isinstance(store, CompressedHtmlStore):
+                settings["compression"] = store.compression
+            marker.write_text(json.dumps(settings, indent=2), encoding="utf-8")
+
+        _open_stores[root] = store
+        return store
+
+
+def migrate_store(source_dir: Path, target_dir: Path, kind: str = DEFAULT_KIND) -> int:
+    """
+    Copy every item from one store into a (new) store of another kind,
+    keeping scrape times, validators and removed statuses. Returns the number of items.
+    """
+    source = open_store(source_dir)
+    target = open_store(target_dir, kind=kind)
+    count = 0
+    for item_id in source.list_ids():
+        html = source.load(item_id)
+        if html is not None:
+            target.save(
+                item_id, html,
+                scraped_at=source.catalog.get(item_id).scraped_at,
+                validators=source.catalog.validators(item_id),
+            )
+            count += 1
+    for item_id in source.catalog.ids(status="removed"):
+        if not target.exists(item_id):
+            count += 1
+        target.catalog.record_removed(item_id, source.catalog.get(item_id).scraped_at)
+    return count
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or migrate scraped HTML stores")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    migrate = sub.add_parser("migrate", help="Copy a store into a new directory")
+    migrate.add_argument("source", help="Existing output directory")
+    migrate.add_argument("target", help="New output directory")
+    migrate.add_argument("--kind", default=DEFAULT_KIND, choices=["flat", "compressed"])
+
+    stats = sub.add_parser("stats", help="Show item counts and disk usage")
+    stats.add_argument("directory", help="Output directory")
+
+    args = parser.parse_args()
+
+    if args.command == "migrate":
+        count = migrate_store(Path(args.source), Path(args.target), kind=args.kind)
+        print(f"Migrated {count:,} items: {args.source} → {args.target}")
+    elif args.command == "stats":
+        store = open_store(Path(args.directory))
+        disk = sum(f.stat().st_size for f in Path(args.directory).rglob("*") if f.is_file())
+        counts = store.catalog.counts()
+        print(f"Store:    {store.kind}")
+        print(f"Saved:    {len(store.list_ids()):,}")
+        print(f"Removed:  {counts.get('removed', 0):,}")
+        print(f"Disk:     {disk / (1024 * 1024):,.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,347 @@
+"""
+Job Queue
+
+Durable, SQLite-backed queue of scrape jobs, so a long batch can be stopped
+or crash at any point and resume where it left off.
+
+Every item ID is a job in one of five states:
+
+    pending ──claim──▶ in_flight ──complete──▶ success | removed
+       ▲                   │
+       └── retry later ◀───┴── error (attempts left)  ──▶ error (final)
+
+A claimed job carries a lease. If its worker dies, the job becomes
+claimable again once the lease expires — or immediately, when the queue
+sees that the worker process (on this host) no longer exists. Finished and
+removed items are never handed out again, so a restart only re-scrapes what
+was in flight when it stopped.
+
+Several processes on one host can share a queue file: claims are single
+IMMEDIATE transactions, so no job is handed to two workers.
+
+Usage:
+    from job_queue import JobQueue
+    from scraper import scrape_multiple
+
+    queue = JobQueue(Path("output/jobs.sqlite"))
+    results = await scrape_multiple(all_ids, url_template=..., queue=queue)
+
+    # After a crash, the same call resumes: finished and removed items are skipped
+
+    python job_queue.py stats output/jobs.sqlite
+    python job_queue.py retry-errors output/jobs.sqlite
+"""
+
+import argparse
+import os
+import socket
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+QUEUE_FILE = "jobs.sqlite"
+STATES = ("pending", "in_flight", "success", "removed", "error")
+FINAL_STATES = ("success", "removed")
+
+_JOB_COLUMNS = "item_id, state, attempts, not_before, lease_until, worker, error, updated_at"
+
+
+@dataclass
+class Job:
+    """One row of the queue."""
+    item_id: str
+    state: str                      # One of STATES
+    attempts: int                   # Times the job has been claimed
+    not_before: float               # Unix timestamp before which a pending job isn't claimed
+    lease_until: Optional[float]    # When an in-flight claim expires
+    worker: Optional[str]           # "host:pid" of the claiming worker
+    error: Optional[str]            # Last error message
+    updated_at: float
+
+
+def _worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:  # Exists, owned by someone else
+        return True
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Queue
+# ---------------------------------------------------------------------------
+
+class JobQueue:
+    """
+    SQLite job queue with leases and retry scheduling.
+
+    Safe to share between threads; separate processes on one host can open
+    the same file (WAL mode).
+
+    Args:
+        path:                SQLite file (created if missing)
+        lease_seconds:       How long a claim lasts before the job is handed
+                             out again (default 600 — longer than any single
+                             scrape_item call, retries included)
+        max_attempts:        Claims before an erroring job is final (default 3)
+        retry_delay_seconds: Wait before the first retry of an errored job,
+                             doubled on each further attempt (default 60)
+    """
+
+    def __init__(
+        self,
+        path: Path = Path("output") / QUEUE_FILE,
+        lease_seconds: float = 600,
+        max_attempts: int = 3,
+        retry_delay_seconds: float = 60,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay_seconds = retry_delay_seconds
+        self.worker = _worker_id()
+        self._lock = threading.Lock()
+        # Autocommit mode: transactions are opened explicitly (BEGIN IMMEDIATE)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA busy_timeout=30000")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "  item_id TEXT PRIMARY KEY,"
+            "  state TEXT NOT NULL DEFAULT 'pending',"
+            "  attempts INTEGER NOT NULL DEFAULT 0,"
+            "  not_before REAL NOT NULL DEFAULT 0,"
+            "  lease_until REAL,"
+            "  worker TEXT,"
+            "  error TEXT,"
+            "  updated_at REAL NOT NULL"
+            ")"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS jobs_state ON jobs (state, not_before)")
+        self.reclaim_dead()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """A write transaction that holds the database lock from the start."""
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def add(self, item_ids: Iterable[str]) -> int:
+        """
+        Enqueue item IDs as pending jobs. IDs already in the queue, in any
+        state, are left alone. Returns the number of new jobs.
+        """
+        now = time.time()
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                "INSERT OR IGNORE INTO jobs (item_id, updated_at) VALUES (?, ?)",
+                ((item_id, now) for item_id in item_ids),
+            )
+            return db.total_changes - before
+
+    def claim(self, limit: int = 1) -> list[str]:
+        """
+        Lease up to `limit` jobs to this worker and return their item IDs.
+
+        Pending jobs that are due come first, oldest retry time first, then
+        in-flight jobs whose lease has expired. Jobs whose lease expired on
+        their last allowed attempt become final errors instead.
+        """
+        now = time.time()
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE jobs SET state = 'error', worker = NULL, lease_until = NULL,"
+                "  error = 'Lease expired on final attempt', updated_at = ? "
+                "WHERE state = 'in_flight' AND lease_until < ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            # Two queries so each is served by the (state, not_before) index
+            ids = [row[0] for row in db.execute(
+                "SELECT item_id FROM jobs WHERE state = 'pending' AND not_before <= ? "
+                "ORDER BY not_before, rowid LIMIT ?",
+                (now, limit),
+            )]
+            if len(ids) < limit:
+                ids += [row[0] for row in db.execute(
+                    "SELECT item_id FROM jobs WHERE state = 'in_flight' AND lease_until < ? "
+                    "LIMIT ?",
+                    (now, limit - len(ids)),
+                )]
+            db.executemany(
+                "UPDATE jobs SET state = 'in_flight', attempts = attempts + 1,"
+                "  lease_until = ?, worker = ?, updated_at = ? WHERE item_id = ?",
+                ((now + self.lease_seconds, self.worker, now, item_id) for item_id in ids),
+            )
+        return ids
+
+    def complete(self, item_id: str, status: str, error: Optional[str] = None) -> None:
+        """
+        Record the outcome of a claimed job.
+
+        "success" and "removed" are final ("unchanged" counts as success).
+        "error" schedules a retry after retry_delay_seconds × 2^(attempts - 1),
+        until max_attempts is reached.
+        """
+        if status == "unchanged":
+            status = "success"
+        if status not in ("success", "removed", "error"):
+            raise ValueError(f"Unknown job status: {status!r}")
+        now = time.time()
+        with self._transaction() as db:
+            if status in FINAL_STATES:
+                db.execute(
+                    "UPDATE jobs SET state = ?, error = NULL, worker = NULL,"
+                    "  lease_until = NULL, updated_at = ? WHERE item_id = ?",
+                    (status, now, item_id),
+                )
+                return
+            row = db.execute(
+                "SELECT attempts FROM jobs WHERE item_id = ?", (item_id,)
+            ).fetchone()
+            attempts = row[0] if row else self.max_attempts
+            if attempts >= self.max_attempts:
+                state, not_before = "error", 0
+            else:
+                state = "pending"
+                not_before = now + self.retry_delay_seconds * 2 ** max(0, attempts - 1)
+            db.execute(
+                "UPDATE jobs SET state = ?, not_before = ?, error = ?, worker = NULL,"
+                "  lease_until = NULL, updated_at = ? WHERE item_id = ?",
+                (state, not_before, error, now, item_id),
+            )
+
+    def release(self, item_ids: Iterable[str]) -> None:
+        """Hand unfinished claims back without counting the attempt (e.g. on shutdown)."""
+        now = time.time()
+        with self._transaction() as db:
+            db.executemany(
+                "UPDATE jobs SET state = 'pending', attempts = MAX(0, attempts - 1),"
+                "  worker = NULL, lease_until = NULL, updated_at = ? "
+                "WHERE item_id = ? AND state = 'in_flight' AND worker = ?",
+                ((now, item_id, self.worker) for item_id in item_ids),
+            )
+
+    def reclaim_dead(self) -> int:
+        """
+        Return jobs leased by processes on this host that no longer exist to
+        pending, without waiting for their leases to expire. Returns how many.
+        """
+        host = socket.gethostname()
+        with self._lock:
+            workers = [row[0] for row in self._db.execute(
+                "SELECT DISTINCT worker FROM jobs WHERE state = 'in_flight'"
+            )]
+        dead = []
+        for worker in workers:
+            worker_host, _, pid = (worker or "").rpartition(":")
+            if worker_host == host and pid.isdigit() and not _pid_alive(int(pid)):
+                dead.append(worker)
+        if not dead:
+            return 0
+        now = time.time()
+        with self._transaction() as db:
+            before = db.total_changes
+            db.executemany(
+                "UPDATE jobs SET state = 'pending', worker = NULL, lease_until = NULL,"
+                "  updated_at = ? WHERE state = 'in_flight' AND worker = ?",
+                ((now, worker) for worker in dead),
+            )
+            return db.total_changes - before
+
+    def next_due(self) -> Optional[float]:
+        """
+        Seconds until the next pending job can be claimed (0 if one is ready
+        now), or None if nothing is pending.
+        """
+        with self._lock:
+            row = self._db.execute(
+                "SELECT MIN(not_before) FROM jobs WHERE state = 'pending'"
+            ).fetchone()
+        if row[0] is None:
+            return None
+        return max(0.0, row[0] - time.time())
+
+    def retry_errors(self) -> int:
+        """Return final errors to pending with a fresh attempt budget. Returns how many."""
+        now = time.time()
+        with self._transaction() as db:
+            return db.execute(
+                "UPDATE jobs SET state = 'pending', attempts = 0, not_before = 0,"
+                "  updated_at = ? WHERE state = 'error'",
+                (now,),
+            ).rowcount
+
+    def get(self, item_id: str) -> Optional[Job]:
+        """The job for an item, or None."""
+        with self._lock:
+            row = self._db.execute(
+                f"SELECT {_JOB_COLUMNS} FROM jobs WHERE item_id = ?", (item_id,)
+            ).fetchone()
+        return Job(*row) if row else None
+
+    def ids(self, state: str) -> list[str]:
+        """Item IDs in a given state, in the order they were added."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT item_id FROM jobs WHERE state = ? ORDER BY rowid", (state,)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def counts(self) -> dict[str, int]:
+        """Number of jobs per state."""
+        with self._lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall()
+        return {state: 0 for state in STATES} | dict(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect or reset a scrape job queue")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    stats = sub.add_parser("stats", help="Show job counts per state")
+    stats.add_argument("path", help="Queue file (e.g. output/jobs.sqlite)")
+
+    retry = sub.add_parser("retry-errors", help="Queue failed jobs again")
+    retry.add_argument("path", help="Queue file")
+
+    args = parser.parse_args()
+    queue = JobQueue(Path(args.path))
+
+    if args.command == "stats":
+        for state, count in queue.counts().items():
+            print(f"{state + ':':<11}{count:,}")
+        due = queue.next_due()
+        if due:
+            print(f"Next job due in {due:,.0f}s")
+    elif args.command == "retry-errors":
+        print(f"Re-queued {queue.retry_errors():,} failed jobs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+Live Metrics
+
+Prometheus-style counters and gauges for long-running scrapes, so block
+rates and backlog can be watched (and alerted on) while a job runs rather
+than read from the final report.
+
+Exposed over a small local HTTP endpoint (http://127.0.0.1:<port>/metrics),
+written periodically to a node_exporter textfile, or both:
+
+    scrape_results_total{host,status}      finished items (success, unchanged, removed, error)
+    scrape_retries_total{host,kind}        retried attempts (timeout, blocked, incomplete)
+    scrape_blocked_total{host}             HTTP 403 responses, retried or not
+    scrape_in_flight                       pages being scraped right now
+    scrape_retry_backlog                   items waiting out a retry delay
+    scrape_queue_jobs{state}               JobQueue jobs per state (with a queue)
+    scrape_pool_browsers                   browsers in the BrowserPool
+    scrape_pool_contexts                   open browser contexts
+    scrape_pool_memory_bytes               resident memory of all browsers (needs psutil)
+
+No dependencies beyond the standard library.
+
+Usage:
+    from metrics import Metrics
+
+    metrics = Metrics(port=9108, textfile=Path("/var/lib/node_exporter/scrape.prom"))
+    results = await scrape_multiple(ids, url_template=..., metrics=metrics)
+
+    curl -s localhost:9108/metrics
+"""
+
+import asyncio
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Optional
+
+# name → (type, help)
+METRICS = {
+    "scrape_results_total": ("counter", "Finished items by host and status"),
+    "scrape_retries_total": ("counter", "Retried attempts by host and failure kind"),
+    "scrape_blocked_total": ("counter", "HTTP 403 responses by host"),
+    "scrape_in_flight": ("gauge", "Pages being scraped"),
+    "scrape_retry_backlog": ("gauge", "Items waiting out a retry delay"),
+    "scrape_queue_jobs": ("gauge", "Job queue entries by state"),
+    "scrape_pool_browsers": ("gauge", "Browsers in the pool"),
+    "scrape_pool_contexts": ("gauge", "Open browser contexts"),
+    "scrape_pool_memory_bytes": ("gauge", "Resident memory of the pool's browsers"),
+}
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+class Metrics:
+    """
+    Thread-safe metric registry with an optional HTTP endpoint and textfile.
+
+    Counters and gauges are updated from the event loop (scrape_stream,
+    scrape_item); the endpoint serves them from a background thread.
+    Pool memory and queue depth are sampled every `interval` seconds by
+    collect(), which also rewrites the textfile.
+
+    Picklable: a copy sent to a scrape_parallel worker starts empty and
+    without a server — see for_worker().
+
+    Args:
+        port:      Serve /metrics on this port (None: no endpoint)
+        textfile:  Rewrite this file in Prometheus text format every interval
+                   (None: no file); written atomically via a temp file
+        interval:  Seconds between samples of pool memory and queue depth
+                   (default 15)
+        host:      Interface to bind the endpoint to (default 127.0.0.1)
+        labels:    Labels added to every sample (e.g. {"worker": "3"})
+    """
+
+    def __init__(
+        self,
+        port: Optional[int] = None,
+        textfile: Optional[Path] = None,
+        interval: float = 15,
+        host: str = "127.0.0.1",
+        labels: Optional[dict] = None,
+    ):
+        self.port = port
+        self.textfile = textfile
+        self.interval = interval
+        self.host = host
+        self.labels = dict(labels or {})
+        self._values: dict[tuple, float] = {}   # (name, sorted label items) → value
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_values"] = {}
+        state["_lock"] = None
+        state["_server"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def for_worker(self, worker: int) -> "Metrics":
+        """
+        Settings for scrape_parallel worker `worker`: the next port up and
+        its own textfile (scrape.prom → scrape-w3.prom), labelled worker="3".
+        """
+        textfile = None
+        if self.textfile is not None:
+            textfile = self.textfile.with_name(f"{self.textfile.stem}-w{worker}{self.textfile.suffix}")
+        return Metrics(
+            port=None if self.port is None else self.port + worker,
+            textfile=textfile,
+            interval=self.interval,
+            host=self.host,
+            labels={**self.labels, "worker": str(worker)},
+        )
+
+    # -- Updates -------------------------------------------------------------
+
+    def inc(self, name: str, value: float = 1, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + value
+
+    def set(self, name: str, value: float, **labels: str) -> None:
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._values[key] = value
+
+    def get(self, name: str, **labels: str) -> float:
+        with self._lock:
+            return self._values.get((name, tuple(sorted(labels.items()))), 0)
+
+    async def collect(self, pool=None, queue=None) -> None:
+        """Sample pool size/memory and queue depth, then rewrite the textfile."""
+        if pool is not None:
+            stats = await pool.stats()
+            self.set("scrape_pool_browsers", stats["browsers"])
+            self.set("scrape_pool_contexts", stats["contexts"])
+            if stats["memory_mb"] is not None:
+                self.set("scrape_pool_memory_bytes", stats["memory_mb"] * 1024 * 1024)
+        if queue is not None:
+            # SQLite read; off the event loop so a big queue can't stall pages
+            counts = await asyncio.get_running_loop().run_in_executor(None, queue.counts)
+            for state, count in counts.items():
+                self.set("scrape_queue_jobs", count, state=state)
+        if self.textfile is not None:
+            self.write_textfile()
+
+    # -- Export --------------------------------------------------------------
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format."""
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = []
+        described = set()
+        for (name, labels), value in values:
+            if name not in described:
+                kind, help_text = METRICS.get(name, ("untyped", name))
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                described.add(name)
+            labels = {**self.labels, **dict(labels)}
+            label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value:g}" if label_text else f"{name} {value:g}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self) -> None:
+        """Write render() to the textfile, atomically so a scrape never sees half a file."""
+        self.textfile.parent.mkdir(parents=True, exist_ok=True)
+        temp = self.textfile.with_name(f".{self.textfile.name}.{os.getpid()}.tmp")
+        temp.write_text(self.render(), encoding="utf-8")
+        os.replace(temp, self.textfile)
+
+    def start(self) -> None:
+        """Start the HTTP endpoint (if a port is set). Safe to call twice."""
+        if self.port is None or self._server is not None:
+            return
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass  # Keep scrape progress output readable
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(target=self._server.serve_forever, name="metrics", daemon=True).start()
+        print(f"  Metrics on http://{self.host}:{self.port}/metrics")
+
+    def close(self) -> None:
+        """Stop the endpoint and write the textfile one last time."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self.textfile is not None:
+            self.write_textfile()
@@ -2,10 +2,22 @@
 Playwright Web Scraper
 
 Scrapes fully-rendered HTML from dynamic pages with:
-  - Retry logic (403 backoff, timeout retry, incomplete-page detection)
-  - Cookie consent handling
+  - Shared browser pool (warm Chromium instances, fresh context per item)
+  - Concurrent batches with per-host token-bucket rate limiting
+  - Streaming batch API yielding results as they complete
+  - Multi-process batches (one event loop and browser pool per core group)
+  - Retries with jittered exponential backoff, deferred so batches keep flowing
+  - Per-host circuit breaker after repeated 403s
+  - Request blocking for images, fonts, media and trackers (route interception)
+  - HTTP fast path for server-rendered sites, escalating to Chromium when needed
+  - Conditional re-scrapes (ETag / Last-Modified, "unchanged" on 304)
+  - Cookie consent handling, learned per host and kept in the site profile
+  - Warm sessions: per-site storage state and asset cache reused across runs
+  - Page-ready detection (content present + DOM quiet) instead of fixed sleeps
+  - In-browser field extraction for selective profiles (no full-page transfer)
+  - Per-phase timings, latency percentiles and per-host throughput (telemetry.py)
   - Site profile support (load site-profile.json from site-structure-analyzer)
-  - Raw HTML saved to output/{id}.html
+  - Raw HTML saved to output/ (compressed, content-addressed — see html_store.py)
 
 Usage:
     from scraper import scrape_sync, scrape_multiple, load_site_profile
@@ -23,24 +35,126 @@ Usage:
     results = asyncio.run(scrape_multiple(["item-1", "item-2"],
                                           url_template="https://example.com/items/{id}"))
 
+    # Multiple items, 8 pages in flight, at most 4 requests/sec per host
+    results = asyncio.run(scrape_multiple(ids, url_template=..., concurrency=8,
+                                          rate_limit=4, burst=4))
+
+    # Only the profile's fields, extracted inside the page
+    result = scrape_sync("item-123", url_template=..., site_profile=profile,
+                         extract="fields")
+    print(result.fields)
+
+    # Resumable batch: re-running after a crash skips finished items
+    results = asyncio.run(scrape_multiple(ids, url_template=...,
+                                          queue=JobQueue(Path("output/jobs.sqlite"))))
+
+    # Stream results as they finish, without holding HTML in memory
+    async for result in scrape_stream(ids, url_template=..., concurrency=8,
+                                      keep_html=False):
+        print(result.item_id, result.status)
+
+    # Spread a large batch over worker processes (each with its own pool)
+    report = scrape_parallel(ids, url_template=..., processes=8, concurrency=8)
+    print(report.summary())
+
+    # Share warm browsers across your own calls
+    async with BrowserPool(size=2) as pool:
+        result = await scrape_item("item-123", url_template=..., pool=pool)
+
 Requirements:
     pip install playwright
     playwright install chromium
 """
 
 import asyncio
+import hashlib
+import heapq
+import html as html_lib
+import importlib.util
+import itertools
 import json
+import multiprocessing
+import os
+import random
 import re
-from dataclasses import dataclass
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import asynccontextmanager
+from datetime import datetime
+from functools import lru_cache
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Literal, Optional
+from typing import AsyncIterator, Iterable, Literal, Optional
+from urllib.parse import urlparse
 
+from playwright.async_api import Browser, BrowserContext, Page, Route
 from playwright.async_api import TimeoutError as PlaywrightTimeout
 from playwright.async_api import async_playwright
 
+from extractor import FieldExtractor, selector_has_text, split_selector_list
+from html_store import FreshnessPolicy, SavedHtml, _atomic_write, open_store
+from job_queue import JobQueue
+from metrics import Metrics
+from telemetry import ItemTimer, Telemetry
+
+try:
+    import psutil
+except ImportError:  # Optional — only needed for memory-based browser recycling
+    psutil = None
+
+try:
+    import httpx
+except ImportError:  # Optional — without it every page goes through the browser
+    httpx = None
+
 # Default directory for saved HTML files
 OUTPUT_DIR = Path("output")
 
+# Browser context defaults
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/131.0.0.0 Safari/537.36"
+)
+DEFAULT_VIEWPORT = {"width": 1920, "height": 1080}
+
+# Default request blocking — override via the site profile's "network" section
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+DEFAULT_BLOCKED_DOMAINS = [
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "facebook.net",
+    "connect.facebook.com",
+    "hotjar.com",
+    "clarity.ms",
+    "bat.bing.com",
+    "segment.io",
+    "scorecardresearch.com",
+    "criteo.com",
+    "taboola.com",
+    "outbrain.com",
+]
+
+# Warm sessions — see SessionStore
+SESSION_ROTATE_AFTER = 200             # Pages served from one saved storage state
+ASSET_CACHE_TYPES = ("script", "stylesheet", "font", "image")
+ASSET_CACHE_TTL = 24 * 60 * 60         # Freshness of cached assets without max-age
+_UNCACHED_HEADERS = ("content-encoding", "content-length", "transfer-encoding", "set-cookie")
+
+# Page-ready detection
+DEFAULT_READY_SELECTORS = ["main", "article", '[role="main"]']
+READY_QUIET_MS = 300          # DOM must stop mutating for this long
+READY_TIMEOUT_MS = 5000       # Give up on readiness and use fixed waits after this
+SCROLL_SETTLE_MAX_MS = 1500   # Upper bound on waiting for lazy content after scrolling
+
+# Cookie consent — button labels tried in order; learned per host into the profile
+CONSENT_LABELS = ["Accept all", "Accept", "Accept cookies", "OK", "Agree"]
+CONSENT_CONFIRM_PAGES = 3     # Pages in a row without a banner before a host is marked "none"
+
 # Default indicators — override via site profile or constructor arguments
 DEFAULT_REMOVED_INDICATORS = [
     r"page not found",
@@ -60,11 +174,17 @@ DEFAULT_REMOVED_INDICATORS = [
 class ScrapeResult:
     """Result of scraping a single item."""
     item_id: str
-    status: Literal["success", "removed", "error"]
+    status: Literal["success", "unchanged", "removed", "error"]
     html: Optional[str] = None
     error_message: Optional[str] = None
     final_url: Optional[str] = None
     bytes: int = 0
+    content_hash: Optional[str] = None   # Set when the HTML was saved
+    changed: Optional[bool] = None       # False if saved HTML was identical to the stored copy
+    fields: Optional[dict] = None        # Profile fields, with extract="fields" or "both"
+    error_kind: Optional[str] = None     # "timeout", "blocked", "incomplete" or "exception"
+    tier: Optional[str] = None           # "http" or "browser" — what fetched a success
+    retry_after: Optional[float] = None  # Seconds; set when a retry is left to the caller
 
     def __post_init__(self):
         if self.html:
@@ -85,6 +205,11 @@ def load_site_profile(profile_path: Path = Path("site-profile.json")) -> Optiona
     return None
 
 
+def save_site_profile(profile: dict, profile_path: Path = Path("site-profile.json")) -> None:
+    """Write a site profile back to disk (e.g. after the scraper learned its fetch tier)."""
+    profile_path.write_text(json.dumps(profile, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
 def _get_indicators(
     site_profile: Optional[dict],
     present_indicators: Optional[list[str]],
@@ -99,20 +224,177 @@ def _get_indicators(
     return present, removed
 
 
+# ---------------------------------------------------------------------------
+# Request blocking
+# ---------------------------------------------------------------------------
+
+@dataclass
+class ResourcePolicy:
+    """
+    Which sub-resources a page may load, enforced with route interception.
+
+    We only read pages as HTML text, so images, fonts, media and analytics
+    beacons are pure overhead. Blocking them cuts bandwidth and lets pages
+    settle much sooner. The main document is never blocked.
+
+    Domains match themselves and their subdomains ("doubleclick.net" also
+    blocks "ad.doubleclick.net"). When allow_domains is non-empty it is a
+    strict allow-list: requests to any other domain are blocked, so include
+    the site's own domain and CDNs.
+
+    Configure per site in site-profile.json:
+        "network": {
+            "block_resource_types": ["image", "media", "font"],
+            "block_domains": ["tracker.example.net"],
+            "allow_domains": []
+        }
+    """
+    block_resource_types: list[str] = field(
+        default_factory=lambda: list(DEFAULT_BLOCKED_RESOURCE_TYPES)
+    )
+    block_domains: list[str] = field(default_factory=lambda: list(DEFAULT_BLOCKED_DOMAINS))
+    allow_domains: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_profile(cls, site_profile: Optional[dict]) -> "ResourcePolicy":
+        """Build a policy from a site profile's "network" section (defaults if absent)."""
+        network = (site_profile or {}).get("network", {})
+        policy = cls()
+        if "block_resource_types" in network:
+            policy.block_resource_types = list(network["block_resource_types"])
+        if "block_domains" in network:
+            policy.block_domains = list(network["block_domains"])
+        if "allow_domains" in network:
+            policy.allow_domains = list(network["allow_domains"])
+        return policy
+
+    @property
+    def blocks_anything(self) -> bool:
+        return bool(self.block_resource_types or self.block_domains or self.allow_domains)
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """Decide whether a sub-resource request should be aborted."""
+        if resource_type in self.block_resource_types:
+            return True
+        host = urlparse(url).hostname or ""
+        if self.allow_domains and not _host_matches(host, self.allow_domains):
+            return True
+        return _host_matches(host, self.block_domains)
+
+    async def apply(self, context: BrowserContext) -> None:
+        """Install the policy on every page of a browser context."""
+        if self.blocks_anything:
+            await context.route("**/*", self._handle_route)
+
+    async def _handle_route(self, route: Route) -> None:
+        request = route.request
+        is_main_document = request.is_navigation_request() and request.frame.parent_frame is None
+        if not is_main_document and self.should_block(request.resource_type, request.url):
+            await route.abort()
+        else:
+            await route.fallback()   # On to the asset cache, if any, else the network
+
+
+def _host_matches(host: str, domains: list[str]) -> bool:
+    """True if host is one of the domains or a subdomain of one."""
+    return any(host == domain or host.endswith("." + domain) for domain in domains)
+
+
 # ---------------------------------------------------------------------------
 # Removal detection
 # ---------------------------------------------------------------------------
 
+# Markup that never renders as text: scripts, styles, templates and comments.
+# Stripped before matching so a "404" inside a JS bundle doesn't count.
+_INVISIBLE_RE = re.compile(
+    r"<(script|style|noscript|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def visible_text(html: str) -> str:
+    """Approximate the page's visible text: no scripts, styles, comments or tags."""
+    text = _INVISIBLE_RE.sub(" ", html)
+    text = _TAG_RE.sub(" ", text)
+    return _WHITESPACE_RE.sub(" ", html_lib.unescape(text))
+
+
+@dataclass(frozen=True)
+class IndicatorMatcher:
+    """
+    Present/removed indicators compiled into single-pass case-insensitive matchers.
+
+    All present indicators (literal strings) become one alternation regex and
+    the removed indicators one combined regex, so a page is scanned once per
+    kind instead of once per indicator, with no lowercased copies of the HTML.
+    Removed patterns with groups or inline flags are matched on their own,
+    since joining them would renumber backreferences or leak the flags.
+    Build with compile_indicators(), which caches per indicator set.
+    """
+    present: Optional[re.Pattern]
+    removed: tuple[re.Pattern, ...]
+
+    @property
+    def has_present_indicators(self) -> bool:
+        return self.present is not None
+
+    def found_present(self, text: str) -> bool:
+        """True if any present indicator occurs in the text."""
+        return self.present is not None and self.present.search(text) is not None
+
+    def found_removed(self, text: str) -> bool:
+        """True if any removed indicator pattern matches the text."""
+        return any(pattern.search(text) for pattern in self.removed)
+
+
+# An inline flag group, global "(?i)" or scoped "(?i:...)"
+_INLINE_FLAGS_RE = re.compile(r"(?<!\\)\(\?[aiLmsux-]+[:)]")
+
+
+@lru_cache(maxsize=64)
+def _compile_cached(present: tuple[str, ...], removed: tuple[str, ...]) -> IndicatorMatcher:
+    present_re = None
+    if present:
+        # Longest first so overlapping literals prefer the most specific one
+        literals = sorted(set(present), key=len, reverse=True)
+        present_re = re.compile("|".join(re.escape(s) for s in literals), re.IGNORECASE)
+
+    combinable, separate = [], []
+    for pattern in removed:
+        compiled = re.compile(pattern, re.IGNORECASE)
+        if compiled.groups or _INLINE_FLAGS_RE.search(pattern):
+            separate.append(compiled)
+        else:
+            combinable.append(pattern)
+    removed_res = tuple(separate)
+    if combinable:
+        combined = re.compile("|".join(f"(?:{p})" for p in combinable), re.IGNORECASE)
+        removed_res = (combined,) + removed_res
+
+    return IndicatorMatcher(present=present_re, removed=removed_res)
+
+
+def compile_indicators(present: list[str], removed: list[str]) -> IndicatorMatcher:
+    """Compile indicator lists once; repeated calls with the same lists are free."""
+    return _compile_cached(tuple(present), tuple(removed))
+
+
 def _is_removed(
-    html: str,
+    text: str,
+    html_length: int,
     final_url: str,
     item_id: str,
-    present_indicators: list[str],
-    removed_indicators: list[str],
+    matcher: IndicatorMatcher,
+    present_found: Optional[bool] = None,
 ) -> bool:
     """
     Determine if an item has been removed or is no longer available.
 
+    Matches against the page's visible text (see visible_text()). Pass
+    present_found if the caller already checked the present indicators.
+
     Strategy:
     1. Positive indicators found → item exists, not removed
     2. Redirected away from the item URL → likely removed
@@ -120,37 +402,1309 @@ def _is_removed(
     4. Page too short to be real content → removed
     5. No positive indicators defined and none found → assume removed
     """
-    html_lower = html.lower()
-
     # Positive indicators — if any match, the item is definitely present
-    for indicator in present_indicators:
-        if indicator.lower() in html_lower:
-            return False
+    if present_found is None:
+        present_found = matcher.found_present(text)
+    if present_found:
+        return False
 
     # Redirect away from item URL
     if item_id not in final_url:
         return True
 
     # Removal patterns
-    for pattern in removed_indicators:
-        if re.search(pattern, html_lower):
-            return True
+    if matcher.found_removed(text):
+        return True
 
     # Very short pages are usually error pages
-    if len(html) < 5000:
+    if html_length < 5000:
         return True
 
     # No positive indicators configured — can't confirm presence
-    if not present_indicators:
+    if not matcher.has_present_indicators:
         return False  # Give benefit of the doubt if no indicators defined
 
     return True
 
 
+# ---------------------------------------------------------------------------
+# Browser pool
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _PooledBrowser:
+    """A launched browser plus its usage counters."""
+    browser: Browser
+    pages_served: int = 0
+    active: int = 0
+    retiring: bool = False
+
+
+class BrowserPool:
+    """
+    Keeps a set of warm Chromium browsers and hands out fresh contexts.
+
+    Launching Chromium costs hundreds of milliseconds and ~150 MB per launch,
+    so the pool launches `size` browsers once and reuses them. Every call to
+    context() still gets a brand-new, isolated BrowserContext (own cookies,
+    storage and cache), so items never leak state into each other.
+
+    Browsers are recycled after `max_pages_per_browser` contexts, when their
+    process tree exceeds `max_memory_mb` (requires psutil), or when they crash.
+    A retiring browser finishes its in-flight contexts before it is closed.
+
+    Usage:
+        async with BrowserPool(size=2) as pool:
+            async with pool.context() as context:
+                page = await context.new_page()
+                ...
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        headless: bool = True,
+        max_pages_per_browser: int = 500,
+        max_memory_mb: Optional[int] = None,
+        memory_check_every: int = 25,
+        context_options: Optional[dict] = None,
+    ):
+        """
+        Args:
+            size:                   Number of browsers kept warm
+            headless:               Run browsers headlessly (default True)
+            max_pages_per_browser:  Recycle a browser after this many contexts
+            max_memory_mb:          Recycle a browser above this RSS (needs psutil)
+            memory_check_every:     Check memory every N contexts per browser
+            context_options:        Extra options for browser.new_context()
+        """
+        self.size = max(1, size)
+        self.headless = headless
+        self.max_pages_per_browser = max_pages_per_browser
+        self.max_memory_mb = max_memory_mb
+        self.memory_check_every = max(1, memory_check_every)
+        self.context_options = {
+            "user_agent": DEFAULT_USER_AGENT,
+            "viewport": DEFAULT_VIEWPORT,
+            **(context_options or {}),
+        }
+
+        self._playwright = None
+        self._slots: list[_PooledBrowser] = []
+        self._retiring: list[_PooledBrowser] = []
+        self._lock = asyncio.Lock()
+
+        if max_memory_mb is not None and psutil is None:
+            print("  BrowserPool: psutil not installed — max_memory_mb is ignored")
+
+    async def __aenter__(self) -> "BrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        """
+        Start Playwright and launch the browsers. Safe to call twice, and
+        again after a failed start: a launch that fails closes the browsers
+        already launched, so the pool is left as if never started.
+        """
+        async with self._lock:
+            if self._playwright is not None:
+                return
+            playwright = await async_playwright().start()
+            slots = []
+            try:
+                for _ in range(self.size):
+                    slots.append(await self._launch(playwright))
+            except BaseException:
+                for pooled in slots:
+                    await self._close_browser(pooled)
+                await playwright.stop()
+                raise
+            self._playwright, self._slots = playwright, slots
+
+    async def close(self) -> None:
+        """Close every browser and stop Playwright."""
+        async with self._lock:
+            for pooled in self._slots + self._retiring:
+                await self._close_browser(pooled)
+            self._slots, self._retiring = [], []
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    @asynccontextmanager
+    async def context(self, **options) -> AsyncIterator[BrowserContext]:
+        """
+        Yield a fresh BrowserContext on the least-busy browser.
+
+        Keyword arguments override the pool's context_options for this
+        context only. The context is closed when the block exits.
+        """
+        pooled = await self._checkout()
+        context = None
+        try:
+            context = await pooled.browser.new_context(**{**self.context_options, **options})
+            yield context
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass  # Browser may already be gone
+            await self._checkin(pooled)
+
+    async def stats(self) -> dict:
+        """
+        Current pool size: browsers (retiring ones included), open contexts,
+        and the browsers' resident memory in MB (None without psutil).
+        """
+        browsers = self._slots + self._retiring
+        memory_mb = None
+        if psutil is not None:
+            memory_mb = 0.0
+            for pooled in browsers:
+                if pooled.browser.is_connected():
+                    memory_mb += await self._browser_rss_mb(pooled.browser)
+        return {
+            "browsers": len(browsers),
+            "contexts": sum(pooled.active for pooled in browsers),
+            "memory_mb": memory_mb,
+        }
+
+    async def _launch(self, playwright=None) -> _PooledBrowser:
+        browser = await (playwright or self._playwright).chromium.launch(headless=self.headless)
+        return _PooledBrowser(browser=browser)
+
+    async def _close_browser(self, pooled: _PooledBrowser) -> None:
+        try:
+            await pooled.browser.close()
+        except Exception:
+            pass  # Already closed or crashed
+
+    async def _checkout(self) -> _PooledBrowser:
+        """Pick the least-busy browser, replacing it first if it needs recycling."""
+        if self._playwright is None:
+            await self.start()
+
+        async with self._lock:
+            if not self._slots:
+                raise RuntimeError("BrowserPool has no browsers — it was closed or never started")
+            index = min(range(len(self._slots)), key=lambda i: self._slots[i].active)
+            pooled = self._slots[index]
+
+            if await self._needs_recycle(pooled):
+                pooled.retiring = True
+                if pooled.active == 0:
+                    await self._close_browser(pooled)
+                else:
+                    self._retiring.append(pooled)
+                pooled = await self._launch()
+                self._slots[index] = pooled
+
+            pooled.active += 1
+            pooled.pages_served += 1
+            return pooled
+
+    async def _checkin(self, pooled: _PooledBrowser) -> None:
+        """Release a browser; close it if it was retired while in use."""
+        async with self._lock:
+            pooled.active -= 1
+            if pooled.retiring and pooled.active == 0 and pooled in self._retiring:
+                self._retiring.remove(pooled)
+                await self._close_browser(pooled)
+
+    async def _needs_recycle(self, pooled: _PooledBrowser) -> bool:
+        if not pooled.browser.is_connected():
+            return True
+        if pooled.pages_served >= self.max_pages_per_browser:
+            return True
+        if (
+            self.max_memory_mb is not None
+            and psutil is not None
+            and pooled.pages_served > 0
+            and pooled.pages_served % self.memory_check_every == 0
+        ):
+            return await self._browser_rss_mb(pooled.browser) > self.max_memory_mb
+        return False
+
+    async def _browser_rss_mb(self, browser: Browser) -> float:
+        """Resident memory of a browser's whole process tree, in MB."""
+        try:
+            session = await browser.new_browser_cdp_session()
+            info = await session.send("SystemInfo.getProcessInfo")
+            await session.detach()
+        except Exception:
+            return 0.0
+
+        total = 0
+        for process in info.get("processInfo", []):
+            try:
+                total += psutil.Process(process["id"]).memory_info().rss
+            except (psutil.Error, KeyError):
+                pass
+        return total / (1024 * 1024)
+
+
+@asynccontextmanager
+async def _pool_scope(pool: Optional[BrowserPool], **pool_kwargs) -> AsyncIterator[BrowserPool]:
+    """
+    Use the caller's pool, or own a temporary one for the duration of the
+    block. An owned pool launches its browsers on the first context() call,
+    so a batch served entirely over HTTP never starts Chromium.
+    """
+    if pool is not None:
+        yield pool
+        return
+    owned = BrowserPool(**pool_kwargs)
+    try:
+        yield owned
+    finally:
+        if owned._playwright is not None:
+            await owned.close()
+
+
+# ---------------------------------------------------------------------------
+# Warm sessions
+# ---------------------------------------------------------------------------
+
+class SessionStore:
+    """
+    Warm per-site browser sessions, shared by every context and kept across
+    runs: saved storage state (cookies and localStorage, so consent and
+    session cookies carry over) and an optional disk cache for static assets.
+
+    Each context on a host starts from the host's saved state. The state is
+    captured from the first page a cold context loads, and used for
+    rotate_after pages. Then it is dropped and the next page starts cold
+    and captures a fresh one, so a long crawl doesn't run on one ever-aging
+    session. A 403 drops the state straight away.
+
+    With cache_dir, scripts, stylesheets, fonts and images are served from
+    disk after their first fetch (route interception — Chromium's own cache
+    dies with each context). Responses marked no-store or private are not
+    kept. Others stay fresh for their max-age, or cache_ttl without one.
+
+    Configure per site in site-profile.json:
+        "session": {"rotate_after": 200, "cache": true}
+
+    Args:
+        state_dir:     Directory for the storage state files, one per host
+        cache_dir:     Directory for cached assets (None: no asset cache)
+        rotate_after:  Warm pages per saved state before starting a fresh
+                       one (0: never rotate)
+        cache_ttl:     Seconds an asset without max-age stays fresh
+    """
+
+    def __init__(
+        self,
+        state_dir: Path = OUTPUT_DIR / "sessions",
+        cache_dir: Optional[Path] = None,
+        rotate_after: int = SESSION_ROTATE_AFTER,
+        cache_ttl: float = ASSET_CACHE_TTL,
+    ):
+        self.state_dir = state_dir
+        self.cache_dir = cache_dir
+        self.rotate_after = rotate_after
+        self.cache_ttl = cache_ttl
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._states: dict[str, dict] = {}   # host → storage state
+        self._pages: dict[str, int] = {}     # host → warm pages on the current state
+        self._capturing: set[str] = set()
+
+    @classmethod
+    def from_profile(
+        cls, site_profile: Optional[dict], output_dir: Path = OUTPUT_DIR
+    ) -> Optional["SessionStore"]:
+        """A store for the profile's "session" section, or None if it has none."""
+        section = (site_profile or {}).get("session")
+        if not section:
+            return None
+        return cls(
+            state_dir=output_dir / "sessions",
+            cache_dir=output_dir / "asset-cache" if section.get("cache", True) else None,
+            rotate_after=section.get("rotate_after", SESSION_ROTATE_AFTER),
+        )
+
+    def _state_path(self, host: str) -> Path:
+        return self.state_dir / f"{host.replace(':', '_')}.json"
+
+    def context_options(self, url: str) -> dict:
+        """new_context() options that start a context from the host's saved state."""
+        host = urlparse(url).netloc
+        if host not in self._states:
+            try:
+                self._states[host] = json.loads(self._state_path(host).read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return {}
+        return {"storage_state": self._states[host]}
+
+    async def apply(self, context: BrowserContext) -> None:
+        """Install the asset cache on a context. Call before ResourcePolicy.apply."""
+        if self.cache_dir is not None:
+            await context.route("**/*", self._handle_asset)
+
+    async def page_loaded(
+        self, context: BrowserContext, url: str, http_status: Optional[int], warm: bool
+    ) -> None:
+        """
+        Account for a page rendered in `context` (warm: it started from
+        saved state). Captures state from a good cold page, rotates or drops
+        state as needed.
+        """
+        host = urlparse(url).netloc
+        if http_status == 403:
+            self._drop(host)
+            return
+        if warm:
+            self._pages[host] = self._pages.get(host, 0) + 1
+            if self.rotate_after and self._pages[host] >= self.rotate_after:
+                print(f"  Session: starting a fresh session for {host} "
+                      f"after {self._pages[host]:,} pages")
+                self._drop(host)
+        elif host not in self._states and host not in self._capturing:
+            self._capturing.add(host)
+            try:
+                state = await context.storage_state()
+                self._states[host] = state
+                self._pages[host] = 0
+                await asyncio.to_thread(_atomic_write, self._state_path(host), json.dumps(state).encode())
+            finally:
+                self._capturing.discard(host)
+
+    def _drop(self, host: str) -> None:
+        self._states.pop(host, None)
+        self._pages.pop(host, None)
+        try:
+            self._state_path(host).unlink()
+        except OSError:
+            pass
+
+    # -- Asset cache ---------------------------------------------------------
+
+    def _asset_paths(self, url: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(url.encode()).hexdigest()
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.json", directory / f"{key}.body"
+
+    def _read_asset(self, url: str) -> Optional[tuple[dict, bytes]]:
+        meta_path, body_path = self._asset_paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if meta["expires"] < time.time():
+                return None
+            return meta, body_path.read_bytes()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def _write_asset(self, url: str, status: int, headers: dict, body: bytes) -> None:
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-store" in cache_control or "private" in cache_control:
+            return
+        max_age = re.search(r"max-age=(\d+)", cache_control)
+        lifetime = int(max_age.group(1)) if max_age else self.cache_ttl
+        if lifetime <= 0:
+            return
+        meta_path, body_path = self._asset_paths(url)
+        headers = {name: value for name, value in headers.items() if name not in _UNCACHED_HEADERS}
+        _atomic_write(body_path, body)
+        # Metadata last: an entry only counts once its body is complete
+        _atomic_write(meta_path, json.dumps({
+            "url": url, "status": status, "headers": headers, "expires": time.time() + lifetime,
+        }).encode())
+
+    async def _handle_asset(self, route: Route) -> None:
+        request = route.request
+        if request.method != "GET" or request.resource_type not in ASSET_CACHE_TYPES:
+            await route.fallback()
+            return
+
+        cached = await asyncio.to_thread(self._read_asset, request.url)
+        if cached is not None:
+            self.cache_hits += 1
+            meta, body = cached
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+
+        self.cache_misses += 1
+        try:
+            response = await route.fetch()
+        except Exception:
+            await route.fallback()   # Let the browser try it itself
+            return
+        if response.status == 200:
+            body = await response.body()
+            await asyncio.to_thread(
+                self._write_asset, request.url, response.status, response.headers, body
+            )
+        await route.fulfill(response=response)
+
+
+# ---------------------------------------------------------------------------
+# HTTP fast path
+# ---------------------------------------------------------------------------
+
+FETCH_TIERS = ("auto", "http", "browser")
+TIER_SAMPLE = 20          # Successes a batch looks at before deciding a site's tier
+TIER_MIN_SHARE = 0.8      # Share of successes served over plain HTTP that means "http"
+
+
+class HttpFetcher:
+    """
+    Pooled async HTTP client for the fast path.
+
+    Keeps connections alive across items and speaks HTTP/2 when the `h2`
+    package is installed. Sends the same user agent as the browser.
+
+    Usage:
+        async with HttpFetcher() as http:
+            result = await scrape_item("item-123", url_template=..., http_client=http)
+    """
+
+    def __init__(self, max_connections: int = 20, headers: Optional[dict] = None):
+        """
+        Args:
+            max_connections:  Connections kept open across all hosts
+            headers:          Extra request headers
+        """
+        if httpx is None:
+            raise ImportError("The HTTP fast path needs: pip install httpx[http2]")
+        self.max_connections = max_connections
+        self.headers = {
+            "User-Agent": DEFAULT_USER_AGENT,
+            "Accept": "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+            **(headers or {}),
+        }
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    async def __aenter__(self) -> "HttpFetcher":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                http2=importlib.util.find_spec("h2") is not None,
+                headers=self.headers,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(
+        self, url: str, timeout_ms: int, headers: Optional[dict] = None
+    ) -> tuple[int, str, str, dict]:
+        """
+        GET a page. Returns (status, html, final_url, validators); raises
+        httpx.HTTPError.
+        """
+        await self.start()
+        response = await self._client.get(url, headers=headers, timeout=timeout_ms / 1000)
+        return (
+            response.status_code, response.text, str(response.url),
+            _response_validators(response.headers),
+        )
+
+
+@asynccontextmanager
+async def _http_scope(client: Optional[HttpFetcher]) -> AsyncIterator[Optional[HttpFetcher]]:
+    """Use the caller's HTTP client, or own a temporary one (None without httpx)."""
+    if client is not None or httpx is None:
+        yield client
+        return
+    async with HttpFetcher() as owned:
+        yield owned
+
+
+def _conditional_headers(validators: dict) -> dict:
+    """Request headers that make the server answer 304 if a page hasn't changed."""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def _response_validators(headers) -> dict:
+    """ETag / Last-Modified from response headers (any case-insensitive mapping)."""
+    validators = {"etag": headers.get("etag"), "last_modified": headers.get("last-modified")}
+    return {name: value for name, value in validators.items() if value}
+
+
+def _profile_tier(site_profile: Optional[dict]) -> str:
+    """The fetch tier recorded in a profile ("auto" if none)."""
+    tier = (site_profile or {}).get("fetch", {}).get("tier", "auto")
+    return tier if tier in FETCH_TIERS else "auto"
+
+
+def _http_has_content(
+    html: str, matcher: IndicatorMatcher, site_profile: Optional[dict]
+) -> tuple[bool, str]:
+    """
+    Whether a plain HTTP response already holds the real content.
+
+    Needs positive evidence from the profile: a present indicator in the
+    visible text or, without indicators, the main selector matching an
+    element with text. Returns (found, visible_text).
+    """
+    text = visible_text(html)
+    if matcher.has_present_indicators:
+        return bool(matcher.found_present(text)), text
+    main_selector = (site_profile or {}).get("content", {}).get("main_selector")
+    if main_selector:
+        try:
+            return selector_has_text(html, main_selector), text
+        except ImportError:
+            pass
+    return False, text
+
+
+@lru_cache(maxsize=16)
+def _extractor_cached(spec: str) -> FieldExtractor:
+    return FieldExtractor(json.loads(spec))
+
+
+def _field_extractor(site_profile: Optional[dict]) -> FieldExtractor:
+    """FieldExtractor for a profile, compiled once per distinct fields/boilerplate set."""
+    profile = site_profile or {}
+    spec = {"fields": profile.get("fields"), "boilerplate": profile.get("boilerplate")}
+    return _extractor_cached(json.dumps(spec, sort_keys=True))
+
+
+async def _try_http(
+    item_id: str,
+    url: str,
+    http_client: HttpFetcher,
+    matcher: IndicatorMatcher,
+    site_profile: Optional[dict],
+    timeout_ms: int,
+    extract: str,
+    rate_limiter: Optional["HostRateLimiter"],
+    save: bool,
+    output_dir: Path,
+    validators: Optional[dict] = None,
+    timer: Optional[ItemTimer] = None,
+) -> Optional[ScrapeResult]:
+    """
+    Fetch an item without a browser. Returns None when the browser is needed:
+    the content isn't in the server response, the request failed or was
+    blocked, or fields can't be extracted here.
+
+    With stored validators the request is conditional, and a 304 means the
+    stored HTML is still current ("unchanged").
+    """
+    timer = timer or ItemTimer(item_id, url)
+    if rate_limiter is not None:
+        with timer.phase("rate_wait"):
+            await rate_limiter.acquire(url)
+    try:
+        with timer.phase("http"):
+            http_status, html, final_url, response_validators = await http_client.fetch(
+                url, timeout_ms, headers=_conditional_headers(validators or {})
+            )
+    except httpx.HTTPError:
+        return None
+    # A 403 to a bare HTTP client says nothing about the browser — don't let it
+    # slow the host down or trip its circuit
+    if rate_limiter is not None and http_status != 403:
+        rate_limiter.record(url, http_status)
+
+    if http_status == 304:
+        return _unchanged(item_id, final_url, save, output_dir, tier="http", timer=timer)
+    if http_status == 404:
+        if save:
+            with timer.phase("save"):
+                _record_removed(item_id, output_dir)
+        return ScrapeResult(
+            item_id=item_id, status="removed", final_url=final_url, error_message="HTTP 404"
+        )
+    if http_status != 200:
+        return None
+
+    with timer.phase("match"):
+        found, text = _http_has_content(html, matcher, site_profile)
+    if not found:
+        return None
+
+    snapshot = _PageSnapshot(
+        http_status=http_status, final_url=final_url, html=html, html_length=len(html),
+        validators=response_validators,
+    )
+    if extract != "html":
+        try:
+            with timer.phase("extract"):
+                snapshot.fields = _field_extractor(site_profile).extract(html)
+        except ImportError:
+            return None
+        if extract == "fields":
+            snapshot.html, snapshot.text = None, text
+    return _success(item_id, snapshot, save, output_dir, tier="http", timer=timer)
+
+
+class _TierLearner:
+    """
+    Watches the first successes of a batch to decide a site's fetch tier:
+    "http" when nearly all came over plain HTTP, "browser" when almost none
+    did (so later items skip the probe), else "auto".
+    """
+
+    def __init__(self, sample: int = TIER_SAMPLE, min_share: float = TIER_MIN_SHARE):
+        self.sample = sample
+        self.min_share = min_share
+        self.counts = {"http": 0, "browser": 0}
+        self.decided: Optional[str] = None
+
+    def record(self, result: ScrapeResult) -> Optional[str]:
+        """Count a result; returns the tier once, when the sample is complete."""
+        if self.decided is not None or result.tier not in self.counts:
+            return None
+        self.counts[result.tier] += 1
+        if sum(self.counts.values()) < self.sample:
+            return None
+        share = self.http_share
+        if share >= self.min_share:
+            self.decided = "http"
+        elif share <= 1 - self.min_share:
+            self.decided = "browser"
+        else:
+            self.decided = "auto"
+        return self.decided
+
+    @property
+    def http_share(self) -> float:
+        total = sum(self.counts.values())
+        return self.counts["http"] / total if total else 0.0
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _HostBucket:
+    """Token bucket state for one host."""
+    rate: float
+    tokens: float
+    updated: float
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    recent: deque = field(default_factory=lambda: deque(maxlen=20))
+    consecutive_blocks: int = 0   # 403s in a row
+    trips: int = 0                # Circuit trips since the last non-403 response
+    open_until: float = 0.0       # Monotonic time until which the circuit is open
+
+
+class HostRateLimiter:
+    """
+    Token-bucket rate limiter keyed by host, with adaptive slow-down and a
+    circuit breaker.
+
+    Each host gets `rate` requests per second with bursts of up to `burst`.
+    When the share of HTTP 403 responses in the last `window` requests to a
+    host reaches `block_threshold`, that host's rate is halved (down to
+    `min_rate`). Successful responses then nudge it back towards `rate`.
+
+    After `trip_after` 403s in a row the host's circuit opens: acquire()
+    holds every request to it for `cooldown` seconds. The next response
+    decides — another 403 re-opens it for twice as long (up to
+    `max_cooldown`), anything else closes it.
+
+    Usage:
+        limiter = HostRateLimiter(rate=2, burst=4)
+        await limiter.acquire(url)          # before each request
+        limiter.record(url, http_status)    # after each response
+    """
+
+    def __init__(
+        self,
+        rate: float = 0.5,
+        burst: int = 1,
+        min_rate: float = 0.05,
+        block_threshold: float = 0.2,
+        window: int = 20,
+        recovery: float = 1.05,
+        trip_after: int = 5,
+        cooldown: float = 60.0,
+        max_cooldown: float = 900.0,
+    ):
+        """
+        Args:
+            rate:             Requests per second per host
+            burst:            Maximum requests allowed back-to-back
+            min_rate:         Floor for adaptive slow-down
+            block_threshold:  Share of 403s in the window that triggers slow-down
+            window:           Number of recent responses considered per host
+            recovery:         Rate multiplier applied after each non-403 response
+            trip_after:       Consecutive 403s that open the host's circuit
+            cooldown:         Seconds the circuit stays open on the first trip
+            max_cooldown:     Upper bound for the doubling cooldown
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.min_rate = min(min_rate, rate)
+        self.block_threshold = block_threshold
+        self.window = window
+        self.recovery = recovery
+        self.trip_after = max(1, trip_after)
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._buckets: dict[str, _HostBucket] = {}
+
+    def _bucket(self, url: str) -> _HostBucket:
+        host = urlparse(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = _HostBucket(
+                rate=self.rate,
+                tokens=float(self.burst),
+                updated=time.monotonic(),
+                recent=deque(maxlen=self.window),
+            )
+        return self._buckets[host]
+
+    def current_rate(self, url: str) -> float:
+        """Current (possibly slowed-down) rate for the URL's host."""
+        return self._bucket(url).rate
+
+    def is_open(self, url: str) -> bool:
+        """Whether requests to the URL's host are currently held by the circuit breaker."""
+        return self._bucket(url).open_until > time.monotonic()
+
+    async def acquire(self, url: str) -> None:
+        """Wait until a request to the URL's host is allowed."""
+        bucket = self._bucket(url)
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                if bucket.open_until > now:
+                    await asyncio.sleep(bucket.open_until - now)
+                    # Restart the bucket after the pause instead of releasing a burst
+                    bucket.tokens, bucket.updated = 0.0, time.monotonic()
+                    continue
+                bucket.tokens = min(
+                    float(self.burst), bucket.tokens + (now - bucket.updated) * bucket.rate
+                )
+                bucket.updated = now
+                if bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                await asyncio.sleep((1 - bucket.tokens) / bucket.rate)
+
+    def record(self, url: str, http_status: Optional[int]) -> None:
+        """Feed a response status back so the limiter can adapt."""
+        bucket = self._bucket(url)
+        blocked = http_status == 403
+        bucket.recent.append(blocked)
+
+        if blocked:
+            bucket.consecutive_blocks += 1
+            if bucket.consecutive_blocks >= self.trip_after:
+                self._trip(url, bucket)
+        else:
+            bucket.consecutive_blocks = 0
+            bucket.trips = 0
+
+        if blocked:
+            min_samples = min(5, self.window)
+            block_rate = sum(bucket.recent) / len(bucket.recent)
+            if len(bucket.recent) >= min_samples and block_rate >= self.block_threshold:
+                new_rate = max(self.min_rate, bucket.rate / 2)
+                if new_rate < bucket.rate:
+                    host = urlparse(url).netloc
+                    print(f"  {host}: {block_rate:.0%} blocked, slowing to {new_rate:.2f} req/s")
+                bucket.rate = new_rate
+                bucket.recent.clear()
+        elif bucket.rate < self.rate:
+            bucket.rate = min(self.rate, bucket.rate * self.recovery)
+
+    def _trip(self, url: str, bucket: _HostBucket) -> None:
+        """Open the host's circuit; one more 403 after the pause re-opens it."""
+        cooldown = min(self.max_cooldown, self.cooldown * 2 ** bucket.trips)
+        bucket.trips += 1
+        bucket.open_until = time.monotonic() + cooldown
+        bucket.consecutive_blocks = self.trip_after - 1
+        host = urlparse(url).netloc
+        print(f"  {host}: {self.trip_after}+ consecutive 403s, pausing requests for {cooldown:.0f}s")
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RetryPolicy:
+    """
+    How long to wait before retrying a failed attempt.
+
+    Failures are classified — "timeout" (navigation timed out), "blocked"
+    (HTTP 403) or "incomplete" (page loaded without its content) — and each
+    kind has its own base delay. The delay doubles with every attempt and is
+    randomized by ±jitter (then capped at max_delay), so items that failed
+    together don't retry together.
+
+    Usage:
+        policy = RetryPolicy(base_delays={"blocked": 30})
+        results = await scrape_multiple(ids, url_template=..., retry_policy=policy)
+    """
+    base_delays: dict[str, float] = field(default_factory=lambda: {
+        "timeout": 5.0,
+        "blocked": 15.0,
+        "incomplete": 2.0,
+    })
+    max_delay: float = 300.0
+    jitter: float = 0.5
+
+    def delay(self, kind: str, attempt: int) -> float:
+        """Seconds to wait after failed attempt number `attempt` (1-based)."""
+        base = self.base_delays.get(kind, 5.0) * 2 ** (attempt - 1)
+        return min(self.max_delay, base * random.uniform(1 - self.jitter, 1 + self.jitter))
+
+
+# ---------------------------------------------------------------------------
+# Cookie consent
+# ---------------------------------------------------------------------------
+
+# Runs inside the page. Clicks the first visible button whose text contains
+# one of the labels as whole words (case-insensitive, labels in priority order)
+# and returns that label, or null. One evaluate() instead of a locator
+# round-trip per label.
+_DISMISS_CONSENT_JS = r"""
+(labels) => {
+    const words = (text) => text.toLowerCase().split(/[^\p{L}\p{N}]+/u).filter(Boolean).join(" ");
+    const buttons = Array.from(document.querySelectorAll(
+        'button, [role="button"], input[type="button"], input[type="submit"]'
+    )).filter((el) => el.getClientRects().length > 0)
+      .map((el) => [el, ` ${words(el.innerText || el.value || "")} `]);
+    for (const label of labels) {
+        const match = buttons.find(([, text]) => text.includes(` ${words(label)} `));
+        if (match) {
+            match[0].click();
+            return label;
+        }
+    }
+    return null;
+}
+"""
+
+
+async def dismiss_consent(page: Page, labels: Optional[list[str]] = None) -> Optional[str]:
+    """Click a cookie-consent button if one is showing; returns the label clicked."""
+    try:
+        return await page.evaluate(_DISMISS_CONSENT_JS, labels or CONSENT_LABELS)
+    except Exception:
+        return None  # Page navigated away or the banner went with it
+
+
+class ConsentMemory:
+    """
+    What each host needs to get past its cookie banner, kept in the site
+    profile's "consent" section so the next run starts out knowing it:
+
+        "consent": {"shop.example.com": {"label": "Accept all"},
+                    "cdn-free.example.org": {"label": null}}
+
+    A host's label is tried first (the defaults follow in the same call, in
+    case the banner changed). A host that shows no banner on
+    CONSENT_CONFIRM_PAGES pages in a row is marked null and not checked
+    again — delete its entry to re-learn it. Pages from warm contexts don't
+    count towards that: their saved cookies keep the banner away.
+    """
+
+    def __init__(self, site_profile: Optional[dict] = None):
+        self.profile = site_profile
+        self.hosts: dict[str, Optional[str]] = {
+            host: entry.get("label")
+            for host, entry in (site_profile or {}).get("consent", {}).items()
+        }
+        self._misses: dict[str, int] = {}
+        self.changed = False   # Set when a new decision should be saved to the profile
+
+    def labels(self, host: str) -> list[str]:
+        """Labels to try on this host, or [] if it needs no consent handling."""
+        if host not in self.hosts:
+            return list(CONSENT_LABELS)
+        label = self.hosts[host]
+        if label is None:
+            return []
+        return [label] + [other for other in CONSENT_LABELS if other != label]
+
+    def record(self, host: str, clicked: Optional[str], warm: bool = False) -> None:
+        """
+        Note the outcome of a consent check on one page of this host.
+        `warm`: the page's context started from saved storage state.
+        """
+        if clicked is not None:
+            self._misses.pop(host, None)
+            if self.hosts.get(host) != clicked:
+                self._learn(host, clicked)
+        elif host not in self.hosts and not warm:
+            self._misses[host] = self._misses.get(host, 0) + 1
+            if self._misses[host] >= CONSENT_CONFIRM_PAGES:
+                self._learn(host, None)
+
+    def _learn(self, host: str, label: Optional[str]) -> None:
+        self.hosts[host] = label
+        if self.profile is not None:
+            self.profile.setdefault("consent", {})[host] = {"label": label}
+        self.changed = True
+
+
+# ---------------------------------------------------------------------------
+# Page-ready detection
+# ---------------------------------------------------------------------------
+
+# Runs inside the page. Resolves true once the DOM has been quiet for quietMs
+# and (if selectors/indicators are given) real content is present; resolves
+# false after timeoutMs. One evaluate() call instead of a polling loop over IPC.
+_WAIT_READY_JS = """
+async ({selectors, indicators, quietMs, timeoutMs}) => {
+    const start = performance.now();
+    let lastMutation = start;
+    const observer = new MutationObserver(() => { lastMutation = performance.now(); });
+    observer.observe(document.documentElement, {
+        childList: true, subtree: true, attributes: true, characterData: true,
+    });
+
+    const hasContent = () => {
+        if (!selectors.length && !indicators.length) return true;
+        for (const selector of selectors) {
+            try { if (document.querySelector(selector)) return true; } catch (e) {}
+        }
+        if (indicators.length && document.body) {
+            const text = document.body.innerText.toLowerCase();
+            return indicators.some(indicator => text.includes(indicator));
+        }
+        return false;
+    };
+
+    try {
+        return await new Promise(resolve => {
+            const tick = () => {
+                const now = performance.now();
+                if (now - lastMutation >= quietMs && hasContent()) return resolve(true);
+                if (now - start >= timeoutMs) return resolve(false);
+                setTimeout(tick, 50);
+            };
+            tick();
+        });
+    } finally {
+        observer.disconnect();
+    }
+}
+"""
+
+
+def _ready_selectors(site_profile: Optional[dict]) -> list[str]:
+    """Selectors whose presence means the page has rendered real content."""
+    profile = site_profile or {}
+    selectors = []
+    main_selector = profile.get("content", {}).get("main_selector")
+    if main_selector:
+        selectors.append(main_selector)
+    for spec in profile.get("fields", {}).values():
+        if spec.get("selector"):
+            selectors.append(spec["selector"])
+    return selectors or list(DEFAULT_READY_SELECTORS)
+
+
+async def _wait_until_ready(
+    page: Page,
+    selectors: list[str],
+    indicators: list[str],
+    quiet_ms: int = READY_QUIET_MS,
+    timeout_ms: int = READY_TIMEOUT_MS,
+) -> bool:
+    """
+    Wait until content is present and the DOM has stopped changing.
+
+    Returns False if that didn't happen within timeout_ms (or the check
+    itself failed), so the caller can fall back to fixed waits.
+    """
+    try:
+        return await page.evaluate(_WAIT_READY_JS, {
+            "selectors": selectors,
+            "indicators": [indicator.lower() for indicator in indicators],
+            "quietMs": quiet_ms,
+            "timeoutMs": timeout_ms,
+        })
+    except Exception:
+        return False
+
+
+# ---------------------------------------------------------------------------
+# In-browser field extraction
+# ---------------------------------------------------------------------------
+
+# Runs inside the page. Same field semantics as extractor.FieldExtractor:
+# first matching selector option wins, boilerplate is left out (matches inside
+# it are skipped, and a match's own boilerplate descendants are stripped from
+# a copy before reading it, like FieldExtractor's drop_tree()), text is
+# whitespace-normalized textContent, html is innerHTML. The live page is not
+# modified.
+_EXTRACT_FIELDS_JS = """
+({fields, exclude, withText}) => {
+    const protectedTags = new Set(['HTML', 'HEAD', 'BODY']);
+    const boilerplate = new Set();
+    for (const selector of exclude) {
+        try {
+            for (const el of document.querySelectorAll(selector)) {
+                if (!protectedTags.has(el.tagName)) boilerplate.add(el);
+            }
+        } catch (e) { /* Invalid selector */ }
+    }
+    const excluded = el => {
+        for (let node = el; node; node = node.parentElement) {
+            if (boilerplate.has(node)) return true;
+        }
+        return false;
+    };
+    // The element itself, or a copy without its boilerplate descendants
+    const stripped = el => {
+        const inner = Array.from(boilerplate).filter(b => el.contains(b));
+        if (!inner.length) return el;
+        const paths = inner.map(b => {
+            const path = [];
+            for (let node = b; node !== el; node = node.parentElement) {
+                path.unshift(Array.prototype.indexOf.call(node.parentElement.children, node));
+            }
+            return path;
+        });
+        const copy = el.cloneNode(true);
+        // Locate every target before removing any, so indices stay valid
+        const targets = paths.map(path => path.reduce((node, i) => node.children[i], copy));
+        for (const node of targets) node.remove();
+        return copy;
+    };
+    const value = (el, spec) => {
+        const type = spec.type || 'text';
+        if (type === 'attribute') return el.getAttribute(spec.attribute || '');
+        if (type === 'html') return stripped(el).innerHTML.trim();
+        return (stripped(el).textContent || '').replace(/\\s+/g, ' ').trim();
+    };
+
+    const record = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        record[name] = spec.multiple ? [] : null;
+        for (const option of spec.options) {
+            let matches;
+            try {
+                matches = Array.from(document.querySelectorAll(option)).filter(el => !excluded(el));
+            } catch (e) { continue; }
+            if (!matches.length) continue;
+            record[name] = spec.multiple
+                ? matches.map(el => value(el, spec)).filter(v => v !== null && v !== '')
+                : value(matches[0], spec);
+            break;
+        }
+    }
+
+    return {
+        fields: record,
+        text: withText && document.body ? document.body.innerText : null,
+        htmlLength: document.documentElement.outerHTML.length,
+    };
+}
+"""
+
+
+def _field_specs(site_profile: Optional[dict]) -> tuple[dict, list[str]]:
+    """Profile fields and boilerplate selectors, pre-split for _EXTRACT_FIELDS_JS."""
+    profile = site_profile or {}
+    fields = {
+        name: {
+            "options": split_selector_list(spec.get("selector", "")),
+            "type": spec.get("type", "text"),
+            "attribute": spec.get("attribute"),
+            "multiple": bool(spec.get("multiple")),
+        }
+        for name, spec in (profile.get("fields") or {}).items()
+    }
+    exclude = [
+        option
+        for selector in (profile.get("boilerplate") or {}).get("exclude_selectors", [])
+        for option in split_selector_list(selector)
+    ]
+    return fields, exclude
+
+
 # ---------------------------------------------------------------------------
 # Core scraping
 # ---------------------------------------------------------------------------
 
+@dataclass
+class _PageSnapshot:
+    """What _render_page captured from a loaded page."""
+    http_status: Optional[int]
+    final_url: str
+    html: Optional[str] = None     # Serialized DOM (extract="html" or "both")
+    text: Optional[str] = None     # Visible text from the browser (extract="fields")
+    html_length: int = 0           # DOM size in characters, even when html isn't transferred
+    fields: Optional[dict] = None  # Extracted fields (extract="fields" or "both")
+    validators: dict = field(default_factory=dict)   # ETag / Last-Modified of the document
+
+    @property
+    def loaded(self) -> bool:
+        return self.html is not None or self.text is not None
+
+
+async def _render_page(
+    page: Page,
+    url: str,
+    ready_selectors: list[str],
+    present_indicators: list[str],
+    timeout_ms: int,
+    extract: str = "html",
+    field_specs: Optional[tuple[dict, list[str]]] = None,
+    validators: Optional[dict] = None,
+    timer: Optional[ItemTimer] = None,
+    consent: Optional[ConsentMemory] = None,
+    warm: bool = False,
+) -> _PageSnapshot:
+    """
+    Load a page and capture it as requested by `extract`.
+
+    With validators, the main document request is made conditional (route
+    interception adds If-None-Match / If-Modified-Since to it alone).
+
+    The cookie banner is dismissed as `consent` remembers for the host
+    (skipped entirely on hosts known to have none), and the outcome is
+    recorded there. `warm` says the context started from a SessionStore's
+    saved state, where a missing banner proves nothing.
+
+    Nothing is captured (snapshot.loaded is False) when the server answered
+    304, 403 or 404 — the caller decides what that means. Raises
+    PlaywrightTimeout if navigation times out.
+    """
+    timer = timer or ItemTimer("", url)
+    conditional_headers = _conditional_headers(validators or {})
+    if conditional_headers:
+        async def add_conditional_headers(route: Route) -> None:
+            request = route.request
+            if request.is_navigation_request() and request.frame == page.main_frame:
+                await route.fallback(headers={**request.headers, **conditional_headers})
+            else:
+                await route.fallback()
+
+        await page.route(lambda request_url: request_url == url, add_conditional_headers)
+
+    with timer.phase("navigate"):
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
+    http_status = response.status if response else None
+
+    if http_status in (304, 403, 404):
+        return _PageSnapshot(http_status=http_status, final_url=page.url)
+
+    # Dismiss cookie consent; the readiness wait below covers the banner closing
+    consent = consent or ConsentMemory()
+    host = urlparse(url).netloc
+    labels = consent.labels(host)
+    if labels:
+        with timer.phase("consent"):
+            consent.record(host, await dismiss_consent(page, labels), warm=warm)
+
+    # Wait for real content and a quiet DOM
+    with timer.phase("ready"):
+        ready = await _wait_until_ready(page, ready_selectors, present_indicators)
+
+    # Scroll to load lazy content, then let the DOM settle again
+    with timer.phase("scroll"):
+        await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
+        if ready:
+            await _wait_until_ready(page, [], [], timeout_ms=SCROLL_SETTLE_MAX_MS)
+            await page.evaluate("window.scrollTo(0, 0)")
+        else:
+            # Readiness never confirmed — fall back to the fixed waits
+            await page.wait_for_timeout(1500)
+            await page.evaluate("window.scrollTo(0, 0)")
+            await page.wait_for_timeout(500)
+
+    snapshot = _PageSnapshot(
+        http_status=http_status,
+        final_url=page.url,
+        validators=_response_validators(response.headers) if response else {},
+    )
+    if extract in ("html", "both"):
+        with timer.phase("serialize"):
+            snapshot.html = await page.content()
+        snapshot.html_length = len(snapshot.html)
+    if extract in ("fields", "both"):
+        fields, exclude = field_specs
+        with timer.phase("extract"):
+            extracted = await page.evaluate(_EXTRACT_FIELDS_JS, {
+                "fields": fields,
+                "exclude": exclude,
+                "withText": snapshot.html is None,
+            })
+        snapshot.fields = extracted["fields"]
+        if snapshot.html is None:
+            snapshot.text = extracted["text"]
+            snapshot.html_length = extracted["htmlLength"]
+    return snapshot
+
+
+def _success(
+    item_id: str,
+    snapshot: _PageSnapshot,
+    save: bool,
+    output_dir: Path,
+    tier: str = "browser",
+    keep_validators: bool = True,
+    timer: Optional[ItemTimer] = None,
+) -> ScrapeResult:
+    """
+    Build a success result, saving any HTML (and noting whether it changed).
+
+    The response's validators are stored with the HTML only if
+    keep_validators — i.e. if a 304 for this document can be trusted to
+    mean the content is unchanged.
+    """
+    result = ScrapeResult(
+        item_id=item_id,
+        status="success",
+        html=snapshot.html,
+        final_url=snapshot.final_url,
+        fields=snapshot.fields,
+        tier=tier,
+    )
+    if save and snapshot.html is not None:
+        validators = snapshot.validators if keep_validators else None
+        with (timer or ItemTimer(item_id)).phase("save"):
+            saved = _save_html(item_id, snapshot.html, output_dir, validators)
+        result.content_hash = saved.content_hash
+        result.changed = saved.changed
+    return result
+
+
+def _unchanged(
+    item_id: str,
+    final_url: str,
+    save: bool,
+    output_dir: Path,
+    tier: str,
+    timer: Optional[ItemTimer] = None,
+) -> ScrapeResult:
+    """Result for a 304 — the stored HTML is still current and is not rewritten."""
+    if save:
+        with (timer or ItemTimer(item_id)).phase("save"):
+            open_store(output_dir).catalog.record_unchanged(item_id)
+    return ScrapeResult(
+        item_id=item_id, status="unchanged", final_url=final_url, changed=False, tier=tier
+    )
+
+
 async def scrape_item(
     item_id: str,
     url_template: str,
@@ -162,152 +1716,255 @@ async def scrape_item(
     max_retries: int = 3,
     save: bool = True,
     output_dir: Path = OUTPUT_DIR,
+    pool: Optional[BrowserPool] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    resource_policy: Optional[ResourcePolicy] = None,
+    extract: Literal["html", "fields", "both"] = "html",
+    retry_policy: Optional[RetryPolicy] = None,
+    first_attempt: int = 1,
+    defer_retries: bool = False,
+    fetch_tier: Optional[Literal["auto", "http", "browser"]] = None,
+    http_client: Optional[HttpFetcher] = None,
+    conditional: Optional[bool] = None,
+    timer: Optional[ItemTimer] = None,
+    metrics: Optional[Metrics] = None,
+    consent: Optional[ConsentMemory] = None,
+    session: Optional[SessionStore] = None,
 ) -> ScrapeResult:
     """
     Scrape a single item page.
 
+    Unless the fetch tier is "browser", the page is first requested with a
+    plain HTTP client (httpx). If the response already holds the content —
+    a present indicator, or the profile's main_selector with text — that is
+    the result (result.tier == "http"); otherwise the page is rendered in
+    Chromium as usual. Deferred retries always use the browser.
+
+    Re-scrapes are conditional: the ETag / Last-Modified saved with the
+    previous HTML are sent back, and a 304 returns status "unchanged"
+    without downloading or rewriting anything. Validators are kept for
+    pages fetched over plain HTTP; for browser-rendered pages only with
+    conditional=True (or "conditional": true in the profile's "fetch"
+    section), since a client-rendered page's document can stay the same
+    while its content changes.
+
+    Timeouts, 403s and incomplete pages are retried after a delay from
+    retry_policy. With defer_retries=True the delay isn't slept here:
+    the call returns an "error" result with retry_after set, and the caller
+    re-runs it later with first_attempt=<next attempt> — scrape_stream does
+    this so a failing item doesn't hold a slot while it waits.
+
+    extract="fields" evaluates the profile's field selectors inside the page
+    and returns them in result.fields without transferring the page HTML —
+    the cheap option for selective profiles. Nothing is saved in that mode
+    (removed items are still recorded in the catalog). extract="both"
+    returns fields and saves the HTML.
+
     Args:
         item_id:             ID inserted into url_template as {id}
         url_template:        URL pattern, e.g. "https://example.com/items/{id}"
         present_indicators:  Text strings confirming real content is present
         removed_indicators:  Regex patterns indicating item is gone
         site_profile:        Output from site-structure-analyzer (auto-loaded if None)
-        headless:            Run browser headlessly (default True)
+        headless:            Run browser headlessly (default True, ignored with pool)
         timeout_ms:          Page load timeout in milliseconds
-        max_retries:         Retries on 403 or timeout
-        save:                Save raw HTML to output_dir/{item_id}.html
-        output_dir:          Directory for saved HTML files
+        max_retries:         Attempts in total for timeouts, 403s and incomplete pages
+        save:                Save raw HTML to the output_dir store and record the
+                             outcome (success/removed) in its catalog
+        output_dir:          Directory for saved HTML (see html_store.py)
+        pool:                Shared BrowserPool (a temporary one is used if None)
+        rate_limiter:        Shared HostRateLimiter consulted before every attempt
+        resource_policy:     Requests to block (default: from the profile's "network"
+                             section, else images, fonts, media and trackers)
+        extract:             "html" (default), "fields" or "both"
+        retry_policy:        Backoff between attempts (default: RetryPolicy())
+        first_attempt:       Attempt number to start at (for deferred retries)
+        defer_retries:       Return retryable failures instead of sleeping
+        fetch_tier:          "auto"/"http" try plain HTTP first, "browser" skips it
+                             (default: the profile's "fetch" tier, else "auto")
+        http_client:         Shared HttpFetcher (a temporary one is used if None)
+        conditional:         Use conditional requests for browser-rendered pages too
+                             (default: the profile's "fetch" setting, else False)
+        timer:               ItemTimer to record phase timings and retries in
+                             (scrape_stream passes one per item for telemetry)
+        metrics:             Metrics to count retries and 403s in
+        consent:             Shared ConsentMemory (default: one seeded from the profile;
+                             scrape_stream shares one across the batch)
+        session:             SessionStore to start contexts warm from (default: from
+                             the profile's "session" section, else cold contexts)
     """
     if site_profile is None:
         site_profile = load_site_profile()
 
+    field_specs = None
+    if extract != "html":
+        field_specs = _field_specs(site_profile)
+        if not field_specs[0]:
+            raise ValueError(f'extract="{extract}" needs a site profile with "fields"')
+
     present, removed = _get_indicators(site_profile, present_indicators, removed_indicators)
+    matcher = compile_indicators(present, removed)
     url = url_template.format(id=item_id)
-
-    # Main selector from profile — used to wait for dynamic content
-    main_selector = (site_profile or {}).get("content", {}).get("main_selector")
-
-    for attempt in range(1, max_retries + 1):
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                ),
-                viewport={"width": 1920, "height": 1080},
+    timer = timer or ItemTimer(item_id, url)
+
+    # Main selector and field selectors from profile — used to detect a rendered page
+    ready_selectors = _ready_selectors(site_profile)
+
+    if resource_policy is None:
+        resource_policy = ResourcePolicy.from_profile(site_profile)
+    if retry_policy is None:
+        retry_policy = RetryPolicy()
+    if fetch_tier is None:
+        fetch_tier = _profile_tier(site_profile)
+    if conditional is None:
+        conditional = bool((site_profile or {}).get("fetch", {}).get("conditional", False))
+    if consent is None:
+        consent = ConsentMemory(site_profile)
+    if session is None:
+        session = SessionStore.from_profile(site_profile, output_dir)
+    validators = _stored_validators(item_id, output_dir) if save else {}
+
+    if fetch_tier != "browser" and httpx is not None and first_attempt == 1:
+        async with _http_scope(http_client) as http_client:
+            result = await _try_http(
+                item_id, url, http_client, matcher, site_profile, timeout_ms,
+                extract, rate_limiter, save, output_dir, validators, timer,
             )
-            page = await context.new_page()
+        if result is not None:
+            # The probe was the item's only try; otherwise it is just the http phase
+            timer.attempt()
+            return result
+
+    async with _pool_scope(pool, headless=headless) as pool:
+        for attempt in range(first_attempt, max_retries + 1):
+            retry_kind = retry_reason = None
+            timer.attempt()
+            if rate_limiter is not None:
+                with timer.phase("rate_wait"):
+                    await rate_limiter.acquire(url)
+
+            acquire_started = time.perf_counter()
+            context_options = session.context_options(url) if session is not None else {}
+            async with pool.context(**context_options) as context:
+                if session is not None:
+                    await session.apply(context)   # Before the policy, which runs first
+                await resource_policy.apply(context)
+                page = await context.new_page()
+                timer.add("acquire", time.perf_counter() - acquire_started)
+                try:
+                    snapshot = await _render_page(
+                        page, url, ready_selectors, present, timeout_ms, extract, field_specs,
+                        validators if conditional else None, timer, consent,
+                        warm=bool(context_options),
+                    )
+                    if rate_limiter is not None:
+                        rate_limiter.record(url, snapshot.http_status)
+                    if session is not None and (snapshot.loaded or snapshot.http_status == 403):
+                        with timer.phase("session"):
+                            await session.page_loaded(
+                                context, url, snapshot.http_status, warm=bool(context_options)
+                            )
+                except PlaywrightTimeout:
+                    if attempt >= max_retries:
+                        return ScrapeResult(
+                            item_id=item_id,
+                            status="error",
+                            error_message=f"Timeout after {max_retries} attempts",
+                            error_kind="timeout",
+                        )
+                    retry_kind, retry_reason = "timeout", "Timeout"
+                except Exception as e:
+                    return ScrapeResult(
+                        item_id=item_id, status="error", error_message=str(e), error_kind="exception"
+                    )
 
-            try:
-                response = await page.goto(url, wait_until="networkidle", timeout=timeout_ms)
-                http_status = response.status if response else None
+            if retry_reason is None:
+                # 304 — stored HTML is still current
+                if snapshot.http_status == 304:
+                    return _unchanged(
+                        item_id, snapshot.final_url, save, output_dir, tier="browser", timer=timer
+                    )
 
                 # 404 — definitively removed
-                if http_status == 404:
-                    await browser.close()
+                if snapshot.http_status == 404:
+                    if save:
+                        with timer.phase("save"):
+                            _record_removed(item_id, output_dir)
                     return ScrapeResult(
                         item_id=item_id,
                         status="removed",
-                        final_url=page.url,
+                        final_url=snapshot.final_url,
                         error_message="HTTP 404",
                     )
 
                 # 403 — retry with backoff
-                if http_status == 403:
-                    await browser.close()
-                    if attempt < max_retries:
-                        delay = attempt * 5
-                        print(f"  HTTP 403 (attempt {attempt}/{max_retries}), retrying in {delay}s...")
-                        await asyncio.sleep(delay)
-                        continue
-                    return ScrapeResult(
-                        item_id=item_id,
-                        status="error",
-                        error_message=f"HTTP 403 after {max_retries} attempts",
-                    )
-
-                # Dismiss cookie consent
-                for label in ["Accept all", "Accept", "Accept cookies", "OK", "Agree"]:
-                    try:
-                        btn = page.locator(f'button:has-text("{label}")')
-                        if await btn.count() > 0:
-                            await btn.first.click()
-                            await page.wait_for_timeout(500)
-                            break
-                    except Exception:
-                        pass
-
-                # Wait for main content
-                wait_selector = main_selector or 'main, article, [role="main"]'
-                try:
-                    await page.wait_for_selector(wait_selector, timeout=5000)
-                except Exception:
-                    pass  # Continue anyway — selector may not exist on this page
-
-                # Scroll to load lazy content
-                await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
-                await page.wait_for_timeout(1500)
-                await page.evaluate("window.scrollTo(0, 0)")
-                await page.wait_for_timeout(500)
-
-                html = await page.content()
-                final_url = page.url
-                await browser.close()
+                if snapshot.http_status == 403:
+                    if metrics is not None:
+                        metrics.inc("scrape_blocked_total", host=timer.host)
+                    if attempt >= max_retries:
+                        return ScrapeResult(
+                            item_id=item_id,
+                            status="error",
+                            error_message=f"HTTP 403 after {max_retries} attempts",
+                            error_kind="blocked",
+                        )
+                    retry_kind, retry_reason = "blocked", "HTTP 403"
 
+            if retry_reason is None:
                 # Positive indicator found — confirmed success
-                for indicator in present:
-                    if indicator.lower() in html.lower():
-                        result = ScrapeResult(
-                            item_id=item_id, status="success", html=html, final_url=final_url
-                        )
-                        if save:
-                            _save_html(item_id, html, output_dir)
-                        return result
+                with timer.phase("match"):
+                    text = snapshot.text if snapshot.text is not None else visible_text(snapshot.html)
+                    present_found = matcher.found_present(text)
+                if present_found:
+                    return _success(
+                        item_id, snapshot, save, output_dir,
+                        keep_validators=conditional, timer=timer,
+                    )
 
                 # Page seems incomplete — retry
-                if len(html) < 50000 and attempt < max_retries:
-                    delay = attempt * 5
-                    print(
-                        f"  Incomplete page (attempt {attempt}/{max_retries}, "
-                        f"{len(html):,} bytes), retrying in {delay}s..."
-                    )
-                    await asyncio.sleep(delay)
-                    continue
+                if snapshot.html_length < 50000 and attempt < max_retries:
+                    retry_kind = "incomplete"
+                    retry_reason = f"Incomplete page ({snapshot.html_length:,} bytes)"
 
+            if retry_reason is None:
                 # Check for removal
-                if _is_removed(html, final_url, item_id, present, removed):
+                with timer.phase("match"):
+                    removed_found = _is_removed(
+                        text, snapshot.html_length, snapshot.final_url, item_id, matcher,
+                        present_found,
+                    )
+                if removed_found:
+                    if save:
+                        with timer.phase("save"):
+                            _record_removed(item_id, output_dir)
                     return ScrapeResult(
                         item_id=item_id,
                         status="removed",
-                        html=html,
-                        final_url=final_url,
+                        html=snapshot.html,
+                        final_url=snapshot.final_url,
                         error_message="Item appears to be removed or unavailable",
                     )
 
-                result = ScrapeResult(
-                    item_id=item_id, status="success", html=html, final_url=final_url
+                return _success(
+                    item_id, snapshot, save, output_dir, keep_validators=conditional, timer=timer
                 )
-                if save:
-                    _save_html(item_id, html, output_dir)
-                return result
-
-            except PlaywrightTimeout:
-                await browser.close()
-                if attempt < max_retries:
-                    delay = attempt * 5
-                    print(f"  Timeout (attempt {attempt}/{max_retries}), retrying in {delay}s...")
-                    await asyncio.sleep(delay)
-                    continue
+
+            timer.retry(retry_kind)
+            if metrics is not None:
+                metrics.inc("scrape_retries_total", host=timer.host, kind=retry_kind)
+            delay = retry_policy.delay(retry_kind, attempt)
+            print(f"  {item_id}: {retry_reason} (attempt {attempt}/{max_retries}), "
+                  f"retrying in {delay:.1f}s...")
+            if defer_retries:
                 return ScrapeResult(
                     item_id=item_id,
                     status="error",
-                    error_message=f"Timeout after {max_retries} attempts",
+                    error_message=retry_reason,
+                    error_kind=retry_kind,
+                    retry_after=delay,
                 )
-            except Exception as e:
-                await browser.close()
-                return ScrapeResult(item_id=item_id, status="error", error_message=str(e))
+            # Back off outside the browser context so the pool slot is free meanwhile
+            await asyncio.sleep(delay)
 
     return ScrapeResult(item_id=item_id, status="error", error_message="Max retries exceeded")
 
@@ -328,68 +1985,675 @@ def scrape_sync(item_id: str, url_template: str, **kwargs) -> ScrapeResult:
     return asyncio.run(scrape_item(item_id, url_template, **kwargs))
 
 
+async def scrape_stream(
+    item_ids: Optional[Iterable[str]],
+    url_template: str,
+    delay_ms: int = 2000,
+    concurrency: int = 1,
+    rate_limit: Optional[float] = None,
+    burst: int = 1,
+    pool: Optional[BrowserPool] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
+    keep_html: bool = True,
+    queue: Optional[JobQueue] = None,
+    telemetry: Optional[Telemetry] = None,
+    metrics: Optional[Metrics] = None,
+    **kwargs,
+) -> AsyncIterator[ScrapeResult]:
+    """
+    Scrape items concurrently and yield each result as soon as it finishes.
+
+    Results arrive in completion order, not input order. At most
+    `concurrency` items are in flight, and new items are only started as
+    results are consumed, so memory stays proportional to `concurrency`
+    rather than to the number of items. item_ids may be any iterable,
+    including a lazy generator. An item that needs a retry gives up its
+    slot while it waits out its backoff (see RetryPolicy), so healthy items
+    keep flowing; it is retried as soon as its delay is over.
+
+    With keep_html=False the HTML is still saved to disk (unless save=False
+    is passed through) but dropped from each result before it is yielded.
+
+    With a JobQueue, item_ids (if not None) are enqueued and items are then
+    claimed from the queue instead: each outcome is recorded as it arrives,
+    errors come back after the queue's retry delay (an item may be yielded
+    more than once), and the stream ends when nothing is left pending.
+    A restarted run skips everything already finished or known removed, and
+    several processes can consume the same queue.
+
+    If you may stop iterating early, close the stream explicitly so
+    in-flight pages are cancelled, their claims released and browsers
+    shut down:
+
+        async with contextlib.aclosing(scrape_stream(ids, ...)) as stream:
+            async for result in stream:
+                ...
+
+    Args:
+        item_ids:      Item IDs to scrape (any iterable; None with a queue
+                       to work through what is already queued)
+        url_template:  URL pattern with {id} placeholder
+        delay_ms:      Polite spacing between requests per host, used when
+                       rate_limit is not given (default 2000)
+        concurrency:   Maximum pages in flight (default 1 — sequential)
+        rate_limit:    Requests per second per host (overrides delay_ms)
+        burst:         Requests allowed back-to-back per host (default 1)
+        pool:          Shared BrowserPool (one browser per 4 pages if None)
+        rate_limiter:  Shared HostRateLimiter (overrides rate_limit/burst)
+        keep_html:     Keep HTML on yielded results (default True)
+        queue:         Durable JobQueue to claim items from and record outcomes in
+        telemetry:     Telemetry to record each item's phase timings and retries in
+        metrics:       Live Metrics to update (its endpoint is started here if
+                       it has a port; closing it is up to the caller)
+        **kwargs:      Passed through to scrape_item
+    """
+    # Load site profile once and share across all scrapes
+    profile_from_file = kwargs.get("site_profile") is None
+    profile = kwargs.pop("site_profile", None) or load_site_profile()
+
+    # Learn whether this site needs the browser, unless that is already known
+    tiers = None
+    if httpx is not None and kwargs.get("fetch_tier") is None and _profile_tier(profile) == "auto":
+        tiers = _TierLearner()
+
+    # Consent buttons learned on the first pages of each host are kept in the profile
+    consent = kwargs.pop("consent", None) or ConsentMemory(profile)
+    # One set of warm sessions for the whole batch
+    session = kwargs.pop("session", None) or SessionStore.from_profile(
+        profile, kwargs.get("output_dir", OUTPUT_DIR)
+    )
+
+    if rate_limiter is None:
+        if rate_limit is None and delay_ms > 0:
+            rate_limit = 1000 / delay_ms
+        if rate_limit:
+            rate_limiter = HostRateLimiter(rate=rate_limit, burst=burst)
+
+    if queue is not None:
+        if item_ids is not None:
+            queue.add(item_ids)
+        take = queue.claim
+    else:
+        pending = iter(item_ids)
+        take = lambda count: list(itertools.islice(pending, count))
+
+    concurrency = max(1, concurrency)
+    in_flight: dict[asyncio.Task, tuple[int, ItemTimer]] = {}   # task → (attempt, timer)
+    deferred: list[tuple] = []   # heap of (due, seq, item_id, attempt, timer)
+    sequence = itertools.count()
+
+    pool_scope = _pool_scope(pool, size=(concurrency + 3) // 4, headless=kwargs.get("headless", True))
+    http_scope = _http_scope(kwargs.pop("http_client", None))
+    async with pool_scope as pool, http_scope as http_client:
+
+        def start(item_id: str, attempt: int, timer: Optional[ItemTimer] = None) -> None:
+            # One timer per item, carried across its deferred retries
+            timer = timer or ItemTimer(item_id, url_template.format(id=item_id))
+            in_flight[asyncio.create_task(scrape_item(
+                item_id, url_template, site_profile=profile, pool=pool,
+                rate_limiter=rate_limiter, first_attempt=attempt, defer_retries=True,
+                http_client=http_client, timer=timer, metrics=metrics, consent=consent,
+                session=session, **kwargs,
+            ), name=item_id)] = (attempt, timer)
+
+        def learn_tier(result: ScrapeResult) -> None:
+            tier = tiers.record(result)
+            if tier is None:
+                return
+            print(f"  Fetch tier: {tier} ({tiers.http_share:.0%} of the first "
+                  f"{tiers.sample} pages served without a browser)")
+            if tier == "browser":
+                kwargs["fetch_tier"] = "browser"
+            if profile:
+                # Update in place: the section also holds settings like "conditional"
+                profile.setdefault("fetch", {}).update(
+                    tier=tier,
+                    http_share=round(tiers.http_share, 2),
+                    decided_at=datetime.now().isoformat(timespec="seconds"),
+                )
+                if profile_from_file:
+                    save_site_profile(profile)
+
+        def refill() -> None:
+            # Retries that are due go first, then new items
+            now = time.monotonic()
+            while deferred and deferred[0][0] <= now and len(in_flight) < concurrency:
+                _, _, item_id, attempt, timer = heapq.heappop(deferred)
+                start(item_id, attempt, timer)
+            if len(in_flight) < concurrency:
+                for item_id in take(concurrency - len(in_flight)):
+                    start(item_id, 1)
+            if metrics is not None:
+                metrics.set("scrape_in_flight", len(in_flight))
+                metrics.set("scrape_retry_backlog", len(deferred))
+
+        async def sample_metrics() -> None:
+            while True:
+                try:
+                    await metrics.collect(pool, queue)
+                except Exception as e:
+                    print(f"  Metrics: sampling failed ({e})")
+                await asyncio.sleep(metrics.interval)
+
+        sampler = None
+        if metrics is not None:
+            metrics.start()
+            sampler = asyncio.create_task(sample_metrics())
+
+        try:
+            refill()
+            while True:
+                next_retry = deferred[0][0] - time.monotonic() if deferred else None
+                if not in_flight:
+                    if next_retry is None:
+                        # Only queued retries that aren't due yet can be left
+                        next_retry = queue.next_due() if queue is not None else None
+                        if next_retry is None:
+                            break
+                    await asyncio.sleep(max(0.0, next_retry))
+                    refill()
+                    continue
+
+                # Wake up for a due retry even if every page in flight is still loading
+                done, _ = await asyncio.wait(
+                    in_flight,
+                    timeout=None if next_retry is None else max(0.0, next_retry),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                results = []
+                for task in done:
+                    attempt, timer = in_flight.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        # Setup outside scrape_item's own handling (context, routes,
+                        # new page) failed — one item's error, not the batch's
+                        result = ScrapeResult(
+                            item_id=task.get_name(),
+                            status="error",
+                            error_message=f"{type(e).__name__}: {e}",
+                            error_kind="exception",
+                        )
+                    if result.retry_after is not None:
+                        # Wait outside the pool so the slot goes to another item
+                        heapq.heappush(deferred, (
+                            time.monotonic() + result.retry_after, next(sequence),
+                            result.item_id, attempt + 1, timer,
+                        ))
+                        continue
+                    results.append(result)
+                    if metrics is not None:
+                        metrics.inc("scrape_results_total", host=timer.host, status=result.status)
+                    if telemetry is not None:
+                        telemetry.record(timer, result)
+                    if tiers is not None:
+                        learn_tier(result)
+                if consent.changed:
+                    consent.changed = False
+                    if profile_from_file and profile:
+                        save_site_profile(profile)
+                if queue is not None:
+                    for result in results:
+                        queue.complete(result.item_id, result.status, result.error_message)
+                # Start replacements before yielding so pages keep loading
+                # while the caller processes these results
+                refill()
+                for result in results:
+                    if not keep_html:
+                        result.html = None
+                    yield result
+        finally:
+            for task in in_flight:
+                task.cancel()
+            await asyncio.gather(*in_flight, return_exceptions=True)
+            if queue is not None:
+                queue.release(
+                    [task.get_name() for task in in_flight] + [entry[2] for entry in deferred]
+                )
+            if sampler is not None:
+                sampler.cancel()
+                await asyncio.gather(sampler, return_exceptions=True)
+                metrics.set("scrape_in_flight", 0)
+                metrics.set("scrape_retry_backlog", 0)
+                await metrics.collect(pool, queue)
+
+
 async def scrape_multiple(
     item_ids: list[str],
     url_template: str,
     delay_ms: int = 2000,
+    concurrency: int = 1,
+    rate_limit: Optional[float] = None,
+    burst: int = 1,
     **kwargs,
 ) -> dict[str, ScrapeResult]:
     """
-    Scrape multiple items with a polite delay between requests.
+    Scrape multiple items with bounded concurrency and per-host rate limiting.
+
+    Up to `concurrency` pages are in flight at once, sharing one BrowserPool.
+    Requests to each host are spaced by a token bucket: `rate_limit` requests
+    per second (default: one per `delay_ms`) with bursts of up to `burst`.
+    The limiter slows a host down automatically when 403s start to spike.
+
+    Collects scrape_stream() into a dict; use scrape_stream directly for
+    large batches where holding every result in memory is too costly.
+
+    Pass queue=JobQueue(...) to make the batch resumable: after a crash or
+    Ctrl-C the same call picks up where it stopped, and only items
+    scraped in this run are returned.
+
+    Prints a telemetry summary at the end (phase latency percentiles,
+    retries, per-host throughput). Pass telemetry=Telemetry(jsonl_path=...)
+    to also get one JSON line per item, or to keep the aggregates.
+
+    For live numbers while the batch runs, pass metrics=Metrics(port=...)
+    and/or Metrics(textfile=...) — see metrics.py. The endpoint is stopped
+    when the batch ends.
 
     Args:
         item_ids:      List of item IDs
         url_template:  URL pattern with {id} placeholder
-        delay_ms:      Delay between requests in milliseconds (default 2000)
-        **kwargs:      Passed through to scrape_item
+        delay_ms:      Polite spacing between requests per host, used when
+                       rate_limit is not given (default 2000)
+        concurrency:   Maximum pages in flight (default 1 — sequential)
+        rate_limit:    Requests per second per host (overrides delay_ms)
+        burst:         Requests allowed back-to-back per host (default 1)
+        **kwargs:      Passed through to scrape_stream / scrape_item
+                       (pool, rate_limiter, queue, telemetry, metrics, keep_html,
+                       save, ...)
+
+    Returns:
+        Results keyed by item ID, in the order of item_ids.
     """
-    # Load site profile once and share across all scrapes
-    profile = kwargs.pop("site_profile", None) or load_site_profile()
-    results = {}
+    results: dict[str, ScrapeResult] = {}
+    total = len(item_ids)
+
+    kwargs["telemetry"] = telemetry = kwargs.get("telemetry") or Telemetry()
+    stream_ids = item_ids
+    queue = kwargs.get("queue")
+    if queue is not None:
+        # Items finished in an earlier run stay finished and aren't re-scraped
+        queue.add(item_ids)
+        counts = queue.counts()
+        total = counts["pending"] + counts["in_flight"]
+        stream_ids = None
+
+    try:
+        async for result in scrape_stream(
+            stream_ids, url_template, delay_ms=delay_ms, concurrency=concurrency,
+            rate_limit=rate_limit, burst=burst, **kwargs,
+        ):
+            results[result.item_id] = result
+            _print_result(result, len(results), total)
+    finally:
+        if kwargs.get("metrics") is not None:
+            kwargs["metrics"].close()
+
+    telemetry.close()
+    print(telemetry.summary())
+    return {item_id: results[item_id] for item_id in item_ids if item_id in results}
+
+
+def _print_result(result: ScrapeResult, done: int, total: int, prefix: str = "") -> None:
+    """One progress line per finished item."""
+    prefix = f"{prefix}[{done}/{total}] {result.item_id}"
+    if result.status == "success" and result.html is None and result.fields is not None:
+        print(f"  ✓ {prefix}  success  {len(result.fields)} fields")
+    elif result.status == "success":
+        print(f"  ✓ {prefix}  success  {result.bytes:,} bytes")
+    elif result.status == "unchanged":
+        print(f"  = {prefix}  unchanged (304)")
+    elif result.status == "removed":
+        print(f"  ✗ {prefix}  removed  {result.error_message}")
+    else:
+        print(f"  ! {prefix}  error    {result.error_message}")
+
 
-    for i, item_id in enumerate(item_ids):
-        print(f"Scraping {item_id} ({i + 1}/{len(item_ids)})...")
-        result = await scrape_item(item_id, url_template, site_profile=profile, **kwargs)
-        results[item_id] = result
+# ---------------------------------------------------------------------------
+# Recrawling
+# ---------------------------------------------------------------------------
+
+@dataclass
+class RecrawlReport:
+    """Outcome counts for a recrawl run."""
+    planned: int = 0
+    new: int = 0
+    changed: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    error: int = 0
+    changed_ids: list[str] = field(default_factory=list)
+
+    def summary(self) -> str:
+        return (
+            f"{self.planned:,} planned: {self.new:,} new, {self.changed:,} changed, "
+            f"{self.unchanged:,} unchanged, {self.removed:,} removed, {self.error:,} error"
+        )
+
+
+async def recrawl(
+    url_template: str,
+    item_ids: Optional[Iterable[str]] = None,
+    policy: Optional[FreshnessPolicy] = None,
+    limit: Optional[int] = None,
+    output_dir: Path = OUTPUT_DIR,
+    **kwargs,
+) -> RecrawlReport:
+    """
+    Re-scrape the items that are due under a freshness policy and report what changed.
 
-        if result.status == "success":
-            print(f"  ✓ success  {result.bytes:,} bytes")
-        elif result.status == "removed":
-            print(f"  ✗ removed  {result.error_message}")
+    Planning uses the catalog only (no page loads): never-scraped IDs first,
+    then stored items by how overdue they are, where items that changed often
+    in the past fall due sooner and removed items are re-checked rarely.
+    Pages whose HTML hash matches the stored copy are not rewritten, and
+    pages the server reports as not modified (304) aren't even downloaded.
+
+    Args:
+        url_template:  URL pattern with {id} placeholder
+        item_ids:      Candidate IDs (default: everything in the catalog)
+        policy:        FreshnessPolicy (default: 7-day max age)
+        limit:         Scrape at most this many items this run
+        output_dir:    Directory for saved HTML
+        **kwargs:      Passed through to scrape_stream (concurrency, rate_limit,
+                       telemetry, ...)
+    """
+    catalog = open_store(output_dir).catalog
+    planned = catalog.plan_recrawl(policy, item_ids=item_ids, limit=limit)
+    report = RecrawlReport(planned=len(planned))
+    print(f"Recrawl: {len(planned):,} items due")
+
+    # Change detection needs the HTML saved, so save=False is not honoured here
+    kwargs.pop("save", None)
+
+    done = 0
+    async for result in scrape_stream(
+        planned, url_template, output_dir=output_dir, keep_html=False, **kwargs
+    ):
+        done += 1
+        if result.status == "removed":
+            report.removed += 1
+        elif result.status == "error":
+            report.error += 1
+        elif result.status == "unchanged" or not result.changed:
+            report.unchanged += 1
+        elif catalog.get(result.item_id).checks == 1:
+            report.new += 1
         else:
-            print(f"  ! error    {result.error_message}")
+            report.changed += 1
+            report.changed_ids.append(result.item_id)
+        _print_result(result, done, report.planned)
+
+    print(f"Recrawl done — {report.summary()}")
+    if kwargs.get("telemetry") is not None:
+        kwargs["telemetry"].close()
+        print(kwargs["telemetry"].summary())
+    return report
+
+
+# ---------------------------------------------------------------------------
+# Multi-process scraping
+# ---------------------------------------------------------------------------
+
+@dataclass
+class WorkerStats:
+    """What one scrape_parallel worker process did."""
+    worker: int
+    items: int = 0
+    success: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    error: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+
+    def add(self, result: ScrapeResult) -> None:
+        self.items += 1
+        setattr(self, result.status, getattr(self, result.status) + 1)
+        self.bytes += result.bytes
+
+
+@dataclass
+class ParallelReport:
+    """Merged outcome of scrape_parallel."""
+    results: dict[str, ScrapeResult] = field(default_factory=dict)
+    workers: list[WorkerStats] = field(default_factory=list)
+    telemetry: Telemetry = field(default_factory=Telemetry)   # Merged over all workers
+    seconds: float = 0.0
+
+    def total(self, name: str) -> int:
+        """Sum of one WorkerStats counter over all workers."""
+        return sum(getattr(stats, name) for stats in self.workers)
+
+    def summary(self) -> str:
+        items = self.total("items")
+        rate = items / self.seconds if self.seconds else 0.0
+        return (
+            f"{items:,} items in {self.seconds:,.0f}s ({rate:,.1f}/s) across "
+            f"{len(self.workers)} processes: {self.total('success'):,} success, "
+            f"{self.total('unchanged'):,} unchanged, {self.total('removed'):,} removed, "
+            f"{self.total('error'):,} error, "
+            f"{self.total('bytes') / (1024 * 1024):,.1f} MB"
+        )
+
+
+def _parallel_worker(
+    worker: int,
+    item_ids: Optional[list[str]],
+    url_template: str,
+    concurrency: int,
+    rate_limit: Optional[float],
+    burst: int,
+    queue_options: Optional[dict],
+    kwargs: dict,
+) -> tuple[list[ScrapeResult], WorkerStats, Telemetry]:
+    """Entry point of a scrape_parallel worker process: one event loop, one pool."""
+    return asyncio.run(_run_worker(
+        worker, item_ids, url_template, concurrency, rate_limit, burst, queue_options, kwargs
+    ))
+
+
+async def _run_worker(
+    worker: int,
+    item_ids: Optional[list[str]],
+    url_template: str,
+    concurrency: int,
+    rate_limit: Optional[float],
+    burst: int,
+    queue_options: Optional[dict],
+    kwargs: dict,
+) -> tuple[list[ScrapeResult], WorkerStats, Telemetry]:
+    stats = WorkerStats(worker=worker)
+    telemetry = kwargs["telemetry"]
+    queue = JobQueue(**queue_options) if queue_options else None
+    total = len(item_ids) if item_ids is not None else queue.counts()["pending"]
+    results = []
+    started = time.monotonic()
+    async for result in scrape_stream(
+        item_ids, url_template, delay_ms=0, concurrency=concurrency,
+        rate_limit=rate_limit, burst=burst, queue=queue, keep_html=False, **kwargs,
+    ):
+        results.append(result)
+        stats.add(result)
+        _print_result(result, stats.items, total, prefix=f"w{worker} ")
+    stats.seconds = time.monotonic() - started
+    telemetry.close()
+    if kwargs.get("metrics") is not None:
+        kwargs["metrics"].close()
+    if queue is not None:
+        queue.close()
+    return results, stats, telemetry
+
+
+def scrape_parallel(
+    item_ids: Iterable[str],
+    url_template: str,
+    processes: Optional[int] = None,
+    concurrency: int = 8,
+    delay_ms: int = 2000,
+    rate_limit: Optional[float] = None,
+    burst: int = 1,
+    queue: Optional[JobQueue] = None,
+    telemetry: Optional[Telemetry] = None,
+    metrics: Optional[Metrics] = None,
+    **kwargs,
+) -> ParallelReport:
+    """
+    Scrape items across several worker processes and merge their results.
 
-        if i < len(item_ids) - 1:
-            await asyncio.sleep(delay_ms / 1000)
+    Each worker runs its own event loop and BrowserPool, so page handling,
+    removal checks and saving HTML use as many cores as there are workers.
+    Items are split round-robin into one shard per worker, or — with a
+    JobQueue — every worker claims from the shared queue until it is empty,
+    which balances uneven shards and makes the run resumable.
 
-    return results
+    The per-host rate limit is divided between the workers, so the combined
+    request rate to each host matches what scrape_multiple would send.
+    Results come back without HTML (it is saved to disk by the workers).
+
+    Workers are started with the "spawn" method, so call this from under
+    an `if __name__ == "__main__":` guard in scripts.
+
+    Args:
+        item_ids:      Item IDs to scrape
+        url_template:  URL pattern with {id} placeholder
+        processes:     Worker processes (default: one per 4 cores — each
+                       worker's Chromium needs CPU too)
+        concurrency:   Pages in flight per worker (default 8)
+        delay_ms:      Polite spacing between requests per host, used when
+                       rate_limit is not given (default 2000)
+        rate_limit:    Total requests per second per host, all workers together
+        burst:         Total requests allowed back-to-back per host
+        queue:         JobQueue shared by the workers (reopened in each one)
+        telemetry:     Telemetry to merge the workers' timings into; its JSONL
+                       file (if any) is appended to by every worker
+        metrics:       Live Metrics settings; each worker serves its own (next
+                       port up, own textfile, labelled worker="N")
+        **kwargs:      Passed through to scrape_item (must be picklable —
+                       no pool, rate_limiter or http_client)
+
+    Returns:
+        ParallelReport with results keyed by item ID in the order of
+        item_ids, per-worker stats, merged telemetry and a summary().
+    """
+    for name in ("pool", "rate_limiter", "http_client"):
+        if kwargs.get(name) is not None:
+            raise ValueError(f"{name} can't be shared between processes")
+        kwargs.pop(name, None)
+
+    item_ids = list(item_ids)
+    processes = max(1, processes or (os.cpu_count() or 1) // 4)
+    if queue is None:
+        processes = max(1, min(processes, len(item_ids)))
+    kwargs["site_profile"] = kwargs.get("site_profile") or load_site_profile()
+    # Every worker starts from an empty copy; their aggregates are merged back below
+    telemetry = telemetry or Telemetry()
+    kwargs["telemetry"] = Telemetry(jsonl_path=telemetry.jsonl_path)
+
+    if rate_limit is None and delay_ms > 0:
+        rate_limit = 1000 / delay_ms
+    worker_rate = rate_limit / processes if rate_limit else None
+    worker_burst = max(1, burst // processes)
+
+    if queue is not None:
+        queue.add(item_ids)
+        queue_options = {
+            "path": queue.path,
+            "lease_seconds": queue.lease_seconds,
+            "max_attempts": queue.max_attempts,
+            "retry_delay_seconds": queue.retry_delay_seconds,
+        }
+        shards = [None] * processes
+    else:
+        queue_options = None
+        shards = [item_ids[worker::processes] for worker in range(processes)]
+
+    print(f"Scraping {len(item_ids):,} items with {processes} processes × {concurrency} pages")
+    report = ParallelReport(telemetry=telemetry)
+    merged: dict[str, ScrapeResult] = {}
+    started = time.monotonic()
+
+    # spawn: each worker starts its own Playwright and opens its own SQLite connections
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=processes, mp_context=context) as executor:
+        futures = [
+            executor.submit(
+                _parallel_worker, worker, shard, url_template, concurrency,
+                worker_rate, worker_burst, queue_options,
+                {**kwargs, "metrics": metrics.for_worker(worker)} if metrics else kwargs,
+            )
+            for worker, shard in enumerate(shards)
+        ]
+        for future in as_completed(futures):
+            results, stats, worker_telemetry = future.result()
+            report.workers.append(stats)
+            telemetry.merge(worker_telemetry)
+            for result in results:
+                merged[result.item_id] = result
+
+    report.workers.sort(key=lambda stats: stats.worker)
+    report.results = {item_id: merged[item_id] for item_id in item_ids if item_id in merged}
+    report.seconds = time.monotonic() - started
+    print(f"Done — {report.summary()}")
+    print(telemetry.summary())
+    return report
 
 
 # ---------------------------------------------------------------------------
 # HTML persistence
 # ---------------------------------------------------------------------------
 
-def _save_html(item_id: str, html: str, output_dir: Path = OUTPUT_DIR) -> Path:
-    """Save raw HTML to output_dir/{item_id}.html"""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    path = output_dir / f"{item_id}.html"
-    path.write_text(html, encoding="utf-8")
-    return path
+def _save_html(
+    item_id: str, html: str, output_dir: Path = OUTPUT_DIR, validators: Optional[dict] = None
+) -> SavedHtml:
+    """
+    Save raw HTML for an item in the output_dir store.
+
+    Identical HTML is not rewritten; the returned SavedHtml says whether the
+    content changed and where it lives.
+    """
+    return open_store(output_dir).save(item_id, html, validators=validators)
+
+
+def _stored_validators(item_id: str, output_dir: Path = OUTPUT_DIR) -> dict:
+    """ETag / Last-Modified saved with the item's current HTML, if any."""
+    return open_store(output_dir).catalog.validators(item_id)
+
+
+def _record_removed(item_id: str, output_dir: Path = OUTPUT_DIR) -> None:
+    """Note in the catalog that an item is gone, so planning can skip it."""
+    open_store(output_dir).catalog.record_removed(item_id)
 
 
 def html_exists(item_id: str, output_dir: Path = OUTPUT_DIR) -> bool:
-    """Check if a saved HTML file exists for an item."""
-    return (output_dir / f"{item_id}.html").exists()
+    """Check if saved HTML exists for an item."""
+    return open_store(output_dir).exists(item_id)
 
 
 def load_saved_html(item_id: str, output_dir: Path = OUTPUT_DIR) -> Optional[str]:
-    """Load a previously saved HTML file, or None if not found."""
-    path = output_dir / f"{item_id}.html"
-    return path.read_text(encoding="utf-8") if path.exists() else None
+    """Load previously saved HTML, or None if not found."""
+    return open_store(output_dir).load(item_id)
 
 
 def list_saved(output_dir: Path = OUTPUT_DIR) -> list[str]:
-    """List all item IDs that have saved HTML files."""
+    """List all item IDs that have saved HTML."""
     if not output_dir.exists():
         return []
-    return [f.stem for f in output_dir.glob("*.html")]
+    return open_store(output_dir).list_ids()
+
+
+def pending_ids(
+    item_ids: Iterable[str],
+    output_dir: Path = OUTPUT_DIR,
+    max_age_days: Optional[float] = None,
+    include_removed: bool = False,
+) -> list[str]:
+    """
+    Filter item_ids down to those that still need scraping, in one catalog query.
+
+    Args:
+        item_ids:         Candidate item IDs
+        output_dir:       Directory for saved HTML
+        max_age_days:     Also return items last scraped longer ago than this
+        include_removed:  Also return items previously found to be removed
+    """
+    return open_store(output_dir).catalog.pending(item_ids, max_age_days, include_removed)
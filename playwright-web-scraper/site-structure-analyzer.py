@@ -22,18 +22,34 @@ import json
 import os
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 from urllib.parse import urlparse
 
 import anthropic
 from playwright.async_api import async_playwright
 
+from scraper import ConsentMemory, ResourcePolicy, dismiss_consent
+
 
 # ---------------------------------------------------------------------------
 # Page fetching
 # ---------------------------------------------------------------------------
 
-async def fetch_page(url: str, headless: bool = True) -> str:
-    """Fetch a fully-rendered page using Playwright."""
+async def fetch_page(
+    url: str,
+    headless: bool = True,
+    resource_policy: Optional[ResourcePolicy] = None,
+    consent: Optional[ConsentMemory] = None,
+) -> str:
+    """
+    Fetch a fully-rendered page using Playwright.
+
+    Images, fonts, media and trackers are blocked by default — the analyzer
+    only reads the HTML. Pass ResourcePolicy(block_resource_types=[],
+    block_domains=[]) to load everything.
+
+    The cookie-consent button clicked (if any) is recorded in `consent`.
+    """
     async with async_playwright() as p:
         browser = await p.chromium.launch(headless=headless)
         context = await browser.new_context(
@@ -44,21 +60,18 @@ async def fetch_page(url: str, headless: bool = True) -> str:
             ),
             viewport={"width": 1920, "height": 1080},
         )
+        await (resource_policy or ResourcePolicy()).apply(context)
         page = await context.new_page()
 
         print(f"  Loading {url}...")
         await page.goto(url, wait_until="networkidle", timeout=30000)
 
         # Dismiss cookie consent if present
-        for label in ["Accept all", "Accept", "Accept cookies", "OK", "Agree"]:
-            try:
-                btn = page.locator(f'button:has-text("{label}")')
-                if await btn.count() > 0:
-                    await btn.first.click()
-                    await page.wait_for_timeout(500)
-                    break
-            except Exception:
-                pass
+        clicked = await dismiss_consent(page)
+        if clicked:
+            await page.wait_for_timeout(500)
+        if consent is not None:
+            consent.record(urlparse(url).netloc, clicked)
 
         # Scroll to trigger lazy-loaded content
         await page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
@@ -165,7 +178,8 @@ Generate a site profile JSON with this exact structure:
       "description": "<plain English: what this field contains>",
       "selector": "<CSS selector — prefer data attributes and semantic elements>",
       "type": "text|attribute|html",
-      "attribute": "<attribute name, only if type is 'attribute'>"
+      "attribute": "<attribute name, only if type is 'attribute'>",
+      "multiple": <true if the field is a list of values (e.g. every available size), else false>
     }}
   }},
   "scope_mode": "full|selective",
@@ -175,7 +189,8 @@ Generate a site profile JSON with this exact structure:
 Rules:
 - fields must reflect the user's stated capture intent (or all meaningful content if no scope)
 - Prefer stable selectors: data-testid, data-label, semantic HTML over brittle class names
-- Where selectors are uncertain, provide two options separated by a comma
+- Where selectors are uncertain, provide two options separated by a comma (the first that matches is used)
+- For "multiple" fields, the selector must match each individual value element, not their container
 - present_indicators must be visible text strings, not selectors
 - removed_indicators must be valid Python regex patterns
 - scope_mode is "selective" if the user wants specific fields only, "full" if they want everything
@@ -215,7 +230,8 @@ async def analyze(
     print(f"\nSite Structure Analyzer")
     print(f"{'─' * 40}")
 
-    html = await fetch_page(url, headless=headless)
+    consent = ConsentMemory()
+    html = await fetch_page(url, headless=headless, consent=consent)
     print(f"  Fetched {len(html):,} bytes")
 
     scope = read_scope(scope_path)
@@ -227,6 +243,9 @@ async def analyze(
     print(f"  Analyzing with Claude...")
     truncated = truncate_html(html)
     profile = analyze_with_claude(truncated, scope, url)
+    if consent.hosts:
+        # Lets the scraper go straight to the right button on every page
+        profile["consent"] = {host: {"label": label} for host, label in consent.hosts.items()}
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(json.dumps(profile, indent=2, ensure_ascii=False), encoding="utf-8")
@@ -238,6 +257,13 @@ async def analyze(
     print(f"  Fields:      {', '.join(profile.get('fields', {}).keys()) or 'none'}")
     print(f"  Strip:       {len(profile['boilerplate'].get('exclude_selectors', []))} boilerplate selectors")
     print(f"  Mode:        {profile.get('scope_mode', 'full')}")
+    if profile.get("consent"):
+        labels = ", ".join(entry["label"] for entry in profile["consent"].values())
+        print(f"  Consent:     {labels}")
+    else:
+        # One page isn't enough to mark a host as banner-free; the scraper
+        # learns that itself after CONSENT_CONFIRM_PAGES pages
+        print("  Consent:     no banner seen (host left out of the profile)")
     if profile.get("notes"):
         print(f"  Notes:       {profile['notes']}")
     print()
@@ -0,0 +1,270 @@
+"""
+Scrape Telemetry
+
+Per-item phase timings, aggregated into latency histograms, per-host
+throughput and retry counts — enough to tell whether a slow run is the
+site, the waits, or the disk.
+
+Phases timed for every item (seconds, summed over its attempts):
+
+    rate_wait   waiting for the per-host rate limiter / circuit breaker
+    http        HTTP fast-path request and content check
+    acquire     browser context + page from the pool, request blocking set up
+    navigate    page.goto until DOMContentLoaded
+    consent     cookie banner dismissal
+    ready       waiting for content and a quiet DOM
+    scroll      scrolling for lazy content and letting it settle
+    serialize   page.content()
+    extract     in-browser field extraction
+    session     saving a site's storage state (warm sessions)
+    match       visible text + indicator matching
+    save        writing HTML and the catalog
+
+Histograms use fixed log-spaced buckets (10% apart), so memory doesn't grow
+with the number of items and results from several processes can be merged.
+Percentiles are accurate to within a bucket.
+
+Usage:
+    from telemetry import Telemetry
+
+    telemetry = Telemetry(jsonl_path=Path("output/telemetry.jsonl"))
+    results = await scrape_multiple(ids, url_template=..., telemetry=telemetry)
+    print(telemetry.summary())      # also printed by scrape_multiple
+"""
+
+import bisect
+import json
+import math
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import urlparse
+
+PHASES = (
+    "rate_wait", "http", "acquire", "navigate", "consent", "ready",
+    "scroll", "serialize", "extract", "session", "match", "save",
+)
+
+# Upper bounds of the histogram buckets: 1 ms × 1.1^i, up to about 3 hours
+BUCKET_BOUNDS = tuple(0.001 * 1.1 ** i for i in range(160))
+
+
+# ---------------------------------------------------------------------------
+# Per-item timing
+# ---------------------------------------------------------------------------
+
+class ItemTimer:
+    """
+    Collects the phase timings of one item across all of its attempts.
+
+    Usage:
+        timer = ItemTimer("item-123", url)
+        with timer.phase("navigate"):
+            await page.goto(url)
+    """
+
+    def __init__(self, item_id: str, url: str = ""):
+        self.item_id = item_id
+        self.host = urlparse(url).netloc
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.phases: dict[str, float] = {}
+        self.retries: list[str] = []   # error kind of every retried attempt
+        self.attempts = 0
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float) -> None:
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def attempt(self) -> None:
+        self.attempts += 1
+
+    def retry(self, kind: str) -> None:
+        self.retries.append(kind)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the item was first started, deferred retry waits included."""
+        return time.perf_counter() - self.started
+
+
+# ---------------------------------------------------------------------------
+# Aggregation
+# ---------------------------------------------------------------------------
+
+class Histogram:
+    """Latency histogram over BUCKET_BOUNDS."""
+
+    def __init__(self):
+        self.buckets = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.buckets[bisect.bisect_left(BUCKET_BOUNDS, seconds)] += 1
+        self.count += 1
+        self.sum += seconds
+        self.max = max(self.max, seconds)
+
+    def quantile(self, q: float) -> float:
+        """Approximate q-quantile (upper bound of the bucket it falls in)."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q * self.count))
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank:
+                bound = BUCKET_BOUNDS[index] if index < len(BUCKET_BOUNDS) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def merge(self, other: "Histogram") -> None:
+        self.buckets = [a + b for a, b in zip(self.buckets, other.buckets)]
+        self.count += other.count
+        self.sum += other.sum
+        self.max = max(self.max, other.max)
+
+
+@dataclass
+class HostStats:
+    """Throughput and outcomes for one host."""
+    items: int = 0
+    bytes: int = 0
+    statuses: dict[str, int] = field(default_factory=dict)
+    first_started: float = math.inf   # Unix time
+    last_finished: float = 0.0        # Unix time
+
+    @property
+    def rate(self) -> float:
+        """Items per second between the first start and the last finish."""
+        span = self.last_finished - self.first_started
+        return self.items / span if span > 0 else 0.0
+
+    def merge(self, other: "HostStats") -> None:
+        self.items += other.items
+        self.bytes += other.bytes
+        for status, count in other.statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        self.first_started = min(self.first_started, other.first_started)
+        self.last_finished = max(self.last_finished, other.last_finished)
+
+
+class Telemetry:
+    """
+    Aggregates ItemTimers into histograms, per-host stats and retry counts,
+    and optionally appends one JSON line per item to jsonl_path.
+
+    Picklable (the JSONL file is reopened on demand), and merge() combines
+    the telemetry of several worker processes.
+    """
+
+    def __init__(self, jsonl_path: Optional[Path] = None):
+        self.jsonl_path = jsonl_path
+        self.phases: dict[str, Histogram] = {}
+        self.total = Histogram()
+        self.hosts: dict[str, HostStats] = {}
+        self.retries: dict[str, int] = {}
+        self._file = None
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_file"] = None
+        return state
+
+    def record(self, timer: ItemTimer, result) -> None:
+        """Account for one finished item (result is its ScrapeResult)."""
+        elapsed = timer.elapsed
+        self.total.observe(elapsed)
+        for name, seconds in timer.phases.items():
+            self.phases.setdefault(name, Histogram()).observe(seconds)
+        for kind in timer.retries:
+            self.retries[kind] = self.retries.get(kind, 0) + 1
+
+        host = self.hosts.setdefault(timer.host, HostStats())
+        host.items += 1
+        host.bytes += result.bytes
+        host.statuses[result.status] = host.statuses.get(result.status, 0) + 1
+        host.first_started = min(host.first_started, timer.started_at)
+        host.last_finished = max(host.last_finished, timer.started_at + elapsed)
+
+        if self.jsonl_path is not None:
+            self._write({
+                "item_id": timer.item_id,
+                "host": timer.host,
+                "status": result.status,
+                "error_kind": result.error_kind,
+                "tier": result.tier,
+                "attempts": timer.attempts,
+                "retries": timer.retries,
+                "bytes": result.bytes,
+                "elapsed": round(elapsed, 4),
+                "phases": {name: round(seconds, 4) for name, seconds in timer.phases.items()},
+                "started_at": round(timer.started_at, 3),
+            })
+
+    def _write(self, record: dict) -> None:
+        if self._file is None:
+            self.jsonl_path.parent.mkdir(parents=True, exist_ok=True)
+            # Line-buffered, so a crashed run still leaves every finished item on disk
+            self._file = self.jsonl_path.open("a", encoding="utf-8", buffering=1)
+        self._file.write(json.dumps(record) + "\n")
+
+    def close(self) -> None:
+        """Flush and close the JSONL file (reopened if more items are recorded)."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def merge(self, other: "Telemetry") -> None:
+        """Add another Telemetry's aggregates (e.g. from a worker process) to this one."""
+        self.total.merge(other.total)
+        for name, histogram in other.phases.items():
+            self.phases.setdefault(name, Histogram()).merge(histogram)
+        for host, stats in other.hosts.items():
+            self.hosts.setdefault(host, HostStats()).merge(stats)
+        for kind, count in other.retries.items():
+            self.retries[kind] = self.retries.get(kind, 0) + count
+
+    def summary(self) -> str:
+        """Multi-line report: latency per phase, retries and per-host throughput."""
+        lines = [f"Telemetry — {self.total.count:,} items"]
+        lines.append(f"  {'phase':<10} {'items':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'total':>9}")
+        ordered = [name for name in PHASES if name in self.phases]
+        ordered += sorted(name for name in self.phases if name not in PHASES)
+        for name in ordered + ["item"]:
+            histogram = self.total if name == "item" else self.phases[name]
+            lines.append(
+                f"  {name:<10} {histogram.count:>8,} {_seconds(histogram.quantile(0.5)):>8} "
+                f"{_seconds(histogram.quantile(0.95)):>8} {_seconds(histogram.quantile(0.99)):>8} "
+                f"{_seconds(histogram.sum):>9}"
+            )
+        if self.retries:
+            retries = ", ".join(f"{kind} {count:,}" for kind, count in sorted(self.retries.items()))
+            lines.append(f"  Retries: {retries}")
+        for host, stats in sorted(self.hosts.items(), key=lambda item: -item[1].items):
+            statuses = ", ".join(f"{count:,} {status}" for status, count in stats.statuses.items())
+            lines.append(
+                f"  {host or '(no host)'}: {stats.items:,} items, {stats.rate:,.2f}/s, "
+                f"{stats.bytes / (1024 * 1024):,.1f} MB ({statuses})"
+            )
+        return "\n".join(lines)
+
+
+def _seconds(value: float) -> str:
+    """Compact duration: 850ms, 4.2s, 12m."""
+    if value < 1:
+        return f"{value * 1000:.0f}ms"
+    if value < 600:
+        return f"{value:.1f}s"
+    return f"{value / 60:.0f}m"